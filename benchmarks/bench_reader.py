@@ -0,0 +1,232 @@
+"""
+Benchmark suite for the public RRHFOEM04 reader operations.
+
+Every operation runs against the in-process `SimulatedReader`, so the numbers
+measure the library's own overhead (pacing, polling, framing, parsing) on top of
+a configurable device turnaround. Results are printed as a table and can be
+written as JSON for comparison between releases.
+
+Usage:
+    python benchmarks/bench_reader.py --iterations 20 --output bench.json
+    python benchmarks/bench_reader.py --baseline bench.json --tolerance 0.2
+
+With `--baseline`, the script exits with status 1 if any operation's p50
+latency regressed by more than the tolerance (fraction) versus the baseline.
+
+Startup measurements run alongside the operations: `import` (time to
+`import rrhfoem04` in a fresh interpreter), `connect` (constructing a reader,
+which opens the device and waits for its readiness probe) and
+`connect_first_command` (constructing a reader to the end of its first
+inventory, so including the pacing gap after the probe).
+"""
+
+import sys
+sys.path.insert(0, 'src/')
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import time
+from typing import Callable, Dict, List
+
+from rrhfoem04 import RRHFOEM04, SimulatedReader, SimulatedISO15693Tag, SimulatedMifareCard
+
+ISO15693_UID = "E004010012345678"
+MIFARE_UID = "A1B2C3D4"
+
+# Operation name -> callable exercising it once; every call must succeed
+OPERATIONS: Dict[str, Callable[[RRHFOEM04], object]] = {
+    "getReaderInfo": lambda r: r.getReaderInfo(),
+    "ISO15693_singleSlotInventory": lambda r: r.ISO15693_singleSlotInventory(),
+    "ISO15693_16SlotInventory": lambda r: r.ISO15693_16SlotInventory(),
+    "ISO15693_16SlotInventory_afi": lambda r: r.ISO15693_16SlotInventory(afi=0x00),
+    "ISO15693_exhaustiveInventory": lambda r: r.ISO15693_exhaustiveInventory(),
+    "ISO15693_readSingleBlock": lambda r: r.ISO15693_readSingleBlock(1, uid=ISO15693_UID),
+    "ISO15693_writeSingleBlock": lambda r: r.ISO15693_writeSingleBlock(1, "ACC", uid=ISO15693_UID),
+    "ISO15693_readMultipleBlocks": lambda r: r.ISO15693_readMultipleBlocks(0, total_blocks=4, uid=ISO15693_UID),
+    "ISO15693_writeMultipleBlocks": lambda r: r.ISO15693_writeMultipleBlocks(0, "ACC12345", uid=ISO15693_UID),
+    "read_memory": lambda r: r.read_memory(ISO15693_UID, 0, 28),
+    "write_memory_diff": lambda r: r.write_memory_diff(ISO15693_UID, 0, b"ACC12345"),
+    "ISO15693_writeAFI": lambda r: r.ISO15693_writeAFI(7, uid=ISO15693_UID),
+    "ISO15693_getSystemInfo": lambda r: r.ISO15693_getSystemInfo(uid=ISO15693_UID, refresh=True),
+    "ISO14443A_Inventory": lambda r: r.ISO14443A_Inventory(),
+    "ISO14443A_mifareAuthenticate": lambda r: r.ISO14443A_mifareAuthenticate(MIFARE_UID, block_number=4),
+    "ISO14443A_mifareRead": lambda r: r.ISO14443A_mifareRead(MIFARE_UID, block_number=4),
+    "ISO14443A_mifareWrite": lambda r: r.ISO14443A_mifareWrite("KJ000F00#", MIFARE_UID, block_number=4),
+    "dump_card": lambda r: r.dump_card(MIFARE_UID),
+    "restore_card": lambda r: r.restore_card(bytes(1024), MIFARE_UID),
+}
+
+
+# Startup measurements (see run_startup)
+STARTUP = ("import", "connect", "connect_first_command")
+
+IMPORT_SCRIPT = "import time; start = time.perf_counter(); import rrhfoem04; print(time.perf_counter() - start)"
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def make_reader(latency: float, jitter: float, seed: int, pacing: str, response_wait: str) -> RRHFOEM04:
+    device = SimulatedReader(
+        iso15693_tags=[SimulatedISO15693Tag(ISO15693_UID)],
+        mifare_cards=[SimulatedMifareCard(MIFARE_UID)],
+        latency=latency, jitter=jitter, seed=seed)
+    return RRHFOEM04(transport=device, pacing=pacing, response_wait=response_wait)
+
+
+def run_operation(reader: RRHFOEM04, name: str, iterations: int) -> Dict[str, object]:
+    operation = OPERATIONS[name]
+    operation(reader)  # Warm-up; also settles pacing state from the previous operation
+
+    reader._timing['pacing_sleep'] = 0.0
+    reader._timing['device_wait'] = 0.0
+    samples = []
+    failures = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = operation(reader)
+        samples.append(time.perf_counter() - start)
+        if not getattr(result, 'success', False):
+            failures += 1
+    return summarize(samples, failures, reader._timing['pacing_sleep'], reader._timing['device_wait'])
+
+
+def run_startup(name: str, iterations: int, latency: float, jitter: float, seed: int, pacing: str,
+                response_wait: str) -> Dict[str, object]:
+    """Measure a startup cost (see `STARTUP`) over `iterations` fresh runs."""
+    samples = []
+    failures = 0
+    pacing_sleep = device_wait = 0.0
+    for _ in range(iterations):
+        if name == "import":
+            env = {**os.environ, "PYTHONPATH": "src/"}
+            completed = subprocess.run([sys.executable, "-c", IMPORT_SCRIPT], capture_output=True, text=True,
+                                       env=env)
+            if completed.returncode != 0:
+                failures += 1
+                continue
+            samples.append(float(completed.stdout))
+            continue
+
+        start = time.perf_counter()
+        reader = make_reader(latency, jitter, seed, pacing, response_wait)
+        if name == "connect":
+            samples.append(time.perf_counter() - start)
+            failures += reader.reader_info is None
+        else:
+            result = reader.ISO15693_16SlotInventory()
+            samples.append(time.perf_counter() - start)
+            failures += not result.success
+        pacing_sleep += reader._timing['pacing_sleep']
+        device_wait += reader._timing['device_wait']
+        reader.close()
+    return summarize(samples, failures, pacing_sleep, device_wait)
+
+
+def summarize(samples: List[float], failures: int, pacing_sleep: float, device_wait: float) -> Dict[str, object]:
+    """Latency statistics of timed samples, with the pacing and device wait shares of the total."""
+    iterations = len(samples)
+    total = sum(samples)
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "failures": failures,
+        "ops_per_sec": iterations / total if total else 0.0,
+        "mean_ms": total / iterations * 1000 if iterations else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "pacing_sleep_fraction": pacing_sleep / total if total else 0.0,
+        "device_wait_fraction": device_wait / total if total else 0.0,
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    """Return a description of every operation whose p50 regressed beyond `tolerance`."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous and current["p50_ms"] > previous["p50_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p50 {previous['p50_ms']:.2f} ms -> {current['p50_ms']:.2f} ms")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20, help="timed calls per operation")
+    parser.add_argument("--latency", type=float, default=0.005, help="simulated device turnaround (s)")
+    parser.add_argument("--jitter", type=float, default=0.002, help="simulated turnaround jitter (s)")
+    parser.add_argument("--seed", type=int, default=1, help="simulator random seed")
+    parser.add_argument("--pacing", choices=["fixed", "adaptive"], default="fixed", help="reader pacing mode")
+    parser.add_argument("--response-wait", choices=["blocking", "poll"], default="blocking",
+                        help="reader response wait mode")
+    parser.add_argument("--only", nargs="*", choices=sorted(OPERATIONS) + list(STARTUP),
+                        help="run a subset of operations and startup measurements")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p50 regression (fraction)")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = {}
+    for name in STARTUP:
+        if not args.only or name in args.only:
+            results[name] = run_startup(name, args.iterations, args.latency, args.jitter, args.seed, args.pacing,
+                                        args.response_wait)
+
+    reader = make_reader(args.latency, args.jitter, args.seed, args.pacing, args.response_wait)
+    try:
+        for name in args.only or OPERATIONS:
+            if name in OPERATIONS:
+                results[name] = run_operation(reader, name, args.iterations)
+    finally:
+        reader.close()
+
+    print(f"{'operation':32} {'ops/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'pacing':>7} {'device':>7}")
+    for name, r in results.items():
+        print(f"{name:32} {r['ops_per_sec']:8.1f} {r['p50_ms']:8.2f} {r['p95_ms']:8.2f} {r['p99_ms']:8.2f} "
+              f"{r['pacing_sleep_fraction']:7.1%} {r['device_wait_fraction']:7.1%}")
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "seed": args.seed,
+            "pacing": args.pacing,
+            "response_wait": args.response_wait,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f)["results"], args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,16 @@
 """RRHFOEM04 RFID/NFC Reader Interface Library"""
 
+import importlib
+
 from .core import RRHFOEM04
+from .transport import Transport, HidTransport, enumerate_readers
+from .cache import BlockCache
+from .inventory import InventoryEvent, InventoryTracker, ARRIVAL, DEPARTURE, PRESENT
+from .mifare import MifareKeyDictionary
+from .sysinfo import TagInfo, TagInfoRegistry
+from .trace import FrameTrace
+from .metrics import CommandMetrics
+from .hooks import FrameExchange, HOOK_SEND, HOOK_RECEIVE, HOOK_ERROR
 from .exceptions import (
     RRHFOEM04Error,
     ConnectionError,
@@ -13,6 +23,29 @@ from .exceptions import (
 
 __all__ = [
     'RRHFOEM04',
+    'AsyncRRHFOEM04',
+    'ReaderManager',
+    'Transport',
+    'HidTransport',
+    'enumerate_readers',
+    'BlockCache',
+    'InventoryEvent',
+    'InventoryTracker',
+    'ARRIVAL',
+    'DEPARTURE',
+    'PRESENT',
+    'MifareKeyDictionary',
+    'TagInfo',
+    'TagInfoRegistry',
+    'FrameTrace',
+    'CommandMetrics',
+    'FrameExchange',
+    'HOOK_SEND',
+    'HOOK_RECEIVE',
+    'HOOK_ERROR',
+    'SimulatedReader',
+    'SimulatedISO15693Tag',
+    'SimulatedMifareCard',
     'RRHFOEMError',
     'ConnectionError',
     'CommandError',
@@ -20,4 +53,27 @@ __all__ = [
     'ValidationError',
     'TagError',
     'AuthenticationError'
-]
\ No newline at end of file
+]
+
+# Exports loaded on first access, so `import rrhfoem04` does not pull in asyncio,
+# the worker pool or the simulator unless they are used
+_LAZY_EXPORTS = {
+    'AsyncRRHFOEM04': '.aio',
+    'ReaderManager': '.manager',
+    'SimulatedReader': '.simulator',
+    'SimulatedISO15693Tag': '.simulator',
+    'SimulatedMifareCard': '.simulator',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,321 @@
+"""
+asyncio client for the RRHFOEM04 reader.
+
+`AsyncRRHFOEM04` exposes every public `RRHFOEM04` operation as a coroutine.
+Device I/O runs on one dedicated thread per reader, so the event loop is never
+blocked by HID reads, and calls on the same reader are executed one at a time
+in the order they were awaited. The pacing gap before a call and the delays
+around `buzzer_beep` are awaited with `asyncio.sleep` instead of sleeping on
+the I/O thread.
+
+Calls can be cancelled or bounded with `asyncio.timeout`:
+
+    async with AsyncRRHFOEM04(transport=SimulatedReader()) as reader:
+        async with asyncio.timeout(1.0):
+            info = await reader.getReaderInfo()
+
+A command already handed to the device cannot be recalled; if its caller is
+cancelled, the command still completes on the I/O thread and the next call on
+that reader waits for it.
+"""
+
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Optional, Tuple, TypeVar, Union
+
+from .constants import *
+from .core import RRHFOEM04
+from .inventory import InventoryEvent
+from .mifare import MifareKeyDictionary
+from .utils import RRHFOEM04Result
+
+T = TypeVar('T')
+
+# Command category of the first frame each family of operations sends (used for pacing)
+_SYSTEM = CMD_GET_READER_INFO[1]
+_ISO15693 = CMD_ISO15693_READ_SINGLE_BLOCK[1]
+_ISO14443A = CMD_ISO14443A_INVENTORY[1]
+
+
+class AsyncRRHFOEM04:
+    """
+    Awaitable interface to an RRHFOEM04 reader.
+
+    Wraps an `RRHFOEM04` instance whose methods run on a dedicated I/O thread.
+    Constructor arguments other than `auto_connect` are passed to `RRHFOEM04`.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Args:
+            **kwargs: `RRHFOEM04` arguments (`transport`, `pacing`, `block_cache`, ...). The device is
+                opened by `connect()` or `async with`, never in the constructor.
+        """
+        kwargs['auto_connect'] = False
+        self.reader = RRHFOEM04(**kwargs)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rrhfoem04-io")
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def _run(self, category: int, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run `func` on the I/O thread once the pacing gap before a `category` command has passed.
+
+        Args:
+            category: Command category byte of the first frame `func` sends
+            func: Blocking reader method to run
+            *args, **kwargs: Arguments for `func`
+
+        Returns:
+            The return value of `func`
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            delay = self.reader._pacing_delay(category)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def connect(self) -> bool:
+        """Open the device (see `RRHFOEM04._connect`)."""
+        return await self._run(_SYSTEM, self.reader._connect)
+
+    async def close(self) -> None:
+        """Close the device and stop the I/O thread."""
+        try:
+            await self._run(_SYSTEM, self.reader.close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    def stats(self) -> dict:
+        """`RRHFOEM04.stats`; pacing awaited before a call is not included in 'pacing_seconds'."""
+        return self.reader.stats()
+
+    def add_hook(self, event: str, callback) -> None:
+        """`RRHFOEM04.add_hook`; callbacks run on the I/O thread."""
+        self.reader.add_hook(event, callback)
+
+    def remove_hook(self, event: str, callback) -> None:
+        """`RRHFOEM04.remove_hook`."""
+        self.reader.remove_hook(event, callback)
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    # === System commands ===
+
+    async def buzzer_beep(self) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.buzzer_beep`; the delays around the beep are awaited, not slept."""
+        await asyncio.sleep(COMMAND_INTERVAL)
+        result = await self._run(_SYSTEM, self.reader._buzzer_beep_command)
+        if result.success:
+            await asyncio.sleep(COMMAND_INTERVAL)
+        return result
+
+    async def buzzer_on(self) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.buzzer_on`."""
+        return await self._run(_SYSTEM, self.reader.buzzer_on)
+
+    async def buzzer_off(self) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.buzzer_off`."""
+        return await self._run(_SYSTEM, self.reader.buzzer_off)
+
+    async def getReaderInfo(self) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.getReaderInfo`."""
+        return await self._run(_SYSTEM, self.reader.getReaderInfo)
+
+    # === ISO15693 ===
+
+    async def ISO15693_singleSlotInventory(self, afi: Optional[int] = None) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO15693_singleSlotInventory`."""
+        return await self._run(_ISO15693, self.reader.ISO15693_singleSlotInventory, afi)
+
+    async def ISO15693_16SlotInventory(self, afi: Optional[int] = None) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO15693_16SlotInventory`."""
+        return await self._run(_ISO15693, self.reader.ISO15693_16SlotInventory, afi)
+
+    async def ISO15693_select(self, uid: str) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO15693_select`."""
+        return await self._run(_ISO15693, self.reader.ISO15693_select, uid)
+
+    async def ISO15693_stayQuiet(self, uid: str) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO15693_stayQuiet`."""
+        return await self._run(_ISO15693, self.reader.ISO15693_stayQuiet, uid)
+
+    async def ISO15693_resetToReady(self, with_select_flag: bool = False,
+                                    uid: Optional[str] = None) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO15693_resetToReady`."""
+        return await self._run(_ISO15693, self.reader.ISO15693_resetToReady, with_select_flag, uid)
+
+    async def ISO15693_exhaustiveInventory(self, slots: int = 16, reset: bool = True, empty_cycles: int = 1,
+                                           max_cycles: int = EXHAUSTIVE_INVENTORY_MAX_CYCLES,
+                                           afi: Optional[int] = None) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO15693_exhaustiveInventory`."""
+        return await self._run(_ISO15693, self.reader.ISO15693_exhaustiveInventory,
+                               slots, reset, empty_cycles, max_cycles, afi)
+
+    async def ISO15693_readSingleBlock(self, block_number: int, block_size: int = 4, with_select_flag: bool = False,
+                                       uid: str = None) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO15693_readSingleBlock`."""
+        return await self._run(_ISO15693, self.reader.ISO15693_readSingleBlock,
+                               block_number, block_size, with_select_flag, uid)
+
+    async def ISO15693_writeSingleBlock(self, block_number: int, data: str, block_size: int = 4,
+                                        with_select_flag: bool = False, uid: str = None) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO15693_writeSingleBlock`."""
+        return await self._run(_ISO15693, self.reader.ISO15693_writeSingleBlock,
+                               block_number, data, block_size, with_select_flag, uid)
+
+    async def ISO15693_readMultipleBlocks(self, start_block_number: int, total_blocks: int = 5, block_size: int = 4,
+                                          with_select_flag: bool = False, uid: str = None) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO15693_readMultipleBlocks`."""
+        return await self._run(_ISO15693, self.reader.ISO15693_readMultipleBlocks,
+                               start_block_number, total_blocks, block_size, with_select_flag, uid)
+
+    async def ISO15693_writeMultipleBlocks(self, start_block_number: int, data: str, block_size: int = 4,
+                                           with_select_flag: bool = False, uid: str = None) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO15693_writeMultipleBlocks`."""
+        return await self._run(_ISO15693, self.reader.ISO15693_writeMultipleBlocks,
+                               start_block_number, data, block_size, with_select_flag, uid)
+
+    async def ISO15693_writeAFI(self, afi: int, with_select_flag: bool = False, uid: str = None) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO15693_writeAFI`."""
+        return await self._run(_ISO15693, self.reader.ISO15693_writeAFI, afi, with_select_flag, uid)
+
+    async def ISO15693_getSystemInfo(self, with_select_flag: bool = False, uid: Optional[str] = None,
+                                     refresh: bool = False) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO15693_getSystemInfo`."""
+        return await self._run(_ISO15693, self.reader.ISO15693_getSystemInfo, with_select_flag, uid, refresh)
+
+    async def iter_memory(self, uid: Optional[str], start: int = 0, end: Optional[int] = None,
+                          block_size: Optional[int] = None, with_select_flag: bool = False,
+                          chunk_blocks: Optional[int] = None) -> AsyncIterator[Tuple[int, memoryview]]:
+        """Async generator version of `RRHFOEM04.iter_memory`; each chunk is read on the I/O thread."""
+        chunks = self.reader.iter_memory(uid, start, end, block_size, with_select_flag, chunk_blocks)
+        try:
+            while True:
+                chunk = await self._run(_ISO15693, next, chunks, None)
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            # Close on the I/O thread, after any read still in flight there
+            try:
+                self._executor.submit(chunks.close)
+            except RuntimeError:
+                pass  # Executor already shut down
+
+    async def read_memory(self, uid: Optional[str], start: int = 0, end: Optional[int] = None,
+                          block_size: Optional[int] = None, out: Optional[Union[bytearray, memoryview]] = None,
+                          with_select_flag: bool = False, chunk_blocks: Optional[int] = None) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.read_memory`."""
+        return await self._run(_ISO15693, self.reader.read_memory,
+                               uid, start, end, block_size, out, with_select_flag, chunk_blocks)
+
+    async def write_memory_diff(self, uid: Optional[str], start: int, data: Union[bytes, bytearray, memoryview],
+                                block_size: Optional[int] = None, with_select_flag: bool = False,
+                                verify: bool = True, chunk_blocks: Optional[int] = None) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.write_memory_diff`."""
+        return await self._run(_ISO15693, self.reader.write_memory_diff,
+                               uid, start, data, block_size, with_select_flag, verify, chunk_blocks)
+
+    async def iter_card(self, uid: Optional[str] = None, card_type: str = "1K") -> AsyncIterator[Tuple[int, bytes]]:
+        """Async generator version of `RRHFOEM04.iter_card`; each sector is read on the I/O thread."""
+        sectors = self.reader.iter_card(uid, card_type)
+        try:
+            while True:
+                sector = await self._run(_ISO14443A, next, sectors, None)
+                if sector is None:
+                    return
+                yield sector
+        finally:
+            # Close on the I/O thread, after any read still in flight there
+            try:
+                self._executor.submit(sectors.close)
+            except RuntimeError:
+                pass  # Executor already shut down
+
+    async def dump_card(self, uid: Optional[str] = None, card_type: str = "1K",
+                        out: Optional[Union[bytearray, memoryview]] = None) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.dump_card`."""
+        return await self._run(_ISO14443A, self.reader.dump_card, uid, card_type, out)
+
+    async def restore_card(self, image: Union[bytes, bytearray, memoryview], uid: Optional[str] = None,
+                           write_trailers: bool = False, write_manufacturer_block: bool = False) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.restore_card`."""
+        return await self._run(_ISO14443A, self.reader.restore_card,
+                               image, uid, write_trailers, write_manufacturer_block)
+
+    async def stream_inventory(self, **kwargs) -> AsyncIterator[InventoryEvent]:
+        """Async generator version of `RRHFOEM04.stream_inventory`; each cycle runs on the I/O thread."""
+        events = self.reader.stream_inventory(**kwargs)
+        try:
+            while True:
+                event = await self._run(_ISO15693, next, events, None)
+                if event is None:
+                    return
+                yield event
+        finally:
+            # Close on the I/O thread, after any cycle still in flight there
+            try:
+                self._executor.submit(events.close)
+            except RuntimeError:
+                pass  # Executor already shut down
+
+    async def watch_inventory(self, callback: Callable[[InventoryEvent], object], **kwargs) -> None:
+        """
+        Awaitable `RRHFOEM04.watch_inventory`.
+
+        Cycles run on the I/O thread as in `stream_inventory()`; `callback` runs on
+        the event loop and may be a coroutine function. Returns when the stream ends
+        or the callback returns (or resolves to) False.
+        """
+        events = self.stream_inventory(**kwargs)
+        try:
+            async for event in events:
+                result = callback(event)
+                if inspect.isawaitable(result):
+                    result = await result
+                if result is False:
+                    return
+        finally:
+            await events.aclose()
+
+    # === ISO14443A ===
+
+    async def ISO14443A_Inventory(self) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO14443A_Inventory`."""
+        return await self._run(_ISO14443A, self.reader.ISO14443A_Inventory)
+
+    async def ISO14443A_selectCard(self, uid: str, uid_length: int = 4) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO14443A_selectCard`."""
+        return await self._run(_ISO14443A, self.reader.ISO14443A_selectCard, uid, uid_length)
+
+    async def ISO14443A_mifareAuthenticate(self, uid: str, block_number: int, key_type: str = 'A',
+                                           key: str = "FFFFFFFFFFFF") -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO14443A_mifareAuthenticate` (raises the same exceptions)."""
+        return await self._run(_ISO14443A, self.reader.ISO14443A_mifareAuthenticate,
+                               uid, block_number, key_type, key)
+
+    async def ISO14443A_mifareAuthenticateWithKeys(self, uid: str, block_number: int,
+                                                   keys: Optional[MifareKeyDictionary] = None,
+                                                   card_type: Optional[str] = None) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO14443A_mifareAuthenticateWithKeys` (raises the same exceptions)."""
+        return await self._run(_ISO14443A, self.reader.ISO14443A_mifareAuthenticateWithKeys,
+                               uid, block_number, keys, card_type)
+
+    async def ISO14443A_mifareRead(self, uid: Optional[str] = None, block_number: int = 0) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO14443A_mifareRead`."""
+        return await self._run(_ISO14443A, self.reader.ISO14443A_mifareRead, uid, block_number)
+
+    async def ISO14443A_mifareWrite(self, data: str, uid: Optional[str] = None,
+                                    block_number: int = 1) -> RRHFOEM04Result:
+        """Awaitable `RRHFOEM04.ISO14443A_mifareWrite`."""
+        return await self._run(_ISO14443A, self.reader.ISO14443A_mifareWrite, data, uid, block_number)
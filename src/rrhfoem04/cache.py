@@ -0,0 +1,109 @@
+"""
+Read-through tag memory cache for the RRHFOEM04 reader.
+
+`BlockCache` stores block contents keyed by (UID, block number). Entries
+expire after `ttl` seconds and the least recently used entry is evicted once
+`max_entries` is reached. The reader consults the cache before addressed
+block reads and keeps it up to date on writes (write-through); a failed write
+invalidates the blocks it touched, since their contents are then unknown.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from .constants import BLOCK_CACHE_MAX_ENTRIES, BLOCK_CACHE_TTL
+
+
+class BlockCache:
+    """Bounded LRU cache of tag blocks with a per-entry time to live."""
+
+    def __init__(self, max_entries: int = BLOCK_CACHE_MAX_ENTRIES, ttl: Optional[float] = BLOCK_CACHE_TTL):
+        """
+        Args:
+            max_entries: Maximum number of cached blocks before the least recently used one is evicted
+            ttl: Seconds an entry stays valid after it was stored, or None to never expire
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        # (UID, block) -> (stored at, data), oldest use first
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, bytes]]" = OrderedDict()
+
+    def get(self, uid: str, block: int, size: Optional[int] = None) -> Optional[bytes]:
+        """
+        Return the cached contents of a block, or None on a miss.
+
+        Args:
+            uid: Tag UID (hex string, display order)
+            block: Block number
+            size: Expected block size; an entry of another size counts as a miss
+        """
+        key = (uid.upper(), block)
+        entry = self._entries.get(key)
+        if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+            del self._entries[key]
+            self.expirations += 1
+            entry = None
+        if entry is None or (size is not None and len(entry[1]) != size):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, uid: str, block: int, data: bytes) -> None:
+        """Store the contents of a block, evicting the least recently used entry if full."""
+        key = (uid.upper(), block)
+        self._entries[key] = (time.monotonic(), bytes(data))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def put_blocks(self, uid: str, start: int, data: bytes, block_size: int) -> None:
+        """Store consecutive blocks starting at `start` from one buffer."""
+        for i in range(0, len(data) - block_size + 1, block_size):
+            self.put(uid, start + i // block_size, data[i:i + block_size])
+
+    def invalidate(self, uid: Optional[str] = None, block: Optional[int] = None, count: int = 1) -> None:
+        """
+        Drop cached blocks.
+
+        Args:
+            uid: Tag whose blocks to drop; None drops every entry
+            block: First block to drop; None drops every block of `uid`
+            count: Number of consecutive blocks to drop from `block`
+        """
+        if uid is None:
+            self._entries.clear()
+        elif block is None:
+            uid = uid.upper()
+            for key in [key for key in self._entries if key[0] == uid]:
+                del self._entries[key]
+        else:
+            for b in range(block, block + count):
+                self._entries.pop((uid.upper(), b), None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit/miss/eviction/expiration counters and the current number of entries."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'entries': len(self._entries),
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
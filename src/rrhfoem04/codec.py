@@ -0,0 +1,226 @@
+"""
+Precompiled command frames and raw response access for the RRHFOEM04 reader.
+
+Every `CMD_*` header from `constants.py` is registered in `COMMAND_TABLE`.
+Commands without parameters are compiled once at import into ready-to-send
+65-byte HID reports (report ID, frame, CRC, zero padding). Parameterized
+commands get a preallocated `bytearray` per `CommandCodec` instance with the
+header already in place; `CommandCodec.build()` writes the parameters, the
+length byte and the CRC into it without allocating a new list or buffer.
+
+Responses are wrapped in `RawResponse`, which keeps the report as `bytes` and
+exposes the frame fields through typed accessors; hex formatting is left to
+the public API methods.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Union
+
+from .constants import *
+from .exceptions import ValidationError
+from .utils import calc_crc
+
+# HID report ID (0x00) followed by one 64-byte report
+REPORT_SIZE = BUFFER_SIZE + 1
+
+# Command name -> (header bytes, takes parameters)
+COMMAND_TABLE = {
+    'GET_READER_INFO': (CMD_GET_READER_INFO, False),
+    'BUZZER_BEEP': (CMD_BUZZER_BEEP, False),
+    'BUZZER_ON': (CMD_BUZZER_ON, False),
+    'BUZZER_OFF': (CMD_BUZZER_OFF, False),
+    'ADDITIONAL_FRAME': (CMD_ADDITIONAL_FRAME, False),
+    'ISO15693_SINGLE_SLOT_INVENTORY': (CMD_ISO15693_SINGLE_SLOT_INVENTORY, False),
+    'ISO15693_16_SLOT_INVENTORY': (CMD_ISO15693_16_SLOT_INVENTORY, False),
+    'ISO15693_SINGLE_SLOT_INVENTORY_WITH_AFI': (CMD_ISO15693_SINGLE_SLOT_INVENTORY_WITH_AFI, True),
+    'ISO15693_16_SLOT_INVENTORY_WITH_AFI': (CMD_ISO15693_16_SLOT_INVENTORY_WITH_AFI, True),
+    'ISO15693_SELECT': (CMD_ISO15693_SELECT, True),
+    'ISO15693_STAY_QUIET': (CMD_ISO15693_STAY_QUIET, True),
+    'ISO15693_RESET_TO_READY': (CMD_ISO15693_RESET_TO_READY, True),
+    'ISO15693_RESET_TO_READY_WITH_SELECT_FLAG': (CMD_ISO15693_RESET_TO_READY_WITH_SELECT_FLAG, True),
+    'ISO15693_RESET_TO_READY_WITH_ADDRESS_FLAG': (CMD_ISO15693_RESET_TO_READY_WITH_ADDRESS_FLAG, True),
+    'ISO15693_READ_SINGLE_BLOCK': (CMD_ISO15693_READ_SINGLE_BLOCK, True),
+    'ISO15693_READ_SINGLE_BLOCK_WITH_SELECT_FLAG': (CMD_ISO15693_READ_SINGLE_BLOCK_WITH_SELECT_FLAG, True),
+    'ISO15693_READ_SINGLE_BLOCK_WITH_ADDRESS_FLAG': (CMD_ISO15693_READ_SINGLE_BLOCK_WITH_ADDRESS_FLAG, True),
+    'ISO15693_WRITE_SINGLE_BLOCK': (CMD_ISO15693_WRITE_SINGLE_BLOCK, True),
+    'ISO15693_WRITE_SINGLE_BLOCK_WITH_SELECT_FLAG': (CMD_ISO15693_WRITE_SINGLE_BLOCK_WITH_SELECT_FLAG, True),
+    'ISO15693_WRITE_SINGLE_BLOCK_WITH_ADDRESS_FLAG': (CMD_ISO15693_WRITE_SINGLE_BLOCK_WITH_ADDRESS_FLAG, True),
+    'ISO15693_READ_MULTIPLE_BLOCKS': (CMD_ISO15693_READ_MULTIPLE_BLOCKS, True),
+    'ISO15693_READ_MULTIPLE_BLOCKS_WITH_SELECT_FLAG': (CMD_ISO15693_READ_MULTIPLE_BLOCKS_WITH_SELECT_FLAG, True),
+    'ISO15693_READ_MULTIPLE_BLOCKS_WITH_ADDRESS_FLAG': (CMD_ISO15693_READ_MULTIPLE_BLOCKS_WITH_ADDRESS_FLAG, True),
+    'ISO15693_WRITE_MULTIPLE_BLOCK': (CMD_ISO15693_WRITE_MULTIPLE_BLOCK, True),
+    'ISO15693_WRITE_MULTIPLE_BLOCK_WITH_SELECT_FLAG': (CMD_ISO15693_WRITE_MULTIPLE_BLOCK_WITH_SELECT_FLAG, True),
+    'ISO15693_WRITE_MULTIPLE_BLOCK_WITH_ADDRESS_FLAG': (CMD_ISO15693_WRITE_MULTIPLE_BLOCK_WITH_ADDRESS_FLAG, True),
+    'ISO15693_WRITE_AFI': (CMD_ISO15693_WRITE_AFI, True),
+    'ISO15693_WRITE_AFI_WITH_SELECT_FLAG': (CMD_ISO15693_WRITE_AFI_WITH_SELECT_FLAG, True),
+    'ISO15693_WRITE_AFI_WITH_ADDRESS_FLAG': (CMD_ISO15693_WRITE_AFI_WITH_ADDRESS_FLAG, True),
+    'ISO15693_GET_SYSTEM_INFO': (CMD_ISO15693_GET_SYSTEM_INFO, True),
+    'ISO15693_GET_SYSTEM_INFO_WITH_SELECT_FLAG': (CMD_ISO15693_GET_SYSTEM_INFO_WITH_SELECT_FLAG, True),
+    'ISO15693_GET_SYSTEM_INFO_WITH_ADDRESS_FLAG': (CMD_ISO15693_GET_SYSTEM_INFO_WITH_ADDRESS_FLAG, True),
+    'ISO14443A_INVENTORY': (CMD_ISO14443A_INVENTORY, False),
+    'ISO14443A_SELECT_CARD': (CMD_ISO14443A_SELECT_CARD, True),
+    'ISO14443A_MIFARE_AUTHENTICATE': (CMD_ISO14443A_MIFARE_AUTHENTICATE, True),
+    'ISO14443A_MIFARE_READ': (CMD_ISO14443A_MIFARE_READ, True),
+    'ISO14443A_MIFARE_WRITE': (CMD_ISO14443A_MIFARE_WRITE, True),
+}
+
+
+def encode_frame(cmd_data: Sequence[int]) -> bytes:
+    """
+    Encode a complete command (length byte included, CRC excluded) into a HID report.
+
+    Args:
+        cmd_data: Command bytes, e.g. a `CMD_*` list with its parameters appended
+
+    Returns:
+        bytes: 65-byte report: 0x00 report ID, command, CRC (MSB first), zero padding
+
+    Raises:
+        ValidationError: If the command does not fit in one report
+    """
+    if len(cmd_data) + 3 > REPORT_SIZE:
+        raise ValidationError(f"Command of {len(cmd_data)} bytes does not fit in one report")
+    crc = calc_crc(cmd_data)
+    return bytes([0x00, *cmd_data, crc >> 8, crc & 0xFF]).ljust(REPORT_SIZE, b'\x00')
+
+
+@lru_cache(maxsize=256)
+def uid_to_le(uid: str) -> bytes:
+    """Convert a display-order hex UID (as returned by inventory) to the little-endian bytes sent in frames."""
+    return bytes.fromhex(uid)[::-1]
+
+
+# Parameterless commands, compiled once
+_FIXED_FRAMES: Dict[str, bytes] = {
+    name: encode_frame(header) for name, (header, parameterized) in COMMAND_TABLE.items() if not parameterized
+}
+
+
+class CommandCodec:
+    """
+    Per-reader frame builder backed by `COMMAND_TABLE`.
+
+    Each instance owns its own preallocated buffers, so readers driven from
+    different threads never share a buffer. A buffer returned by `build()` is
+    only valid until the next `build()` of the same command.
+    """
+
+    def __init__(self):
+        self._buffers: Dict[str, bytearray] = {}
+        self._header_sizes: Dict[str, int] = {}
+        self._ends: Dict[str, int] = {}
+        for name, (header, parameterized) in COMMAND_TABLE.items():
+            if parameterized:
+                buffer = bytearray(REPORT_SIZE)
+                buffer[1:1 + len(header)] = bytes(header)
+                self._buffers[name] = buffer
+                self._header_sizes[name] = 1 + len(header)
+                self._ends[name] = REPORT_SIZE
+
+    def frame(self, name: str) -> bytes:
+        """Return the precompiled report of a parameterless command."""
+        return _FIXED_FRAMES[name]
+
+    def build(self, name: str, *fields: Union[int, bytes, bytearray, memoryview]) -> bytearray:
+        """
+        Fill the preallocated report of a parameterized command.
+
+        The length byte is derived from the fields, so callers never adjust it by hand.
+
+        Args:
+            name: Command name from `COMMAND_TABLE`
+            *fields: Parameters in frame order; ints are single bytes, bytes-like values are copied as-is
+
+        Returns:
+            bytearray: The command's report buffer, ready to write
+
+        Raises:
+            ValidationError: If the parameters do not fit in one report
+        """
+        buffer = self._buffers[name]
+        pos = self._header_sizes[name]
+        try:
+            for field in fields:
+                if isinstance(field, int):
+                    buffer[pos] = field
+                    pos += 1
+                else:
+                    end = pos + len(field)
+                    if end > REPORT_SIZE:
+                        raise IndexError
+                    buffer[pos:end] = field
+                    pos = end
+        except IndexError:
+            raise ValidationError(f"{name} parameters do not fit in one report")
+        if pos + 2 > REPORT_SIZE:
+            raise ValidationError(f"{name} parameters do not fit in one report")
+
+        buffer[1] = pos - 1  # Frame length excludes the report ID and CRC
+        with memoryview(buffer) as view:
+            crc = calc_crc(view[1:pos])
+        buffer[pos] = crc >> 8
+        buffer[pos + 1] = crc & 0xFF
+
+        # Clear what is left of a previous, longer frame
+        end = pos + 2
+        previous_end = self._ends[name]
+        if previous_end > end:
+            buffer[end:previous_end] = bytes(previous_end - end)
+        self._ends[name] = end
+        return buffer
+
+
+class RawResponse:
+    """
+    Response frame backed by the `bytes` read from the device.
+
+    Frame layout: [length][command code (2)][error code (2)][payload...][CRC (2)],
+    where `length` counts every byte before the CRC.
+    """
+
+    __slots__ = ('raw', 'elapsed')
+
+    def __init__(self, raw: bytes, elapsed: Optional[float] = None):
+        """
+        Args:
+            raw: Response bytes as read from the transport (trailing padding allowed)
+            elapsed: Seconds from writing the command to the complete response
+        """
+        self.raw = raw
+        self.elapsed = elapsed
+
+    @property
+    def length(self) -> int:
+        """Frame length byte (bytes before the CRC)."""
+        return self.raw[0]
+
+    @property
+    def command(self) -> int:
+        """16-bit command code echoed by the reader."""
+        return (self.raw[1] << 8) | self.raw[2]
+
+    @property
+    def status(self) -> int:
+        """16-bit error code (0x0000 on success)."""
+        return (self.raw[3] << 8) | self.raw[4]
+
+    @property
+    def ok(self) -> bool:
+        """True if the reader reported success."""
+        return self.raw[3] == 0 and self.raw[4] == 0
+
+    @property
+    def payload(self) -> memoryview:
+        """Zero-copy view of the response data between the error code and the CRC."""
+        return memoryview(self.raw)[5:self.raw[0]]
+
+    def __bytes__(self) -> bytes:
+        return self.raw
+
+    def __repr__(self) -> str:
+        return f"RawResponse(command={self.command:04X}, status={self.status:04X}, payload={self.payload.hex().upper()})"
+
+
+def status_text(response: Optional[RawResponse]) -> str:
+    """Describe a response status for log and error messages."""
+    return "no response" if response is None else f"{response.status:04X}"
@@ -16,6 +16,8 @@ PRODUCT_ID = 0x0C10  # Specific product ID for RRHFOEM04 model
 # These define the basic parameters for USB HID communication with the device
 BUFFER_SIZE = 64     # Standard USB HID report size in bytes
 DEFAULT_TIMEOUT = 0.5  # Default timeout for commands in seconds
+MAX_FRAME_LENGTH = 0xFF  # Largest frame the one-byte length field can describe (spans several reports)
+ADDITIONAL_FRAME_WAIT = 0.05  # Wait for a continuation report before requesting it with Additional Frame (seconds)
 
 # Command Structure Format:
 # Each command is a list of bytes with the following structure:
@@ -30,11 +32,21 @@ CMD_GET_READER_INFO = [0x03, 0xF0, 0x00]    # Get reader model and serial number
 CMD_BUZZER_BEEP = [0x03, 0xF0, 0x01]        # Activate reader's buzzer
 CMD_BUZZER_ON = [0x03, 0xF0, 0x16]          # Turn on reader's buzzer
 CMD_BUZZER_OFF = [0x03, 0xF0, 0x15]         # Turn off reader's buzzer
+CMD_ADDITIONAL_FRAME = [0x03, 0xF0, 0x02]   # Request the next report of a multi-report response (USB only)
 
 # ISO15693 Commands (Category 0x10)
 # Inventory Commands - Used to detect tags in the field
 CMD_ISO15693_SINGLE_SLOT_INVENTORY = [0x04, 0x10, 0x01, 0x26]  # Single slot anti-collision
 CMD_ISO15693_16_SLOT_INVENTORY = [0x04, 0x10, 0x02, 0x06]      # 16-slot anti-collision
+CMD_ISO15693_SINGLE_SLOT_INVENTORY_WITH_AFI = [0x05, 0x10, 0x01, 0x36]  # Single slot, AFI byte follows
+CMD_ISO15693_16_SLOT_INVENTORY_WITH_AFI = [0x05, 0x10, 0x02, 0x16]      # 16-slot, AFI byte follows
+
+# ISO15693 state commands - Select and Stay Quiet always address a tag by UID
+CMD_ISO15693_SELECT = [0x0C, 0x10, 0x03, 0x22]                          # Put a tag in the selected state
+CMD_ISO15693_STAY_QUIET = [0x0C, 0x10, 0x04, 0x22]                      # Stop a tag answering inventories
+CMD_ISO15693_RESET_TO_READY = [0x04, 0x10, 0x05, 0x02]                  # Return any tag to the ready state
+CMD_ISO15693_RESET_TO_READY_WITH_SELECT_FLAG = [0x04, 0x10, 0x05, 0x12]   # Return the selected tag
+CMD_ISO15693_RESET_TO_READY_WITH_ADDRESS_FLAG = [0x0C, 0x10, 0x05, 0x22]  # Return a specific (e.g. quiet) tag
 
 # ISO15693 Read Commands
 # Flag values: 0x02=No flags, 0x12=Select flag, 0x22=Address flag
@@ -63,6 +75,11 @@ CMD_ISO15693_WRITE_AFI = [0x05, 0x10, 0x0A, 0x02]                    # Write to
 CMD_ISO15693_WRITE_AFI_WITH_SELECT_FLAG = [0x05, 0x10, 0x0A, 0x12]   # Write to selected tag
 CMD_ISO15693_WRITE_AFI_WITH_ADDRESS_FLAG = [0x0D, 0x10, 0x0A, 0x22]  # Write to specific tag
 
+# ISO15693 Get System Information (UID, DSFID, AFI, memory size, IC reference)
+CMD_ISO15693_GET_SYSTEM_INFO = [0x04, 0x10, 0x0E, 0x02]                    # Any tag
+CMD_ISO15693_GET_SYSTEM_INFO_WITH_SELECT_FLAG = [0x04, 0x10, 0x0E, 0x12]   # Selected tag
+CMD_ISO15693_GET_SYSTEM_INFO_WITH_ADDRESS_FLAG = [0x0C, 0x10, 0x0E, 0x22]  # Specific tag
+
 # ISO14443A Commands (Category 0x2F)
 CMD_ISO14443A_INVENTORY = [0x03, 0x2F, 0x01]     # Detect ISO14443A tags
 CMD_ISO14443A_SELECT_CARD = [0x08, 0x2F, 0x02]   # Select specific card for operations
@@ -81,6 +98,34 @@ COMMAND_INTERVAL = 0.1  # Minimum time between commands (seconds)
 RETRY_DELAY = 0.02      # Delay between retry attempts (seconds)
 MAX_RETRIES = 3         # Maximum number of retry attempts
 
+# Readiness probe on connect (see RRHFOEM04._wait_ready)
+CONNECT_PROBE_TIMEOUT = DEFAULT_TIMEOUT  # Response wait of each Get Reader Information probe (seconds)
+CONNECT_READY_TIMEOUT = 1.0   # Probing stops after this long; the reader is then used unprobed (seconds)
+
+# Adaptive pacing parameters (see pacing.AdaptivePacer)
+ADAPTIVE_MIN_INTERVAL = 0.005   # Smallest gap adaptive pacing will tighten to (seconds)
+ADAPTIVE_TIGHTEN_FACTOR = 0.75  # Gap multiplier after a streak of clean responses
+ADAPTIVE_BACKOFF_FACTOR = 2.0   # Gap multiplier after a timeout or error status
+ADAPTIVE_CLEAN_STREAK = 3       # Clean responses required before tightening
+
 # Block size constants
 DEFAULT_BLOCK_SIZE = 4  # Standard block size for ISO15693 tags
-MIFARE_BLOCK_SIZE = 16  # Block size for Mifare Classic cards
\ No newline at end of file
+MIFARE_BLOCK_SIZE = 16  # Block size for Mifare Classic cards
+# Block cache defaults (see cache.BlockCache)
+BLOCK_CACHE_MAX_ENTRIES = 1024  # Cached blocks before least recently used eviction
+BLOCK_CACHE_TTL = 5.0           # Seconds a cached block stays valid
+
+# Exhaustive inventory (see RRHFOEM04.ISO15693_exhaustiveInventory)
+EXHAUSTIVE_INVENTORY_MAX_CYCLES = 32  # Inventory cycles before giving up on an ever-answering field
+
+# Tag information registry (see sysinfo.TagInfoRegistry)
+TAG_INFO_MAX_ENTRIES = 4096  # Tags remembered before least recently used eviction
+
+# Frame trace (see trace.FrameTrace)
+FRAME_TRACE_CAPACITY = 256  # Frames kept before the oldest is overwritten
+
+# Command metrics (see metrics.CommandMetrics)
+METRICS_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)  # Device wait bounds (s)
+
+# Continuous inventory (see inventory.InventoryTracker)
+INVENTORY_DEBOUNCE = 2  # Consecutive missed cycles before a tag is reported as departed
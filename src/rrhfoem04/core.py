@@ -8,24 +8,28 @@ follows the manufacturer's protocol specification while adding robust error hand
 and timing controls for reliable communication.
 """
 
+import functools
 import time
-from typing import List, Optional
-import hid  # Hardware Interface Device library for USB communication
-import re
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 import logging
 
 from .constants import *
 from .exceptions import *
-from .utils import RRHFOEM04Result
-
-# Configure logging: default to console only; file logging can be enabled per instance
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler()
-    ]
-)
+from .transport import Transport, HidTransport
+from .pacing import FixedPacer, AdaptivePacer
+from .cache import BlockCache
+from .trace import FrameTrace, RX, TX
+from .hooks import FrameExchange, HOOK_ERROR, HOOK_EVENTS, HOOK_RECEIVE, HOOK_SEND
+from .metrics import CommandMetrics, OUTCOME_ERROR, OUTCOME_FAILURE, OUTCOME_OK, OUTCOME_TIMEOUT
+from .sysinfo import TagInfo, TagInfoRegistry, parse_system_info
+from .inventory import InventoryEvent, InventoryTracker
+from .mifare import (MIFARE_CARD_BLOCKS, MifareKeyDictionary, is_trailer, sector_block_count, sector_count,
+                     sector_first_block, sector_of)
+from .codec import CommandCodec, RawResponse, encode_frame, status_text, uid_to_le
+from .utils import RRHFOEM04Result, calc_crc, verify_crc
+
+# Logging is left to the application (e.g. `logging.basicConfig()`); nothing is configured at import.
+# Messages use lazy %-formatting, so disabled levels cost no string building.
 
 class RRHFOEM04:
     """
@@ -36,13 +40,41 @@ class RRHFOEM04:
     implementing proper timing controls and error handling for reliable operation.
     """
 
-    def __init__(self, auto_connect: bool = True, log_to_file: bool = False, log_file_name: str = "rrhfoem04.log"):
+    def __init__(self, auto_connect: bool = True, log_to_file: bool = False, log_file_name: str = "rrhfoem04.log",
+                 transport: Optional[Transport] = None, pacing: Union[str, FixedPacer, AdaptivePacer] = "fixed",
+                 response_wait: str = "blocking", validate_crc: bool = False, raw_results: bool = False,
+                 block_cache: Optional[BlockCache] = None, mifare_keys: Optional[MifareKeyDictionary] = None,
+                 tag_registry: Optional[TagInfoRegistry] = None, frame_trace: Optional[FrameTrace] = None,
+                 metrics: Union[bool, CommandMetrics] = True):
         """
         Initializes the RRHFOEM04 reader interface.
         Args:
             auto_connect (bool): If True, automatically attempts to connect to the device during initialization. Defaults to True.
             log_to_file (bool): If True, enables logging to a file for this instance. Defaults to False.
             log_file_name (str): The name of the log file if file logging is enabled. Defaults to "rrhfoem04.log".
+            transport (Transport): Transport used to reach the reader. Defaults to a `HidTransport` for the first
+                attached RRHFOEM04; pass a `SimulatedReader` to run without hardware.
+            pacing (str | pacer): Gap enforcement between commands. "fixed" keeps the conservative
+                `COMMAND_INTERVAL`; "adaptive" learns the shortest safe gap per command category.
+                A `FixedPacer` or `AdaptivePacer` instance may be passed for custom tuning. Defaults to "fixed".
+            response_wait (str): How to wait for responses. "blocking" uses timed blocking reads that return as
+                soon as the response arrives; "poll" keeps the legacy non-blocking poll with `RETRY_DELAY` sleeps.
+                Defaults to "blocking".
+            validate_crc (bool): If True, the CRC of every response frame is checked and a mismatch raises
+                `CommunicationError`. Defaults to False.
+            raw_results (bool): If True, block and UID data in results are returned as `bytes` instead of
+                uppercase hex strings (same byte order). Defaults to False.
+            block_cache (BlockCache): Optional read-through cache for addressed ISO15693 block reads and
+                Mifare block reads, kept up to date by writes. Defaults to None (no caching).
+            mifare_keys (MifareKeyDictionary): Keys tried when `ISO14443A_mifareRead`/`ISO14443A_mifareWrite`
+                authenticate a sector. Defaults to None (key A FFFFFFFFFFFF only).
+            tag_registry (TagInfoRegistry): Registry of ISO15693 system information used to size memory
+                operations. Defaults to a new registry; pass a shared one to reuse it across readers.
+            frame_trace (FrameTrace): Ring buffer recording every frame sent and received, for
+                post-mortem dumps. Defaults to None (no tracing).
+            metrics (bool | CommandMetrics): Per-command latency and outcome metrics (see `stats()`). True
+                creates a `CommandMetrics` for this reader; pass an instance to choose the histogram buckets,
+                or False to disable. Defaults to True.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         # Optionally enable file logging per instance
@@ -51,12 +83,42 @@ class RRHFOEM04:
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
             self.logger.addHandler(file_handler)
+            self.logger.setLevel(logging.DEBUG)
         self.logger.debug("Initializing RRHFOEM04 interface")
-        self.device: Optional[hid.device] = None
+        self.device: Optional[Transport] = None
+        self._transport = transport
         self._last_command_time = 0  # Tracks timing between commands
+        self._codec = CommandCodec()  # Precompiled command frames
+        if response_wait not in ("blocking", "poll"):
+            raise ValueError("response_wait must be 'blocking' or 'poll'")
+        self._response_wait = response_wait
+        self._validate_crc = validate_crc
+        self._raw_results = raw_results
+        self.block_cache = block_cache
+        self.mifare_keys = mifare_keys
+        self.tag_registry = tag_registry if tag_registry is not None else TagInfoRegistry()
+        self.frame_trace = frame_trace
+        if metrics is True:
+            metrics = CommandMetrics()
+        self.metrics: Optional[CommandMetrics] = metrics or None
+        self._frame_requests = 0  # Additional Frame requests sent for the current command
+        self._first_report_time: Optional[float] = None  # perf_counter() when its first response report arrived
+        self._hooks: Dict[str, List[Callable[[FrameExchange], None]]] = {}  # Event -> callbacks (see add_hook)
+        if pacing == "fixed":
+            self._pacer = FixedPacer()
+        elif pacing == "adaptive":
+            self._pacer = AdaptivePacer()
+        elif isinstance(pacing, (FixedPacer, AdaptivePacer)):
+            self._pacer = pacing
+        else:
+            raise ValueError("pacing must be 'fixed', 'adaptive' or a pacer instance")
+        # Accumulated seconds spent sleeping for pacing vs waiting on the device (read by the benchmarks)
+        self._timing = {'pacing_sleep': 0.0, 'device_wait': 0.0}
         # Add tracking for Mifare card state
         self._mifare_selected_uid = None
-        self._mifare_auth_blocks = {}  # Track authenticated sectors by UID
+        self._mifare_auth_sector = None  # Sector authenticated on the selected card, if any
+        self._mifare_card_type = None  # Card type walked by iter_card(); key store saves wait until it ends
+        self.reader_info: Optional[dict] = None  # {'model', 'serial'} from the readiness probe on connect
 
         if auto_connect:
             self._connect()
@@ -66,10 +128,11 @@ class RRHFOEM04:
         Establish connection with the RFID reader device.
         
         The connection process involves:
-        1. Creating a new HID device instance
-        2. Opening the device using vendor and product IDs
-        3. Setting non-blocking mode for improved response handling
-        4. Adding initialization delay for device stability
+        1. Creating the transport (a HID transport unless one was supplied)
+        2. Opening the device (the HID transport uses vendor and product IDs
+           and sets non-blocking mode for improved response handling)
+        3. Probing readiness with Get Reader Information instead of a fixed
+           stabilization delay (see `_wait_ready`)
         
         Returns:
             bool: True if connection successful
@@ -79,16 +142,63 @@ class RRHFOEM04:
         """
         self.logger.debug("Attempting to connect to the device")
         try:
-            self.device = hid.device()
-            self.device.open(VENDOR_ID, PRODUCT_ID)
-            self.device.set_nonblocking(1)  # Enable non-blocking mode for better timing control
-            time.sleep(0.1)  # Allow device to stabilize after connection
-            self.logger.info("Device connected successfully")
-            return True
+            transport = self._transport or HidTransport()
+            transport.open()
+            self.device = transport
         except Exception as e:
-            self.logger.error(f"Failed to connect to device: {str(e)}")
+            self.logger.error("Failed to connect to device: %s", e)
             raise ConnectionError(f"Failed to connect to device: {str(e)}")
 
+        self._wait_ready()
+        self.logger.info("Device connected successfully")
+        return True
+
+    def _wait_ready(self) -> bool:
+        """
+        Wait until the freshly opened reader answers, instead of a fixed stabilization delay.
+
+        Get Reader Information is sent repeatedly until it succeeds or
+        `CONNECT_READY_TIMEOUT` has passed; the answer is kept in `reader_info`. A
+        ready reader answers the first probe at once, as the response wait returns
+        as soon as the reply arrives. Each probe waits `CONNECT_PROBE_TIMEOUT`; a
+        reply slower than that is still on its way when the next probe is sent, so
+        after a success the replies owed for the timed-out probes are read and
+        dropped, leaving neither stale replies nor a busy reader to the next
+        command. The probe is an ordinary command, so the next one still waits for
+        the pacer's gap.
+
+        Returns:
+            bool: True if the reader answered; False leaves the connection open but unprobed
+
+        Raises:
+            ConnectionError: If the reader answers with a malformed Get Reader Information response
+        """
+        give_up = time.time() + CONNECT_READY_TIMEOUT
+        unanswered = 0
+        while True:
+            try:
+                response = self._send_command(self._codec.frame('GET_READER_INFO'), timeout=CONNECT_PROBE_TIMEOUT)
+            except CommunicationError as e:
+                self.logger.debug("Readiness probe failed: %s", e)
+                response = None
+            if response is not None and response.ok:
+                try:
+                    self.reader_info = self._parse_reader_info(response)
+                except ValueError as e:  # Includes UnicodeDecodeError
+                    self.logger.error("Malformed reader information: %s", e)
+                    self.close()
+                    raise ConnectionError(f"Failed to connect to device: malformed reader information ({e})")
+                # The reply just taken may belong to an earlier probe; wait out the later ones
+                for _ in range(unanswered):
+                    if not self._read_report(time.time() + CONNECT_PROBE_TIMEOUT):
+                        break
+                return True
+            if response is None:
+                unanswered += 1
+            if time.time() >= give_up:
+                self.logger.warning("Reader did not answer the readiness probe")
+                return False
+
     def _calc_crc(self, data: List[int]) -> int:
         """
         Calculate CRC-16 checksum for command data using CCITT-16 polynomial.
@@ -104,94 +214,469 @@ class RRHFOEM04:
         Returns:
             int: Calculated CRC value (16 bits)
         """
-        crc = 0xFFFF  # Initial CRC value
-        for byte in data:
-            crc ^= byte  # XOR byte into CRC
-            for _ in range(8):  # Process each bit
-                # If MSB is 1, shift left and XOR with polynomial
-                crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
-        return (~crc)  # Return inverted CRC
+        return calc_crc(data)
 
-    def _send_command(self, cmd_data: List[int]) -> Optional[List[str]]:
+    def _send_command(self, cmd_data: Union[List[int], bytes, bytearray],
+                      timeout: Optional[float] = None) -> Optional[RawResponse]:
         """
         Send command to device and receive response with robust error handling.
 
         This method implements the complete command transmission protocol:
         1. Ensures proper timing between commands
-        2. Calculates and appends CRC
+        2. Calculates and appends CRC (for raw command lists)
         3. Formats command according to protocol specifications
-        4. Handles device communication with retries
-        5. Processes and validates response
+        4. Handles device communication and waits for the response (see `_wait_response`)
+        5. Validates the response and wraps it in a `RawResponse`
 
         The command format follows the structure:
         [0x00][Command Data][CRC][Padding to 64 bytes]
         
         Args:
-            cmd_data: List of command bytes to send
+            cmd_data: List of command bytes to send, or a complete report already
+                built by `CommandCodec` (sent as-is)
+            timeout: Seconds to wait for the response (see `_wait_response`)
             
         Returns:
-            Optional[List[str]]: Response as a list of uppercase hex byte strings (e.g., ["AA","BB",...])
-            if successful, or None if no response is received within the timeout
+            Optional[RawResponse]: The response frame, or None if no response is received within the timeout
             
         Raises:
             ConnectionError: If device is not connected
-            CommunicationError: If transmission fails
+            CommunicationError: If transmission fails or the response CRC does not match (when validated)
         """
         if not self.device:
             self.logger.error("Device not connected")
             raise ConnectionError("Device not connected")
 
+        try:
+            # Prepare command packet with CRC unless the codec already built it
+            cmd = encode_frame(cmd_data) if isinstance(cmd_data, list) else cmd_data
+            category = cmd[2]
+        except Exception as e:
+            self.logger.error("Invalid command frame: %s", e)
+            raise CommunicationError(f"Invalid command frame: {str(e)}")
+
+        metrics = self.metrics
+        outcome = OUTCOME_FAILURE
+        bytes_in = 0
+        pacing = drain = wait = first_report = 0.0
+        self._frame_requests = 0
+        self._first_report_time = None
+        # Exchange record for hooks, only built when some are registered
+        exchange = FrameExchange((category << 8) | cmd[3], self._exchange_uid(cmd), cmd[1] + 2) if self._hooks else None
+        error = None
         try:
             # Implement minimum command interval for device stability
-            elapsed = time.time() - self._last_command_time
-            if elapsed < COMMAND_INTERVAL:
-                time.sleep(COMMAND_INTERVAL - elapsed)
-
-            # Prepare command packet with CRC
-            crc = self._calc_crc(cmd_data)
-            cmd = bytes([0x00] + cmd_data + [(crc >> 8) & 0xFF, crc & 0xFF] + 
-                       [0] * (BUFFER_SIZE - len(cmd_data) - 3))
+            delay = self._pacing_delay(category)
+            if delay > 0:
+                time.sleep(delay)
+                self._timing['pacing_sleep'] += delay
+                pacing = delay
 
             # Quickly drain any stale data without busy-waiting
+            drain_started = time.perf_counter()
             for _ in range(4):  # cap drain attempts to avoid long spins
                 if not self.device.read(BUFFER_SIZE):
                     break
                 time.sleep(0.001)
+            written = time.perf_counter()
+            drain = written - drain_started
 
             # Send command and update timing
+            if exchange is not None:
+                self._run_hooks(HOOK_SEND, exchange)
             self.device.write(cmd)
             self._last_command_time = time.time()
+            trace = self.frame_trace
+            if trace is not None:
+                trace.record(TX, cmd[1:cmd[1] + 3])
 
-            # Poll for response up to DEFAULT_TIMEOUT with small sleeps
-            deadline = time.time() + DEFAULT_TIMEOUT
-            response = None
-            while time.time() < deadline:
-                response = self.device.read(BUFFER_SIZE)
-                if response:
-                    break
-                time.sleep(RETRY_DELAY)
+            response = self._wait_response(timeout, (category << 8) | cmd[3])
+            wait = time.perf_counter() - written
+            first_report = self._first_report_time - written if self._first_report_time is not None else wait
+            bytes_in = min(len(response), response[0] + 2) if response else 0
+            if trace is not None and response:
+                trace.record(RX, response[:response[0] + 2])
 
-            # If still nothing, try a few quick extra retries (for jitter)
-            if not response:
-                for _ in range(MAX_RETRIES):
-                    response = self.device.read(BUFFER_SIZE)
-                    if response:
-                        break
-                    time.sleep(RETRY_DELAY)
+            self._timing['device_wait'] += time.time() - self._last_command_time
 
-            if response:
-                # Faster hex conversion without regex
-                return [f"{b:02X}" for b in response]
+            if response and len(response) < response[0] + 2:
+                self._pacer.record(category, False)
+                self.logger.error("Incomplete response frame")
+                raise CommunicationError("Incomplete response frame")
 
+            if response and self._validate_crc and not verify_crc(response):
+                self._pacer.record(category, False)
+                self.logger.error("Response CRC mismatch")
+                raise CommunicationError("Response CRC mismatch")
+
+            if response:
+                response = RawResponse(response, wait)
+                outcome = OUTCOME_OK if response.ok else OUTCOME_ERROR
+                if exchange is not None:
+                    exchange.status = response.status
+                # Clean responses let adaptive pacing tighten; error statuses make it back off
+                self._pacer.record(category, response.ok)
+                return response
+
+            outcome = OUTCOME_TIMEOUT
+            self._pacer.record(category, False)
             self.logger.warning("No response received after retries")
             return None
 
-        except ConnectionError:
+        except (ConnectionError, CommunicationError) as e:
+            error = e
             raise
 
         except Exception as e:
-            self.logger.error(f"Unexpected error during command transmission: {str(e)}")
-            raise CommunicationError(f"Unexpected error during command transmission: {str(e)}")
+            self._pacer.record(category, False)
+            self.logger.error("Unexpected error during command transmission: %s", e)
+            error = CommunicationError(f"Unexpected error during command transmission: {str(e)}")
+            raise error
+
+        finally:
+            if metrics is not None:
+                metrics.record((category << 8) | cmd[3], outcome, pacing, drain, wait,
+                               cmd[1] + 2, bytes_in, self._frame_requests, first_report)
+            if exchange is not None:
+                exchange.bytes_in = bytes_in
+                exchange.pacing, exchange.drain, exchange.wait = pacing, drain, wait
+                exchange.first_report = first_report
+                exchange.retries = self._frame_requests
+                exchange.outcome = outcome
+                exchange.error = error
+                self._run_hooks(HOOK_RECEIVE if outcome in (OUTCOME_OK, OUTCOME_ERROR) else HOOK_ERROR, exchange)
+
+    def _exchange_uid(self, cmd: Union[bytes, bytearray]) -> Optional[str]:
+        """Return the display-order UID a command report addresses, or None (used for hooks)."""
+        category = cmd[2]
+        if category in (0x10, 0x1F) and cmd[1] >= 12 and cmd[4] & 0x24 == 0x20:
+            # ISO15693 address flag set outside inventory: UID follows the flags, little-endian
+            return bytes(cmd[5:13][::-1]).hex().upper()
+        if category == 0x2F and cmd[3] == 0x02:
+            return bytes(cmd[5:5 + cmd[4]]).hex().upper()
+        if category == 0x21:
+            return self._mifare_selected_uid
+        return None
+
+    def _run_hooks(self, event: str, exchange: FrameExchange) -> None:
+        """Call the hooks registered for `event`; a failing hook is logged and never breaks the exchange."""
+        for hook in self._hooks.get(event, ()):
+            try:
+                hook(exchange)
+            except Exception as e:
+                self.logger.warning("Error in %s hook %r: %s", event, hook, e)
+
+    def add_hook(self, event: str, callback: Callable[[FrameExchange], None]) -> None:
+        """
+        Register a callback run around every command exchange.
+
+        Args:
+            event: HOOK_SEND (before the frame is written), HOOK_RECEIVE (response received)
+                or HOOK_ERROR (timeout or transport failure)
+            callback: Called with the `FrameExchange` of the command; the same object is
+                passed to every event of one exchange
+        """
+        if event not in HOOK_EVENTS:
+            raise ValueError(f"event must be one of {', '.join(HOOK_EVENTS)}")
+        self._hooks.setdefault(event, []).append(callback)
+
+    def remove_hook(self, event: str, callback: Callable[[FrameExchange], None]) -> None:
+        """Unregister a callback added with `add_hook()`; unknown callbacks are ignored."""
+        hooks = self._hooks.get(event)
+        if hooks and callback in hooks:
+            hooks.remove(callback)
+            if not hooks:
+                del self._hooks[event]
+
+    def _pacing_delay(self, category: int) -> float:
+        """Return the seconds still to wait before a command of `category` may be sent."""
+        return max(0.0, self._pacer.interval(category) - (time.time() - self._last_command_time))
+
+    def _iso15693_frame(self, name: str, with_select_flag: bool, uid: Optional[str], *fields) -> bytearray:
+        """
+        Build an ISO15693 command in the requested addressing mode.
+
+        Args:
+            name: Base command name from `COMMAND_TABLE` (non-addressed variant)
+            with_select_flag: Use the select-flag variant
+            uid: Use the address-flag variant targeting this UID (takes precedence)
+            *fields: Command parameters following the flags/UID
+
+        Returns:
+            bytearray: Report ready to send
+        """
+        if uid:
+            return self._codec.build(name + '_WITH_ADDRESS_FLAG', uid_to_le(uid), *fields)
+        if with_select_flag:
+            return self._codec.build(name + '_WITH_SELECT_FLAG', *fields)
+        return self._codec.build(name, *fields)
+
+    def _iso15693_inventory_frame(self, slots: int, afi: Optional[int]) -> Union[bytes, bytearray]:
+        """
+        Return the inventory frame for `slots` (1 or 16), filtered by `afi` if given.
+
+        Raises:
+            ValueError: If `slots` or `afi` is out of range
+        """
+        if slots not in (1, 16):
+            raise ValueError("slots must be 1 or 16")
+        name = 'ISO15693_16_SLOT_INVENTORY' if slots == 16 else 'ISO15693_SINGLE_SLOT_INVENTORY'
+        if afi is None:
+            return self._codec.frame(name)
+        if not 0 <= afi <= 255:
+            raise ValueError("AFI must be an integer between 0 and 255.")
+        return self._codec.build(name + '_WITH_AFI', afi)
+
+    def _iso15693_inventory(self, frame: Union[bytes, bytearray]) -> Optional[List[memoryview]]:
+        """
+        Send an ISO15693 inventory frame and extract the UIDs it reports.
+
+        Response payload: tag count, then one 8-byte little-endian UID per tag.
+
+        Returns:
+            Optional[List[memoryview]]: UIDs in display (most significant byte first) order,
+            or None if the reader reported an error
+        """
+        response = self._iso15693_inventory_response(frame)
+        if response is None or not response.ok:
+            return None
+        return self._inventory_uids(response.payload)
+
+    def _iso15693_inventory_response(self, frame: Union[bytes, bytearray]) -> Optional[RawResponse]:
+        """Send an ISO15693 inventory frame; log and return the response (None on timeout) if not ok."""
+        response = self._send_command(frame)
+        if response is None or not response.ok:
+            self.logger.error("Inventory scan failed: %s", status_text(response))
+        return response
+
+    def _iso15693_read_blocks(self, start_block_number: int, count: int, block_size: int,
+                              with_select_flag: bool, uid: Optional[str]) -> Optional[memoryview]:
+        """
+        Read `count` consecutive ISO15693 blocks with one Read Multiple Blocks command.
+
+        Args:
+            start_block_number: First block to read
+            count: Number of blocks to read (1 or more; sent as count - 1)
+            block_size: Size of each block in bytes
+            with_select_flag: Use select flag mode
+            uid: Target specific tag by UID
+
+        Returns:
+            Optional[memoryview]: Block data in tag memory order, or None if the reader reported an error
+
+        Raises:
+            ValueError: If the response would not fit in one frame
+        """
+        response = self._iso15693_read_blocks_response(start_block_number, count, block_size, with_select_flag, uid)
+        if response is None or not response.ok:
+            return None
+
+        # Skip the flags byte that precedes the block data
+        return response.payload[1:1 + block_size * count]
+
+    def _iso15693_read_blocks_response(self, start_block_number: int, count: int, block_size: int,
+                                       with_select_flag: bool, uid: Optional[str]) -> Optional[RawResponse]:
+        """
+        Send the Read Multiple Blocks command of `_iso15693_read_blocks`; log and return the response.
+
+        Raises:
+            ValueError: If the response would not fit in one frame
+        """
+        # The response (header, flags byte, block data) must fit in one frame, which may span several reports
+        if 6 + block_size * count > MAX_FRAME_LENGTH:
+            raise ValueError(f"Cannot read {count} blocks of {block_size} bytes in one frame")
+
+        cmd = self._iso15693_frame('ISO15693_READ_MULTIPLE_BLOCKS', with_select_flag, uid,
+                                   block_size, start_block_number, count - 1)
+
+        response = self._send_command(cmd)
+        if response is None or not response.ok:
+            self.logger.error("Multiple block read failed: %s", status_text(response))
+        return response
+
+    def _iso15693_write_blocks(self, start_block_number: int, data: Union[bytes, memoryview], block_size: int,
+                               with_select_flag: bool, uid: Optional[str]) -> None:
+        """
+        Write whole blocks with one Write Multiple Blocks command.
+
+        Args:
+            start_block_number: First block to write
+            data: Block data in tag memory order, a multiple of `block_size` bytes
+            block_size: Size of each block in bytes
+            with_select_flag: Use select flag mode
+            uid: Target specific tag by UID
+
+        Raises:
+            CommandError: If the reader reports an error or does not respond
+        """
+        cmd = self._iso15693_frame('ISO15693_WRITE_MULTIPLE_BLOCK', with_select_flag, uid,
+                                   block_size, start_block_number, len(data) // block_size, data)
+
+        self._update_block_cache(uid, start_block_number, data, block_size, written=False)
+        response = self._send_command(cmd)
+
+        if response is None or not response.ok:
+            self.logger.error("Write operation failed with status: %s", status_text(response))
+            raise CommandError(f"Write operation failed with status: {status_text(response)}")
+        self._update_block_cache(uid, start_block_number, data, block_size, written=True)
+
+    def _cached_blocks(self, uid: Optional[str], start_block_number: int, count: int,
+                       block_size: int) -> Optional[bytes]:
+        """Return `count` consecutive blocks from the block cache if every one of them is cached, else None."""
+        if self.block_cache is None or not uid:
+            return None
+        blocks = []
+        for block in range(start_block_number, start_block_number + count):
+            data = self.block_cache.get(uid, block, block_size)
+            if data is None:
+                return None
+            blocks.append(data)
+        return b''.join(blocks)
+
+    def _update_block_cache(self, uid: Optional[str], start_block_number: int, data: Union[bytes, memoryview],
+                            block_size: int, written: bool) -> None:
+        """
+        Keep the block cache in step with a write.
+
+        Called with `written=False` before the write is sent, which drops the
+        blocks it touches (their contents are unknown if the write fails), and
+        with `written=True` once it succeeded, which stores the new contents.
+        Non-addressed writes may reach any tag, so they clear the whole cache.
+        """
+        if self.block_cache is None:
+            return
+        if not uid:
+            self.block_cache.invalidate()
+        elif written:
+            self.block_cache.put_blocks(uid, start_block_number, data, block_size)
+        else:
+            self.block_cache.invalidate(uid, start_block_number, len(data) // block_size)
+
+    def _wait_response(self, timeout: Optional[float] = None, command: Optional[int] = None) -> bytes:
+        """
+        Wait for the response frame to the command just written.
+
+        In "blocking" mode the transport performs timed blocking reads, so each
+        report is picked up as soon as it arrives. In "poll" mode the legacy
+        behaviour is kept: non-blocking reads separated by `RETRY_DELAY` sleeps.
+        Both modes give up after the same overall deadline of
+        `DEFAULT_TIMEOUT + MAX_RETRIES * RETRY_DELAY`, unless `timeout` is given.
+
+        Frames longer than one report are reassembled using the length byte of
+        the first report. If a continuation report does not arrive within
+        `ADDITIONAL_FRAME_WAIT`, it is requested with the Additional Frame
+        command (F002).
+
+        When `command` is given, reports that do not echo it (late answers to an
+        earlier command, e.g. a readiness probe that timed out) are dropped and
+        reading continues until the deadline.
+
+        Args:
+            timeout: Seconds to wait for the response
+            command: 16-bit code of the command just written
+
+        Returns:
+            bytes: The response frame (possibly truncated if the deadline passed
+            mid-frame), or empty bytes on timeout
+        """
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUT + MAX_RETRIES * RETRY_DELAY
+        deadline = time.time() + timeout
+        response = self._read_report(deadline)
+        while response and command is not None and len(response) >= 3 and (response[1] << 8 | response[2]) != command:
+            self.logger.debug("Dropping stale response to command %04X", response[1] << 8 | response[2])
+            response = self._read_report(deadline)
+        if response:
+            # Reader processing latency ends here; the rest is transfer of further reports
+            self._first_report_time = time.perf_counter()
+
+        # The length byte excludes the two CRC bytes
+        frame_size = response[0] + 2 if response else 0
+        if frame_size <= len(response):
+            return response
+
+        frame = bytearray(response)
+        while len(frame) < frame_size:
+            report = self._read_report(min(deadline, time.time() + ADDITIONAL_FRAME_WAIT))
+            if not report and time.time() < deadline:
+                self.logger.debug("Requesting additional frame")
+                frame_request = self._codec.frame('ADDITIONAL_FRAME')
+                self.device.write(frame_request)
+                self._frame_requests += 1
+                if self.frame_trace is not None:
+                    self.frame_trace.record(TX, frame_request[1:frame_request[1] + 3])
+                report = self._read_report(deadline)
+            if not report:
+                break
+            frame += report
+        return bytes(frame)
+
+    def _read_report(self, deadline: float) -> bytes:
+        """
+        Read one report, waiting until `deadline` (a `time.time()` value) at most.
+
+        Returns:
+            bytes: The report, or empty bytes on timeout
+        """
+        if self._response_wait == "poll":
+            while True:
+                response = self.device.read(BUFFER_SIZE)
+                if response or time.time() >= deadline:
+                    return response
+                time.sleep(RETRY_DELAY)
+
+        while True:
+            remaining_ms = int((deadline - time.time()) * 1000)
+            if remaining_ms <= 0:
+                return b''
+            response = self.device.read(BUFFER_SIZE, remaining_ms)
+            if response:
+                return response
+
+    def _format_bytes(self, data: Union[bytes, memoryview]) -> Union[str, bytes]:
+        """
+        Format response data for a result: uppercase hex string, or `bytes` when `raw_results` is set.
+
+        Args:
+            data: Bytes already in display order
+
+        Returns:
+            Union[str, bytes]: Formatted data
+        """
+        return bytes(data) if self._raw_results else data.hex().upper()
+
+    def _response_result(self, success: bool, message: str, response: Optional[RawResponse], data=None,
+                         decode: Optional[Callable[[], object]] = None) -> RRHFOEM04Result:
+        """
+        Build the result of an operation answered by `response`, carrying its frame, status and elapsed time.
+
+        Args:
+            success: Operation outcome
+            message: Result message
+            response: The response (None when there was none)
+            data: Result data, if already built
+            decode: Zero-argument callable producing `data` on first access instead
+        """
+        if response is None:
+            return RRHFOEM04Result(success, message, data, decode=decode)
+        return RRHFOEM04Result(success, message, data, raw=response.raw, status=response.status,
+                               elapsed=response.elapsed, decode=decode)
+
+    def _format_uids(self, payload: memoryview) -> List[Union[str, bytes]]:
+        """Format the UIDs of an ISO15693 inventory payload (tag count, then 8-byte little-endian UIDs)."""
+        return [self._format_bytes(uid) for uid in self._inventory_uids(payload)]
+
+    @staticmethod
+    def _inventory_uids(payload: memoryview) -> List[memoryview]:
+        """Extract the UIDs of an ISO15693 inventory payload in display (most significant byte first) order."""
+        return [payload[start:start + 8][::-1] for start in range(1, 1 + payload[0] * 8, 8)]
+
+    def _format_blocks(self, data: memoryview, block_size: int) -> Union[str, bytes]:
+        """Format block data read in tag memory order, reversing each little-endian block."""
+        blocks = bytearray(data)
+        for i in range(0, len(blocks), block_size):
+            blocks[i:i + block_size] = data[i:i + block_size][::-1]
+        return self._format_bytes(blocks)
 
     def _byte_list_to_hex_string(self, data: List[int]) -> str:
         """
@@ -216,24 +701,32 @@ class RRHFOEM04:
         Returns:
             RRHFOEM04Result: A RRHFOEM04Result object containing success status, message and response data
         """
-        try:
-            # Pre-buzzer delay prevents interference with previous operations
+        # Pre-buzzer delay prevents interference with previous operations
+        time.sleep(COMMAND_INTERVAL)
+        self._timing['pacing_sleep'] += COMMAND_INTERVAL
+
+        result = self._buzzer_beep_command()
+        if result.success:
+            # Post-buzzer delay ensures complete sound generation
             time.sleep(COMMAND_INTERVAL)
-        
-            response = self._send_command(CMD_BUZZER_BEEP)
+            self._timing['pacing_sleep'] += COMMAND_INTERVAL
+        return result
+
+    def _buzzer_beep_command(self) -> RRHFOEM04Result:
+        """Send the beep command without the surrounding delays (see `buzzer_beep`)."""
+        try:
+            response = self._send_command(self._codec.frame('BUZZER_BEEP'))
             
             # Empty response is normal for buzzer command, but check status if present
-            if response and response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"Error activating buzzer: {response[3:5]}")
-                return RRHFOEM04Result(success=False, message="Operation Failed")
+            if response is not None and not response.ok:
+                self.logger.error("Error activating buzzer: %s", status_text(response))
+                return self._response_result(False, "Operation Failed", response)
             
-            # Post-buzzer delay ensures complete sound generation
-            time.sleep(COMMAND_INTERVAL)
             self.logger.info("Buzzer activated successfully")
-            return RRHFOEM04Result(success=True, message="Operation Successful")
+            return self._response_result(True, "Operation Successful", response)
         
         except Exception as e:
-            self.logger.error(f"Error in buzzer activation: {str(e)}")
+            self.logger.error("Error in buzzer activation: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
     
     def buzzer_on(self) -> RRHFOEM04Result:
@@ -248,17 +741,17 @@ class RRHFOEM04:
 
         try:
         
-            response = self._send_command(CMD_BUZZER_ON)
+            response = self._send_command(self._codec.frame('BUZZER_ON'))
             
             # Empty response is normal for buzzer command, but check status if present
-            if response and response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"Error activating buzzer: {response[3:5]}")
-                return RRHFOEM04Result(success=False, message="Operation Failed")
+            if response is not None and not response.ok:
+                self.logger.error("Error activating buzzer: %s", status_text(response))
+                return self._response_result(False, "Operation Failed", response)
 
-            return RRHFOEM04Result(success=True, message="Operation Successful")
+            return self._response_result(True, "Operation Successful", response)
         
         except Exception as e:
-            self.logger.error(f"Error in buzzer activation: {str(e)}")
+            self.logger.error("Error in buzzer activation: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
 
     def buzzer_off(self) -> RRHFOEM04Result:
@@ -273,19 +766,33 @@ class RRHFOEM04:
 
         try:
         
-            response = self._send_command(CMD_BUZZER_OFF)
+            response = self._send_command(self._codec.frame('BUZZER_OFF'))
             
             # Empty response is normal for buzzer command, but check status if present
-            if response and response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"Error deactivating buzzer: {response[3:5]}")
-                return RRHFOEM04Result(success=False, message="Operation Failed")
+            if response is not None and not response.ok:
+                self.logger.error("Error deactivating buzzer: %s", status_text(response))
+                return self._response_result(False, "Operation Failed", response)
 
-            return RRHFOEM04Result(success=True, message="Operation Successful")
+            return self._response_result(True, "Operation Successful", response)
         
         except Exception as e:
-            self.logger.error(f"Error in buzzer deactivation: {str(e)}")
+            self.logger.error("Error in buzzer deactivation: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
         
+    @staticmethod
+    def _parse_reader_info(response: RawResponse) -> dict:
+        """Parse a Get Reader Information response into {'model', 'serial'}."""
+        # Extract and parse reader information section
+        reader_info_part = bytes(response.payload[:16])
+        model_end = reader_info_part.index(0x2D)  # Find '-' delimiter
+
+        # Convert model number from ASCII bytes to string
+        model = reader_info_part[:model_end].decode()
+
+        # Extract serial number (last 3 bytes)
+        serial = reader_info_part[-3:].hex().upper()
+        return {'model': model, 'serial': serial}
+
     def getReaderInfo(self) -> RRHFOEM04Result:
         """
         Retrieve device information from the RFID reader.
@@ -300,34 +807,25 @@ class RRHFOEM04:
             RRHFOEM04Result: A RRHFOEM04Result object containing success status, message and response data
         """
         try:
-            response = self._send_command(CMD_GET_READER_INFO)
-            if not response:
+            response = self._send_command(self._codec.frame('GET_READER_INFO'))
+            if response is None:
                 self.logger.error("No response received from get_reader_info command")
                 return RRHFOEM04Result(success=False, message="No Response")
             
-            if response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"Error getting reader information: {response[3:5]}")
-                return RRHFOEM04Result(success=False, message="Operation Failed")
-            
-            # Extract and parse reader information section
-            reader_info_part = response[5:21]
-            model_end = reader_info_part.index('2D')  # Find '-' delimiter
-            
-            # Convert model number from hex to ASCII string
-            model = bytes.fromhex(''.join(reader_info_part[:model_end])).decode()
+            if not response.ok:
+                self.logger.error("Error getting reader information: %s", status_text(response))
+                return self._response_result(False, "Operation Failed", response)
             
-            # Extract serial number (last 3 bytes)
-            serial = ''.join(reader_info_part[-3:])
-
-            return RRHFOEM04Result(success=True, message="Operation Successful", data={'model': model, 'serial': serial}) 
+            self.reader_info = self._parse_reader_info(response)
+            return self._response_result(True, "Operation Successful", response, data=dict(self.reader_info))
             
         except Exception as e:
-            self.logger.error(f"Error in get_reader_info: {e}")
+            self.logger.error("Error in get_reader_info: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
 
     # === ISO15693 Protocol Implementation ===
 
-    def ISO15693_singleSlotInventory(self) -> RRHFOEM04Result:
+    def ISO15693_singleSlotInventory(self, afi: Optional[int] = None) -> RRHFOEM04Result:
         """
         Perform an ISO15693 single slot inventory scan.
         
@@ -339,40 +837,33 @@ class RRHFOEM04:
         - 0x04: Frame length
         - 0x10: ISO15693 protocol identifier
         - 0x01: Inventory command
-        - 0x26: Flags (no AFI, single slot)
-        
+        - 0x26: Flags (no AFI, single slot); 0x36 with an AFI byte following
+
         Response format:
         - Byte 5: Number of tags found
         - Bytes 6+: UIDs, 8 bytes per tag (little-endian)
-        
+
+        Args:
+            afi: Only tags of this Application Family Identifier answer (0 matches every family).
+                Defaults to None (no filter).
+
         Returns:
             RRHFOEM04Result: A RRHFOEM04Result object containing success status, message and response data
         """
         try:
-            response = self._send_command(CMD_ISO15693_SINGLE_SLOT_INVENTORY)
+            response = self._iso15693_inventory_response(self._iso15693_inventory_frame(1, afi))
+            if response is None or not response.ok:
+                return self._response_result(False, "Operation Failed", response)
 
-            if response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"Error in inventory scan: {response[3:5]}")
-                return RRHFOEM04Result(success=False, message="Operation Failed")
-            
-            tag_uids = []
-            total_tags = int(response[5])
-            
-            # Extract and format UIDs from response
-            # UIDs are 64-bit (8 bytes) stored in little-endian format
-            for i in range(total_tags):
-                start_index = 6 + (i * 8)
-                # Convert UID to big-endian format for standard representation
-                uid = ''.join(response[start_index:start_index + 8][::-1])
-                tag_uids.append(uid)
-
-            return RRHFOEM04Result(success=True, message="Operation Successful", data=tag_uids)
+            # UIDs are formatted on first access to `data`
+            return self._response_result(True, "Operation Successful", response,
+                                         decode=functools.partial(self._format_uids, response.payload))
             
         except Exception as e:
-            self.logger.error(f"Error in ISO15693 inventory scan: {str(e)}")
+            self.logger.error("Error in ISO15693 inventory scan: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
     
-    def ISO15693_16SlotInventory(self) -> RRHFOEM04Result:
+    def ISO15693_16SlotInventory(self, afi: Optional[int] = None) -> RRHFOEM04Result:
         """
         Perform an ISO15693 16-slot inventory scan to detect multiple RFID tags.
         
@@ -393,32 +884,180 @@ class RRHFOEM04:
         - Byte 5: Number of tags detected
         - Bytes 6+: Sequence of 8-byte UIDs (little-endian format)
 
+        Args:
+            afi: Only tags of this Application Family Identifier answer (0 matches every family).
+                Filtering out unrelated tags cuts collisions and response size. Defaults to None (no filter).
+
         Returns:
             RRHFOEM04Result: A RRHFOEM04Result object containing success status, message and response data
         """
         try:
-            response = self._send_command(CMD_ISO15693_16_SLOT_INVENTORY)
+            response = self._iso15693_inventory_response(self._iso15693_inventory_frame(16, afi))
+            if response is None or not response.ok:
+                return self._response_result(False, "Operation Failed", response)
 
-            if response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"16-slot inventory scan failed: {response[3:5]}")
-                return RRHFOEM04Result(success=False, message="Operation Failed")
-            
-            tag_uids = []
-            # Extract number of tags found
-            total_tags = int(response[5])
-            
-            # Process and format each detected tag's UID
-            for i in range(total_tags):
-                # UIDs start at byte 6, each UID is 8 bytes
-                start_index = 6 + (i * 8)
-                # Convert from little-endian to standard format
-                uid = ''.join(response[start_index:start_index + 8][::-1])
-                tag_uids.append(uid)
-
-            return RRHFOEM04Result(success=True, message="Operation Successful", data=tag_uids)
+            # UIDs are formatted on first access to `data`
+            return self._response_result(True, "Operation Successful", response,
+                                         decode=functools.partial(self._format_uids, response.payload))
             
         except Exception as e:
-            self.logger.error(f"Error in 16-slot inventory scan: {str(e)}")
+            self.logger.error("Error in 16-slot inventory scan: %s", e)
+            return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
+
+    def _iso15693_state_command(self, name: str, uid_le: Union[bytes, memoryview]) -> Optional[RawResponse]:
+        """
+        Send an addressed state command (Select, Stay Quiet, Reset to Ready) to the tag with little-endian UID `uid_le`.
+
+        Returns:
+            Optional[RawResponse]: The response (a failure is logged), or None if there was none
+        """
+        response = self._send_command(self._codec.build(name, uid_le))
+        if response is None or not response.ok:
+            self.logger.error("%s failed: %s", name, status_text(response))
+        return response
+
+    def _iso15693_wake(self, uids: List[bytes]) -> None:
+        """Reset quiet tags (display-order UIDs) to ready with one addressed Reset to Ready each."""
+        for uid in uids:
+            try:
+                self._iso15693_state_command('ISO15693_RESET_TO_READY_WITH_ADDRESS_FLAG', uid[::-1])
+            except RRHFOEM04Error as e:
+                self.logger.warning("Could not reset tag %s: %s", uid.hex().upper(), e)
+
+    def ISO15693_select(self, uid: str) -> RRHFOEM04Result:
+        """
+        Put an ISO15693 tag in the selected state, for later `with_select_flag` commands.
+
+        Args:
+            uid: UID of the tag to select
+
+        Returns:
+            RRHFOEM04Result: A RRHFOEM04Result object containing success status and message
+        """
+        try:
+            response = self._iso15693_state_command('ISO15693_SELECT', uid_to_le(uid))
+            if response is None or not response.ok:
+                return self._response_result(False, "Operation Failed", response)
+            return self._response_result(True, "Operation Successful", response)
+
+        except Exception as e:
+            self.logger.error("Error in ISO15693_select: %s", e)
+            return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
+
+    def ISO15693_stayQuiet(self, uid: str) -> RRHFOEM04Result:
+        """
+        Put an ISO15693 tag in the quiet state.
+
+        A quiet tag ignores inventories and non-addressed commands but still
+        answers addressed ones, until it is reset to ready, selected or leaves
+        the field.
+
+        Args:
+            uid: UID of the tag to silence
+
+        Returns:
+            RRHFOEM04Result: A RRHFOEM04Result object containing success status and message
+        """
+        try:
+            response = self._iso15693_state_command('ISO15693_STAY_QUIET', uid_to_le(uid))
+            if response is None or not response.ok:
+                return self._response_result(False, "Operation Failed", response)
+            return self._response_result(True, "Operation Successful", response)
+
+        except Exception as e:
+            self.logger.error("Error in ISO15693_stayQuiet: %s", e)
+            return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
+
+    def ISO15693_resetToReady(self, with_select_flag: bool = False, uid: Optional[str] = None) -> RRHFOEM04Result:
+        """
+        Return an ISO15693 tag from the quiet or selected state to the ready state.
+
+        Args:
+            with_select_flag: Reset the selected tag
+            uid: Reset a specific tag by UID (required for a quiet tag)
+
+        Returns:
+            RRHFOEM04Result: A RRHFOEM04Result object containing success status and message
+        """
+        try:
+            cmd = self._iso15693_frame('ISO15693_RESET_TO_READY', with_select_flag, uid)
+            response = self._send_command(cmd)
+            if response is None or not response.ok:
+                self.logger.error("Reset to ready failed: %s", status_text(response))
+                return self._response_result(False, "Operation Failed", response)
+            return self._response_result(True, "Operation Successful", response)
+
+        except Exception as e:
+            self.logger.error("Error in ISO15693_resetToReady: %s", e)
+            return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
+
+    def ISO15693_exhaustiveInventory(self, slots: int = 16, reset: bool = True, empty_cycles: int = 1,
+                                     max_cycles: int = EXHAUSTIVE_INVENTORY_MAX_CYCLES,
+                                     afi: Optional[int] = None) -> RRHFOEM04Result:
+        """
+        Find every ISO15693 tag in a crowded field by silencing tags as they are found.
+
+        One inventory response holds a limited number of UIDs and colliding tags
+        are lost, so a single inventory misses tags in a full field. Here every
+        tag found is sent Stay Quiet, which stops it answering, and inventories
+        repeat until `empty_cycles` consecutive cycles find no new tag. With `reset`, the found tags are then
+        returned to the ready state (one addressed Reset to Ready each), leaving
+        the field as it was.
+
+        Args:
+            slots: 16 for 16-slot inventories, 1 for single slot
+            reset: Reset the found tags to ready at the end. Defaults to True.
+            empty_cycles: Consecutive cycles without a new tag that end the search. The reader does not
+                report collisions, so raise it if a cycle in which every remaining tag collided is likely.
+            max_cycles: Stop after this many inventory cycles even if tags still answer
+            afi: Only inventory tags of this Application Family Identifier
+
+        Returns:
+            RRHFOEM04Result: On success `data` is a dict with 'uids' (in discovery order),
+                'cycles' (inventories sent) and 'commands' (round-trips, inventories included)
+        """
+        found: List[bytes] = []
+        try:
+            if empty_cycles < 1:
+                raise ValueError("empty_cycles must be at least 1")
+            frame = self._iso15693_inventory_frame(slots, afi)
+
+            seen = set()
+            cycles = commands = empty = 0
+            while cycles < max_cycles:
+                uids = self._iso15693_inventory(frame)
+                cycles += 1
+                commands += 1
+                if uids is None:
+                    raise CommandError("Inventory cycle failed")
+                new = [bytes(uid) for uid in uids if bytes(uid) not in seen]
+                if not new:
+                    empty += 1
+                    if empty >= empty_cycles:
+                        break
+                    continue
+                empty = 0
+                for uid in new:
+                    seen.add(uid)
+                    found.append(uid)
+                    commands += 1
+                    # A tag that cannot be silenced still counts as found; it will answer again
+                    self._iso15693_state_command('ISO15693_STAY_QUIET', uid[::-1])
+            else:
+                self.logger.warning("Exhaustive inventory stopped after %s cycles", max_cycles)
+
+            if reset:
+                self._iso15693_wake(found)
+                commands += len(found)
+
+            return RRHFOEM04Result(success=True, message="Operation Successful",
+                                   data={'uids': [self._format_bytes(uid) for uid in found],
+                                         'cycles': cycles, 'commands': commands})
+
+        except Exception as e:
+            if reset:
+                self._iso15693_wake(found)
+            self.logger.error("Error in exhaustive inventory: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
 
     def ISO15693_readSingleBlock(self, block_number: int, block_size: int = 4, with_select_flag: bool = False, uid: str = None) -> RRHFOEM04Result:
@@ -444,29 +1083,33 @@ class RRHFOEM04:
             if not 0 <= block_number <= 255:
                 raise ValueError("Block number must be between 0 and 255")
             
+            # Only addressed reads can be cached: otherwise the responding tag is unknown
+            if self.block_cache is not None and uid:
+                block_data = self.block_cache.get(uid, block_number, block_size)
+                if block_data is not None:
+                    return RRHFOEM04Result(success=True, message="Operation Successful",
+                                           data=self._format_bytes(block_data[::-1]))
+
             # Build command based on addressing mode
-            if uid:
-                uid_bytes = bytes.fromhex(uid)[::-1]  # Convert to little-endian
-                cmd = CMD_ISO15693_READ_SINGLE_BLOCK_WITH_ADDRESS_FLAG.copy()
-                cmd.extend([*uid_bytes])
-            else:
-                cmd = (CMD_ISO15693_READ_SINGLE_BLOCK_WITH_SELECT_FLAG.copy() 
-                      if with_select_flag else CMD_ISO15693_READ_SINGLE_BLOCK.copy())
-                
-            cmd.extend([block_size, block_number])
+            cmd = self._iso15693_frame('ISO15693_READ_SINGLE_BLOCK', with_select_flag, uid,
+                                       block_size, block_number)
 
             response = self._send_command(cmd)
-            if response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"Read operation failed: {response[3:5]}")
-                return RRHFOEM04Result(success=False, message="Operation Failed")
-            
-            # Extract and reverse block data (convert from little-endian)
-            block_data = response[6:6 + block_size]
+            if response is None or not response.ok:
+                self.logger.error("Read operation failed: %s", status_text(response))
+                return self._response_result(False, "Operation Failed", response)
+
+            # Byte 0 is the flags byte
+            block_data = response.payload[1:1 + block_size]
+            if self.block_cache is not None and uid:
+                self.block_cache.put(uid, block_number, block_data)
 
-            return RRHFOEM04Result(success=True, message="Operation Successful", data=''.join(block_data[::-1]))
+            # Reverse block data (convert from little-endian) on first access to `data`
+            return self._response_result(True, "Operation Successful", response,
+                                         decode=functools.partial(self._format_bytes, block_data[::-1]))
 
         except Exception as e:
-            self.logger.error(f"Error in ISO15693_readSingleBlock: {str(e)}")
+            self.logger.error("Error in ISO15693_readSingleBlock: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
 
     def ISO15693_writeSingleBlock(self, block_number: int, data: str, block_size: int = 4, with_select_flag: bool = False, uid: str = None) -> RRHFOEM04Result:
@@ -485,7 +1128,8 @@ class RRHFOEM04:
         
         Args:
             block_number: Target memory block (0-255)
-            data: Data to write (will be encoded as UTF-8)
+            data: Data to write (will be encoded as UTF-8); shorter data is zero-padded,
+                longer data is rejected (use `ISO15693_writeMultipleBlocks`)
             block_size: Size of memory block in bytes (default 4)
             with_select_flag: Use select flag for previously selected tag
             uid: Target specific tag by UID
@@ -503,29 +1147,25 @@ class RRHFOEM04:
             # Pad data bytes if necessary
             if data_bytes and len(data_bytes) < block_size:
                 data_bytes = data_bytes.ljust(block_size, b'\x00')
+            # Anything else would reach (and be cached for) neighbouring blocks
+            if len(data_bytes) != block_size:
+                raise ValueError(f"Data of {len(data_bytes)} bytes does not fill one {block_size}-byte block")
             
-            # Select appropriate command based on addressing mode
-            if uid:
-                uid_bytes = bytes.fromhex(uid)[::-1]  # Convert to little-endian
-                cmd = CMD_ISO15693_WRITE_SINGLE_BLOCK_WITH_ADDRESS_FLAG.copy()
-                cmd.extend([*uid_bytes])
-            else:
-                cmd = (CMD_ISO15693_WRITE_SINGLE_BLOCK_WITH_SELECT_FLAG.copy()
-                      if with_select_flag else CMD_ISO15693_WRITE_SINGLE_BLOCK.copy())
-                
-            # Update command length and append write parameters
-            cmd[0] += block_size  # Adjust command length byte
-            cmd.extend([block_size, block_number, *data_bytes])
+            # Select appropriate command based on addressing mode and append write parameters
+            cmd = self._iso15693_frame('ISO15693_WRITE_SINGLE_BLOCK', with_select_flag, uid,
+                                       block_size, block_number, data_bytes)
 
+            self._update_block_cache(uid, block_number, data_bytes, block_size, written=False)
             response = self._send_command(cmd)
-            if response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"Write operation failed with status: {response[3:5]}")
-                raise CommandError(f"Write operation failed with status: {response[3:5]}")
+            if response is None or not response.ok:
+                self.logger.error("Write operation failed with status: %s", status_text(response))
+                raise CommandError(f"Write operation failed with status: {status_text(response)}")
+            self._update_block_cache(uid, block_number, data_bytes, block_size, written=True)
 
-            return RRHFOEM04Result(success=True, message="Operation Successful")
+            return self._response_result(True, "Operation Successful", response)
 
         except Exception as e:
-            self.logger.error(f"Error in ISO15693_writeSingleBlock: {str(e)}")
+            self.logger.error("Error in ISO15693_writeSingleBlock: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
 
     def ISO15693_readMultipleBlocks(self, start_block_number: int, total_blocks: int = 5, block_size: int = 4, with_select_flag: bool = False, uid: str = None) -> RRHFOEM04Result:
@@ -573,42 +1213,28 @@ class RRHFOEM04:
             # Ensure total blocks won't exceed memory boundaries
             if not 0 <= start_block_number + total_blocks <= 256:
                 raise ValueError(f"Cannot read {total_blocks} blocks starting at {start_block_number}")
-            
-            # Select appropriate command based on addressing mode
-            if uid:
-                # Convert UID to bytes in little-endian format
-                uid_bytes = bytes.fromhex(uid)[::-1]
-                cmd = CMD_ISO15693_READ_MULTIPLE_BLOCKS_WITH_ADDRESS_FLAG.copy()
-                cmd.extend([*uid_bytes])
-            else:
-                cmd = (CMD_ISO15693_READ_MULTIPLE_BLOCKS_WITH_SELECT_FLAG.copy()
-                      if with_select_flag else CMD_ISO15693_READ_MULTIPLE_BLOCKS.copy())
-            
-            # Append read parameters to command
-            cmd.extend([block_size, start_block_number, total_blocks])
 
-            response = self._send_command(cmd)
-            if response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"Multiple block read failed: {response[3:5]}")
-                return RRHFOEM04Result(success=False, message="Operation Failed")
-            
-            # Process the multi-block response
-            # Skip first 6 bytes (command header and status)
-            # Each block's data needs to be byte-reversed due to little-endian format
-            block_data = response[6:6 + (block_size * (total_blocks + 1))]
-            
-            # Process each block individually to maintain proper byte ordering
-            data_blocks = []
-            for i in range(0, len(block_data), block_size):
-                # Extract and reverse each block's bytes
-                block = block_data[i:i + block_size]
-                data_blocks.append(''.join(block[::-1]))
-            
-            # Concatenate all blocks into final result
-            return RRHFOEM04Result(success=True, message="Operation Successful", data=''.join(data_blocks)) 
+            # The reader returns total_blocks + 1 blocks
+            block_data = self._cached_blocks(uid, start_block_number, total_blocks + 1, block_size)
+            if block_data is not None:
+                return RRHFOEM04Result(success=True, message="Operation Successful",
+                                       data=self._format_blocks(block_data, block_size))
+
+            response = self._iso15693_read_blocks_response(start_block_number, total_blocks + 1, block_size,
+                                                           with_select_flag, uid)
+            if response is None or not response.ok:
+                return self._response_result(False, "Operation Failed", response)
+            # Skip the flags byte that precedes the block data
+            block_data = response.payload[1:1 + block_size * (total_blocks + 1)]
+            if self.block_cache is not None and uid:
+                self.block_cache.put_blocks(uid, start_block_number, block_data, block_size)
+
+            # Each block's data is byte-reversed (little-endian) on first access to `data`
+            return self._response_result(True, "Operation Successful", response,
+                                         decode=functools.partial(self._format_blocks, block_data, block_size))
 
         except Exception as e:
-            self.logger.error(f"Error in multiple block read: {str(e)}")
+            self.logger.error("Error in multiple block read: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
         
     def ISO15693_writeMultipleBlocks(self, start_block_number: int, data: str, block_size: int = 4, with_select_flag: bool = False, uid: str = None) -> RRHFOEM04Result:
@@ -641,31 +1267,12 @@ class RRHFOEM04:
             if padding_length > 0:
                 data_bytes = data_bytes + (b'\x00' * padding_length)
 
-            total_blocks = len(data_bytes) // block_size
-
-            # Prepare base command structure
-            if uid:
-                uid_bytes = bytes.fromhex(uid)[::-1]
-                cmd = CMD_ISO15693_WRITE_MULTIPLE_BLOCK_WITH_ADDRESS_FLAG.copy()
-                cmd.extend([*uid_bytes])
-            else:
-                cmd = (CMD_ISO15693_WRITE_MULTIPLE_BLOCK_WITH_SELECT_FLAG.copy()
-                      if with_select_flag else CMD_ISO15693_WRITE_MULTIPLE_BLOCK.copy())
-            
-            cmd[0] += len(data_bytes)  # Adjust command length
-
-            cmd.extend([block_size, start_block_number, total_blocks, *data_bytes])
-
-            response = self._send_command(cmd)
-
-            if response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"Write operation failed with status: {response[3:5]}")
-                raise CommandError(f"Write operation failed with status: {response[3:5]}")
+            self._iso15693_write_blocks(start_block_number, data_bytes, block_size, with_select_flag, uid)
 
             return RRHFOEM04Result(success=True, message="Operation Succesful")
 
         except Exception as e:
-            self.logger.error(f"Error in ISO15693_writeMultipleBlocks: {str(e)}")
+            self.logger.error("Error in ISO15693_writeMultipleBlocks: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
         
     def ISO15693_writeAFI(self, afi: int, with_select_flag: bool = False, uid: str = None) -> RRHFOEM04Result:
@@ -691,34 +1298,383 @@ class RRHFOEM04:
             if not 0 <= afi <= 255:
                 raise ValueError("AFI must be an integer between 0 and 255.")
             
-            # Convert AFI to a single byte for ISO15693 operations
-            afi_byte = afi.to_bytes(1, byteorder="little")
-            
-            # Select appropriate command based on addressing mode
-            if uid:
-                uid_bytes = bytes.fromhex(uid)[::-1]  # Convert to little-endian
-                cmd = CMD_ISO15693_WRITE_AFI_WITH_ADDRESS_FLAG.copy()
-                cmd.extend([*uid_bytes])
-            else:
-                cmd = (CMD_ISO15693_WRITE_AFI_WITH_SELECT_FLAG.copy()
-                      if with_select_flag else CMD_ISO15693_WRITE_AFI.copy())
-                
-            # append write parameters
-            cmd.extend([*afi_byte])
+            # Select appropriate command based on addressing mode and append the AFI byte
+            cmd = self._iso15693_frame('ISO15693_WRITE_AFI', with_select_flag, uid, afi)
 
             response = self._send_command(cmd)
-            if response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"AFI Write operation failed with status: {response[3:5]}")
-                raise CommandError(f"AFI Write operation failed with status: {response[3:5]}")
+            if response is None or not response.ok:
+                self.logger.error("AFI Write operation failed with status: %s", status_text(response))
+                raise CommandError(f"AFI Write operation failed with status: {status_text(response)}")
 
-            return RRHFOEM04Result(success=True, message="Operation Successful")
+            info = self.tag_registry.get(uid) if uid else None
+            if info is not None:
+                info.afi = afi
+
+            return self._response_result(True, "Operation Successful", response)
 
         except Exception as e:
-            self.logger.error(f"Error in ISO15693_writeAFI: {str(e)}")
+            self.logger.error("Error in ISO15693_writeAFI: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
         
+    def ISO15693_getSystemInfo(self, with_select_flag: bool = False, uid: Optional[str] = None,
+                               refresh: bool = False) -> RRHFOEM04Result:
+        """
+        Get the system information (DSFID, AFI, memory geometry, IC reference) of an ISO15693 tag.
+
+        Answers are stored in `tag_registry`. An addressed request for a tag
+        already registered is answered from the registry unless `refresh` is set.
+
+        Args:
+            with_select_flag: Use select flag mode
+            uid: Target specific tag by UID
+            refresh: Query the tag even if it is registered
+
+        Returns:
+            RRHFOEM04Result: On success `data` is a `TagInfo` (fields the tag does not report are None)
+        """
+        try:
+            if uid and not refresh:
+                info = self.tag_registry.get(uid)
+                if info is not None:
+                    return RRHFOEM04Result(success=True, message="Operation Successful", data=info)
+
+            cmd = self._iso15693_frame('ISO15693_GET_SYSTEM_INFO', with_select_flag, uid)
+
+            response = self._send_command(cmd)
+            if response is None or not response.ok:
+                self.logger.error("Get System Information failed: %s", status_text(response))
+                return self._response_result(False, "Operation Failed", response)
+
+            info = self.tag_registry.put(parse_system_info(response.payload))
+            return self._response_result(True, "Operation Successful", response, data=info)
+
+        except Exception as e:
+            self.logger.error("Error in ISO15693_getSystemInfo: %s", e)
+            return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
+
+    def _tag_geometry(self, uid: Optional[str], block_size: Optional[int],
+                      end: Optional[int]) -> Tuple[int, Optional[int]]:
+        """
+        Resolve the block size and end block of a memory operation.
+
+        Missing values come from the tag's registered system information, which is
+        queried once if the tag is not registered yet. Without a UID (or when the
+        tag does not report its memory size) the block size defaults to
+        `DEFAULT_BLOCK_SIZE` and the end stays unknown (None).
+        """
+        if block_size is not None and end is not None:
+            return block_size, end
+        info = None
+        if uid:
+            result = self.ISO15693_getSystemInfo(uid=uid)
+            if result.success:
+                info = result.data
+        if block_size is None:
+            block_size = info.block_size if info is not None and info.block_size else DEFAULT_BLOCK_SIZE
+        if end is None and info is not None:
+            end = info.block_count
+        return block_size, end
+
+    def iter_memory(self, uid: Optional[str], start: int = 0, end: Optional[int] = None,
+                    block_size: Optional[int] = None, with_select_flag: bool = False,
+                    chunk_blocks: Optional[int] = None) -> Iterator[Tuple[int, memoryview]]:
+        """
+        Stream blocks `start` to `end - 1` of an ISO15693 tag in as few commands as possible.
+
+        The range is split into the largest chunks whose response fits in one
+        frame (`MAX_FRAME_LENGTH`), each read with a single Read Multiple Blocks
+        command. Data is yielded in tag memory order, exactly as written by
+        `ISO15693_writeMultipleBlocks` (blocks are not byte-reversed).
+
+        `block_size` and `end` default to the tag's geometry from `tag_registry`
+        (see `ISO15693_getSystemInfo()`), so a tag is queried at most once.
+
+        Args:
+            uid: Target specific tag by UID (None for the non-addressed / selected tag)
+            start: First block to read
+            end: Block after the last one to read (exclusive). Defaults to the tag's block count.
+            block_size: Size of each memory block in bytes. Defaults to the tag's block size
+                (`DEFAULT_BLOCK_SIZE` if unknown).
+            with_select_flag: Use select flag mode (when no UID is given)
+            chunk_blocks: Upper limit on blocks per command, for tags that accept fewer than the frame allows
+
+        Yields:
+            Tuple[int, memoryview]: First block number of the chunk and a read-only view of its data
+
+        Raises:
+            ValueError: If the range or chunk size is invalid, or the end is not given and unknown
+            CommandError: If a chunk cannot be read
+        """
+        block_size, end = self._tag_geometry(uid, block_size, end)
+        if end is None:
+            raise ValueError("Memory size of the tag is unknown, give the end block")
+        if not 0 <= start <= end <= 256:
+            raise ValueError(f"Invalid block range {start}-{end}")
+        max_blocks = (MAX_FRAME_LENGTH - 6) // block_size
+        if chunk_blocks is not None:
+            if chunk_blocks < 1:
+                raise ValueError("chunk_blocks must be at least 1")
+            max_blocks = min(max_blocks, chunk_blocks)
+
+        block = start
+        while block < end:
+            count = min(max_blocks, end - block)
+            data = self._iso15693_read_blocks(block, count, block_size, with_select_flag, uid)
+            if data is None:
+                raise CommandError(f"Failed to read blocks {block}-{block + count - 1}")
+            yield block, data
+            block += count
+
+    def read_memory(self, uid: Optional[str], start: int = 0, end: Optional[int] = None,
+                    block_size: Optional[int] = None, out: Optional[Union[bytearray, memoryview]] = None,
+                    with_select_flag: bool = False, chunk_blocks: Optional[int] = None) -> RRHFOEM04Result:
+        """
+        Read blocks `start` to `end - 1` of an ISO15693 tag into one buffer.
+
+        Uses the chunking of `iter_memory()`; each chunk is copied straight into
+        the buffer without hex conversion.
+
+        Args:
+            uid: Target specific tag by UID (None for the non-addressed / selected tag)
+            start: First block to read
+            end: Block after the last one to read (exclusive). Defaults to the tag's block count.
+            block_size: Size of each memory block in bytes. Defaults to the tag's block size.
+            out: Writable buffer of at least `(end - start) * block_size` bytes to fill in place.
+                A new `bytearray` is allocated if omitted.
+            with_select_flag: Use select flag mode (when no UID is given)
+            chunk_blocks: Upper limit on blocks per command
+
+        Returns:
+            RRHFOEM04Result: On success `data` is the filled buffer, in tag memory order
+        """
+        try:
+            block_size, end = self._tag_geometry(uid, block_size, end)
+            if end is None:
+                raise ValueError("Memory size of the tag is unknown, give the end block")
+            size = (end - start) * block_size
+            if out is None:
+                out = bytearray(size)
+            elif len(out) < size:
+                raise ValueError(f"Buffer of {len(out)} bytes cannot hold {size} bytes")
+
+            with memoryview(out) as view:
+                for block, data in self.iter_memory(uid, start, end, block_size, with_select_flag, chunk_blocks):
+                    offset = (block - start) * block_size
+                    view[offset:offset + len(data)] = data
+
+            return RRHFOEM04Result(success=True, message="Operation Successful", data=out)
+
+        except Exception as e:
+            self.logger.error("Error in read_memory: %s", e)
+            return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
+
+    def write_memory_diff(self, uid: Optional[str], start: int, data: Union[bytes, bytearray, memoryview],
+                          block_size: Optional[int] = None, with_select_flag: bool = False,
+                          verify: bool = True, chunk_blocks: Optional[int] = None) -> RRHFOEM04Result:
+        """
+        Write a block range of an ISO15693 tag, sending only the blocks that changed.
+
+        The current contents are read in bulk with `read_memory()` and compared
+        block by block. Adjacent changed blocks are coalesced into runs, and each
+        run is written with as few Write Multiple Blocks commands as one report
+        allows. With `verify`, the range is read back once and compared.
+
+        Args:
+            uid: Target specific tag by UID (None for the non-addressed / selected tag)
+            start: First block to write
+            data: New contents in tag memory order (zero-padded to whole blocks)
+            block_size: Size of each memory block in bytes. Defaults to the tag's block size.
+            with_select_flag: Use select flag mode (when no UID is given)
+            verify: Read the range back after writing and compare it to `data`
+            chunk_blocks: Upper limit on blocks per read command (see `iter_memory()`)
+
+        Returns:
+            RRHFOEM04Result: On success `data` is a dict with 'blocks_written' and 'frames' sent
+        """
+        try:
+            block_size, _ = self._tag_geometry(uid, block_size, None)
+            padding_length = (block_size - len(data) % block_size) % block_size
+            data = bytes(data) + b'\x00' * padding_length
+            end = start + len(data) // block_size
+
+            current = self.read_memory(uid, start, end, block_size, with_select_flag=with_select_flag,
+                                       chunk_blocks=chunk_blocks)
+            if not current.success:
+                return RRHFOEM04Result(success=False, message=f"Read before write failed: {current.message}")
+
+            # Runs of changed blocks as (first block, block count)
+            runs = []
+            for i in range(end - start):
+                offset = i * block_size
+                if current.data[offset:offset + block_size] != data[offset:offset + block_size]:
+                    if runs and runs[-1][0] + runs[-1][1] == start + i:
+                        runs[-1][1] += 1
+                    else:
+                        runs.append([start + i, 1])
+
+            # Every frame, parameters included, must fit in one report
+            header_size = len(CMD_ISO15693_WRITE_MULTIPLE_BLOCK) + (8 if uid else 0) + 3
+            max_blocks = (BUFFER_SIZE - header_size - 2) // block_size
+
+            blocks_written = frames = 0
+            with memoryview(data) as view:
+                for first, count in runs:
+                    for block in range(first, first + count, max_blocks):
+                        n = min(max_blocks, first + count - block)
+                        offset = (block - start) * block_size
+                        self._iso15693_write_blocks(block, view[offset:offset + n * block_size], block_size,
+                                                    with_select_flag, uid)
+                        blocks_written += n
+                        frames += 1
+
+            if verify and frames:
+                written = self.read_memory(uid, start, end, block_size, with_select_flag=with_select_flag,
+                                           chunk_blocks=chunk_blocks)
+                if not written.success or written.data != data:
+                    self.logger.error("Verification after differential write failed")
+                    return RRHFOEM04Result(success=False, message="Verification Failed")
+
+            return RRHFOEM04Result(success=True, message="Operation Successful",
+                                   data={'blocks_written': blocks_written, 'frames': frames})
+
+        except Exception as e:
+            self.logger.error("Error in write_memory_diff: %s", e)
+            return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
+
+    def stream_inventory(self, slots: int = 16, debounce: int = INVENTORY_DEBOUNCE, emit_present: bool = True,
+                         cycle_interval: float = 0.0, max_cycles: Optional[int] = None,
+                         duration: Optional[float] = None, afi: Optional[int] = None) -> Iterator[InventoryEvent]:
+        """
+        Run ISO15693 inventories back to back and yield presence events.
+
+        Cycles run as fast as the pacer allows (use `pacing="adaptive"` for the
+        fastest safe pace). The set of present tags is kept incrementally by an
+        `InventoryTracker`: a tag yields ARRIVAL in the first cycle it answers,
+        PRESENT in every later cycle it answers (if `emit_present`), and
+        DEPARTURE after `debounce` consecutive cycles without answering. A
+        cycle that fails (error status, no response) counts as a cycle with no
+        tags. Stop by leaving the loop, or with `max_cycles` / `duration`.
+
+        Args:
+            slots: 16 for 16-slot inventories, 1 for single slot
+            debounce: Consecutive missed cycles before a departure
+            emit_present: Yield PRESENT events for tags that are still in the field
+            cycle_interval: Minimum time in seconds between cycle starts
+            max_cycles: Stop after this many cycles
+            duration: Stop after this many seconds
+            afi: Only track tags of this Application Family Identifier
+
+        Yields:
+            InventoryEvent: Events with monotonic timestamps and the latency of their cycle
+        """
+        # Own copy: a codec buffer could be rebuilt by calls made between cycles
+        frame = bytes(self._iso15693_inventory_frame(slots, afi))
+        tracker = InventoryTracker(debounce, emit_present)
+        started = time.monotonic()
+
+        while max_cycles is None or tracker.cycle < max_cycles:
+            cycle_start = time.monotonic()
+            if duration is not None and cycle_start - started >= duration:
+                return
+            try:
+                uids = self._iso15693_inventory(frame) or []
+            except CommunicationError as e:
+                self.logger.warning("Inventory cycle failed: %s", e)
+                uids = []
+            now = time.monotonic()
+
+            yield from tracker.update([bytes(uid) for uid in uids], now, now - cycle_start, self._format_bytes)
+
+            remaining = cycle_interval - (time.monotonic() - cycle_start)
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def watch_inventory(self, callback: Callable[[InventoryEvent], object], **kwargs) -> None:
+        """
+        Callback form of `stream_inventory()`: call `callback` for every event.
+
+        Runs until `max_cycles` / `duration` (passed through `kwargs`) is reached,
+        or until the callback returns False.
+        """
+        for event in self.stream_inventory(**kwargs):
+            if callback(event) is False:
+                return
+
     # === ISO14443A Protocol Implementation ===
 
+    def _mifare_session_covers(self, uid: str, block_number: int) -> bool:
+        """Return True if `block_number` lies in the sector already authenticated on the selected card `uid`."""
+        return (self._mifare_auth_sector is not None and self._mifare_selected_uid == uid
+                and sector_of(block_number) == self._mifare_auth_sector)
+
+    def _end_mifare_session(self) -> None:
+        """Forget the authenticated sector (after a select, an error or losing the card)."""
+        self._mifare_auth_sector = None
+
+    def _mifare_exchange(self, uid: str, block_number: int, cmd: bytes) -> Optional[RawResponse]:
+        """
+        Send a Mifare block command, authenticating the block's sector first unless it already is.
+
+        A failed command ends the session. If it ran on a reused session, which the
+        card may have dropped (e.g. after briefly leaving the field), the sector is
+        authenticated again and the command retried once.
+
+        Raises:
+            AuthenticationError, TagError: If the sector cannot be authenticated
+        """
+        reused = self._mifare_session_covers(uid, block_number)
+        if not reused:
+            self._mifare_authenticate_block(uid, block_number)
+        response = self._send_command(cmd)
+        if response is not None and response.ok:
+            return response
+
+        self._end_mifare_session()
+        if not reused:
+            return response
+        self.logger.debug("Sector session on %s lost, authenticating again", uid)
+        self._mifare_authenticate_block(uid, block_number)
+        response = self._send_command(cmd)
+        if response is None or not response.ok:
+            self._end_mifare_session()
+        return response
+
+    def _mifare_authenticate_block(self, uid: str, block_number: int) -> None:
+        """Authenticate the sector of `block_number` with `mifare_keys` if configured, else the default key A."""
+        if self.mifare_keys is not None:
+            self.ISO14443A_mifareAuthenticateWithKeys(uid, block_number, self.mifare_keys)
+        else:
+            self.ISO14443A_mifareAuthenticate(uid=uid, block_number=block_number)
+
+    def _mifare_read_block(self, uid: str, block_number: int) -> Optional[memoryview]:
+        """Read one block of card `uid` (authenticating its sector if needed); None if the read fails."""
+        cmd = self._codec.build('ISO14443A_MIFARE_READ', block_number)
+        response = self._mifare_exchange(uid, block_number, cmd)
+        if response is None or not response.ok:
+            self.logger.error("Read operation failed: %s", status_text(response))
+            return None
+
+        # Extract 16 bytes of block data
+        block_data = response.payload[:MIFARE_BLOCK_SIZE]
+        if self.block_cache is not None:
+            self.block_cache.put(uid, block_number, block_data)
+        return block_data
+
+    def _mifare_write_block(self, uid: str, block_number: int, data: Union[bytes, memoryview]) -> None:
+        """
+        Write one 16-byte block of card `uid` (authenticating its sector if needed).
+
+        Raises:
+            CommandError: If the card rejects the write
+        """
+        cmd = self._codec.build('ISO14443A_MIFARE_WRITE', block_number, data)
+        self._update_block_cache(uid, block_number, data, MIFARE_BLOCK_SIZE, written=False)
+        response = self._mifare_exchange(uid, block_number, cmd)
+        if response is None or not response.ok:
+            self.logger.error("Write operation failed with status: %s", status_text(response))
+            raise CommandError(f"Write operation failed with status: {status_text(response)}")
+        self._update_block_cache(uid, block_number, data, MIFARE_BLOCK_SIZE, written=True)
+
     def ISO14443A_Inventory(self) -> RRHFOEM04Result:
         """
         Perform an ISO14443A inventory scan to detect nearby cards.
@@ -736,22 +1692,25 @@ class RRHFOEM04:
             RRHFOEM04Result: A RRHFOEM04Result object containing success status, message and response data
         """
         try:
-            response = self._send_command(CMD_ISO14443A_INVENTORY)
+            # Inventory re-selects the card, which drops any authenticated sector
+            self._end_mifare_session()
+            response = self._send_command(self._codec.frame('ISO14443A_INVENTORY'))
 
-            if response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"Inventory scan failed: {response[3:5]}")
-                return RRHFOEM04Result(success=False, message="Operation Failed")
+            if response is None or not response.ok:
+                self.logger.error("Inventory scan failed: %s", status_text(response))
+                return self._response_result(False, "Operation Failed", response)
 
             # Extract UID length and data
-            uid_length = int(response[5])
-            uid = ''.join(response[6:6 + uid_length])
+            payload = response.payload
+            uid_length = payload[0]
+            uid = payload[1:1 + uid_length]
             
             # the tag is autoselected on inventory
-            self._mifare_selected_uid = uid
-            return RRHFOEM04Result(success=True, message="Operation Successful", data=uid)
+            self._mifare_selected_uid = uid.hex().upper()
+            return self._response_result(True, "Operation Successful", response, data=self._format_bytes(uid))
             
         except Exception as e:
-            self.logger.error(f"Error in ISO14443A inventory scan: {str(e)}")
+            self.logger.error("Error in ISO14443A inventory scan: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
 
     def ISO14443A_selectCard(self, uid: str, uid_length: int = 4) -> RRHFOEM04Result:
@@ -780,23 +1739,23 @@ class RRHFOEM04:
             uid_bytes = bytes.fromhex(uid)
 
             # Prepare and send select command
-            cmd = CMD_ISO14443A_SELECT_CARD.copy()
-            cmd.extend([uid_length, *uid_bytes])
+            cmd = self._codec.build('ISO14443A_SELECT_CARD', uid_length, uid_bytes)
+            self._end_mifare_session()
             response = self._send_command(cmd)
 
-            if not response:
+            if response is None:
                 self.logger.error("No response from card during selection")
                 return RRHFOEM04Result(success=False, message="No Response")
                 
-            if response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"Card selection failed: {response[3:5]}")
-                return RRHFOEM04Result(success=False, message="Operation Failed")
+            if not response.ok:
+                self.logger.error("Card selection failed: %s", status_text(response))
+                return self._response_result(False, "Operation Failed", response)
 
             self._mifare_selected_uid = uid
-            return RRHFOEM04Result(success=True, message="Operation Successful")
+            return self._response_result(True, "Operation Successful", response)
     
         except Exception as e:
-            self.logger.error(f"Error in card selection: {str(e)}")
+            self.logger.error("Error in card selection: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
 
     def ISO14443A_mifareAuthenticate(self, uid: str, block_number: int, key_type: str = 'A', key: str = "FFFFFFFFFFFF") -> RRHFOEM04Result:
@@ -854,38 +1813,89 @@ class RRHFOEM04:
                     self.logger.error("Card not present or cannot be selected")
                     raise TagError("Card not present or cannot be selected")
                 
-                # Update selected card and clear previous authentication cache
                 self._mifare_selected_uid = uid
-                self._mifare_auth_blocks.clear()
 
             # Build authentication command:
             # [Command][UID][Block][KeyType][Key]
-            cmd = CMD_ISO14443A_MIFARE_AUTHENTICATE.copy()
-            cmd.extend([*uid_bytes, block_number, key_type_byte, *key_bytes])
-            
+            cmd = self._codec.build('ISO14443A_MIFARE_AUTHENTICATE', uid_bytes, block_number, key_type_byte, key_bytes)
+
+            # The card leaves any previous session as soon as it sees a new authentication
+            self._end_mifare_session()
             response = self._send_command(cmd)
             
-            if not response:
+            if response is None:
+                self._mifare_selected_uid = None
                 self.logger.error("No response during authentication")
                 raise AuthenticationError("No response during authentication")
                 
-            if response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"Authentication failed with status: {response[3:5]}")
-                raise AuthenticationError(f"Authentication failed with status: {response[3:5]}")
-
-            # Cache successful authentication
-            if uid not in self._mifare_auth_blocks:
-                self._mifare_auth_blocks[uid] = set()
-            self._mifare_auth_blocks[uid].add(block_number)
-            
+            if not response.ok:
+                # A card that rejects a key halts and must be selected again
+                self._mifare_selected_uid = None
+                self.logger.error("Authentication failed with status: %s", status_text(response))
+                raise AuthenticationError(f"Authentication failed with status: {status_text(response)}")
+
+            # The whole sector stays accessible until the next select, authentication or error
+            self._mifare_auth_sector = sector_of(block_number)
+
             return RRHFOEM04Result(success=True, message="Operation Successful")
             
         except (ValidationError, TagError, AuthenticationError):
             raise
         except Exception as e:
-            self.logger.error(f"Unexpected error during authentication: {str(e)}")
+            self.logger.error("Unexpected error during authentication: %s", e)
             raise AuthenticationError(f"Unexpected error during authentication: {str(e)}")
 
+    def ISO14443A_mifareAuthenticateWithKeys(self, uid: str, block_number: int,
+                                             keys: Optional[MifareKeyDictionary] = None,
+                                             card_type: Optional[str] = None) -> RRHFOEM04Result:
+        """
+        Authenticate a block's sector by trying the keys of a key dictionary.
+
+        The key that opened this sector of this card before is tried first, then the
+        one that opened it on a card of the same type, then the other candidates (as
+        key A and key B) in order of past success on the sector. The key that works
+        is recorded in the dictionary and its file, if any, is saved; within
+        `iter_card()` (and so `dump_card()` / `restore_card()`) the file is saved
+        once, when the walk ends.
+
+        Args:
+            uid: Card's unique identifier in hex format
+            block_number: Memory block whose sector to authenticate (0-255)
+            keys: Key dictionary to use. Defaults to `mifare_keys`, or a dictionary of well-known keys.
+            card_type: Card type label for the key dictionary (e.g. "1K", "4K" or an issuer).
+                Defaults to the type passed to `iter_card()` while it runs.
+
+        Returns:
+            RRHFOEM04Result: Successful result with data `{'key_type': 'A' | 'B', 'key': hex string}`
+
+        Raises:
+            ValidationError: If parameters are invalid
+            AuthenticationError: If no key of the dictionary is accepted
+            TagError: If card is not present or responsive
+        """
+        if keys is None:
+            keys = self.mifare_keys if self.mifare_keys is not None else MifareKeyDictionary()
+        if not 0 <= block_number <= 255:
+            raise ValidationError("Block number must be between 0 and 255")
+
+        if card_type is None:
+            card_type = self._mifare_card_type
+        sector = sector_of(block_number)
+        for key_type, key in keys.candidates(uid, sector, card_type):
+            try:
+                self.ISO14443A_mifareAuthenticate(uid, block_number, key_type, key)
+            except AuthenticationError:
+                self.logger.debug("Key %s rejected for sector %s", key_type, sector)
+                continue
+            keys.record_success(uid, sector, key_type, key, card_type)
+            if self._mifare_card_type is None:
+                keys.flush()
+            return RRHFOEM04Result(success=True, message="Operation Successful",
+                                   data={'key_type': key_type, 'key': key})
+
+        self.logger.error("No key in the dictionary opens sector %s", sector)
+        raise AuthenticationError(f"No key in the dictionary opens sector {sector}")
+
     def ISO14443A_mifareRead(self, uid: Optional[str] = None, block_number: int = 0) -> RRHFOEM04Result:
         """
         Read a block from an authenticated Mifare Classic card.
@@ -912,29 +1922,23 @@ class RRHFOEM04:
                 inventory_result = self.ISO14443A_Inventory()
                 if not inventory_result.success or not inventory_result.data:
                     return RRHFOEM04Result(success=False, message="No card found")
-                uid = inventory_result.data          
-            
-            # Authenticate block before reading
-            auth_result = self.ISO14443A_mifareAuthenticate(uid=uid, block_number=block_number)
-            if not auth_result.success:
-                return RRHFOEM04Result(success=False, message="Mifare Authenticate Failed")
+                uid = self._mifare_selected_uid
             
-            # Prepare and send read command
-            cmd = CMD_ISO14443A_MIFARE_READ.copy()
-            cmd.append(block_number)
-
-            response = self._send_command(cmd)
-            if response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"Read operation failed: {response[3:5]}")
+            if self.block_cache is not None:
+                block_data = self.block_cache.get(uid, block_number, MIFARE_BLOCK_SIZE)
+                if block_data is not None:
+                    return RRHFOEM04Result(success=True, message="Operation Successful",
+                                           data=self._format_bytes(block_data))
+
+            block_data = self._mifare_read_block(uid, block_number)
+            if block_data is None:
                 return RRHFOEM04Result(success=False, message="Operation Failed")
 
-            # Extract 16 bytes of block data
-            block_data = response[5:5 + MIFARE_BLOCK_SIZE]
-
-            return RRHFOEM04Result(success=True, message="Operation Successful", data=''.join(block_data))
+            return RRHFOEM04Result(success=True, message="Operation Successful", data=self._format_bytes(block_data))
         
         except Exception as e:
-            self.logger.error(f"Error reading Mifare block: {str(e)}")
+            self._end_mifare_session()
+            self.logger.error("Error reading Mifare block: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
     
     def ISO14443A_mifareWrite(self, data: str, uid: Optional[str] = None, block_number: int = 1) -> RRHFOEM04Result:
@@ -973,29 +1977,178 @@ class RRHFOEM04:
                 inventory_result = self.ISO14443A_Inventory()
                 if not inventory_result.success or not inventory_result.data:
                     return RRHFOEM04Result(success=False, message="No card found")
-                uid = inventory_result.data       
-
-            # Always authenticate block before writing
-            auth_result = self.ISO14443A_mifareAuthenticate(uid=uid, block_number=block_number)
-            if not auth_result.success:
-                self.logger.error("Authentication failed before write")
-                return RRHFOEM04Result(success=False, message="Mifare Authentication Failed")
+                uid = self._mifare_selected_uid
 
-            # Prepare and send write command
-            cmd = CMD_ISO14443A_MIFARE_WRITE.copy()
-            cmd.extend([block_number, *data_bytes])
-
-            response = self._send_command(cmd)
-            if response[3:5] != STATUS_SUCCESS:
-                self.logger.error(f"Write operation failed with status: {response[3:5]}")
-                raise CommandError(f"Write operation failed with status: {response[3:5]}")
+            self._mifare_write_block(uid, block_number, data_bytes)
 
             return RRHFOEM04Result(success=True, message="Operation Successful")
 
         except Exception as e:
-            self.logger.error(f"Error writing Mifare block: {str(e)}")
+            # A failed write (or a lost card) ends the card's authenticated session
+            self._end_mifare_session()
+            self.logger.error("Error writing Mifare block: %s", e)
             return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
         
+    def iter_card(self, uid: Optional[str] = None, card_type: str = "1K") -> Iterator[Tuple[int, bytes]]:
+        """
+        Stream a Mifare Classic 1K/4K card sector by sector.
+
+        Each sector is authenticated once (through `mifare_keys` if configured,
+        which also tries keys known for other cards of `card_type`) and its
+        blocks, trailer included, are read on that session. Key A always reads
+        back as zeros, so when the key A that opened the sector is known it is
+        put back into the trailer bytes, making the image usable for cloning.
+        Learned keys are saved once, when the walk ends.
+
+        Args:
+            uid: Card's unique identifier. If not provided, the card in the field is used.
+            card_type: "1K" (16 sectors) or "4K" (40 sectors)
+
+        Yields:
+            Tuple[int, bytes]: First block number of the sector and the sector's data
+
+        Raises:
+            ValueError: If the card type is unknown
+            TagError: If no card is found
+            AuthenticationError: If a sector cannot be authenticated
+            CommandError: If a block cannot be read
+        """
+        if card_type not in MIFARE_CARD_BLOCKS:
+            raise ValueError("card_type must be '1K' or '4K'")
+        if not uid:
+            inventory_result = self.ISO14443A_Inventory()
+            if not inventory_result.success or not inventory_result.data:
+                raise TagError("No card found")
+            uid = self._mifare_selected_uid
+
+        self._mifare_card_type = card_type
+        try:
+            for sector in range(sector_count(card_type)):
+                first = sector_first_block(sector)
+                count = sector_block_count(sector)
+                data = bytearray(count * MIFARE_BLOCK_SIZE)
+                for i in range(count):
+                    block_data = self._mifare_read_block(uid, first + i)
+                    if block_data is None:
+                        raise CommandError(f"Failed to read block {first + i}")
+                    data[i * MIFARE_BLOCK_SIZE:(i + 1) * MIFARE_BLOCK_SIZE] = block_data
+
+                known = (self.mifare_keys.known_key(uid, sector) if self.mifare_keys is not None
+                         else ('A', "FFFFFFFFFFFF"))
+                if known is not None and known[0] == 'A':
+                    trailer_offset = (count - 1) * MIFARE_BLOCK_SIZE
+                    data[trailer_offset:trailer_offset + 6] = bytes.fromhex(known[1])
+                yield first, bytes(data)
+        finally:
+            self._mifare_card_type = None
+            if self.mifare_keys is not None:
+                self.mifare_keys.flush()
+
+    def dump_card(self, uid: Optional[str] = None, card_type: str = "1K",
+                  out: Optional[Union[bytearray, memoryview]] = None) -> RRHFOEM04Result:
+        """
+        Read a whole Mifare Classic card into a binary image.
+
+        Uses `iter_card()`, so every sector is authenticated once. The image is
+        the card's blocks in order, 16 bytes each (1024 bytes for 1K, 4096 for 4K).
+
+        Args:
+            uid: Card's unique identifier. If not provided, the card in the field is used.
+            card_type: "1K" or "4K"
+            out: Writable buffer of at least the image size to fill in place.
+                A new `bytearray` is allocated if omitted.
+
+        Returns:
+            RRHFOEM04Result: On success `data` is the filled buffer
+        """
+        try:
+            if card_type not in MIFARE_CARD_BLOCKS:
+                raise ValueError("card_type must be '1K' or '4K'")
+            size = MIFARE_CARD_BLOCKS[card_type] * MIFARE_BLOCK_SIZE
+            if out is None:
+                out = bytearray(size)
+            elif len(out) < size:
+                raise ValueError(f"Buffer of {len(out)} bytes cannot hold {size} bytes")
+
+            with memoryview(out) as view:
+                for block, data in self.iter_card(uid, card_type):
+                    offset = block * MIFARE_BLOCK_SIZE
+                    view[offset:offset + len(data)] = data
+
+            return RRHFOEM04Result(success=True, message="Operation Successful", data=out)
+
+        except Exception as e:
+            self._end_mifare_session()
+            self.logger.error("Error in dump_card: %s", e)
+            return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
+
+    def restore_card(self, image: Union[bytes, bytearray, memoryview], uid: Optional[str] = None,
+                     write_trailers: bool = False, write_manufacturer_block: bool = False) -> RRHFOEM04Result:
+        """
+        Write a binary image (as made by `dump_card()`) to a Mifare Classic card, skipping unchanged blocks.
+
+        Sector by sector, the current contents are read and only the blocks that
+        differ are written, all on one authentication per sector. A sector's
+        trailer is written last, since it may change the keys guarding the sector.
+        Authentication uses `mifare_keys` if configured, so it must hold the keys
+        currently on the card.
+
+        Args:
+            image: Card image of 1024 (1K) or 4096 (4K) bytes
+            uid: Card's unique identifier. If not provided, the card in the field is used.
+            write_trailers: Also write sector trailers (keys and access bits). Defaults to False.
+            write_manufacturer_block: Also write block 0, which only writable ("magic") cards accept.
+                Defaults to False.
+
+        Returns:
+            RRHFOEM04Result: On success `data` is a dict with 'blocks_written' and 'sectors' visited
+        """
+        try:
+            card_type = next((name for name, blocks in MIFARE_CARD_BLOCKS.items()
+                              if blocks * MIFARE_BLOCK_SIZE == len(image)), None)
+            if card_type is None:
+                raise ValueError(f"Image of {len(image)} bytes is neither a 1K nor a 4K card")
+            if not uid:
+                inventory_result = self.ISO14443A_Inventory()
+                if not inventory_result.success or not inventory_result.data:
+                    return RRHFOEM04Result(success=False, message="No card found")
+                uid = self._mifare_selected_uid
+
+            blocks_written = sectors = 0
+            with memoryview(image) as view:
+                for first, current in self.iter_card(uid, card_type):
+                    sectors += 1
+                    for i in range(len(current) // MIFARE_BLOCK_SIZE):
+                        block = first + i
+                        if is_trailer(block) and not write_trailers:
+                            continue
+                        if block == 0 and not write_manufacturer_block:
+                            continue
+                        offset = block * MIFARE_BLOCK_SIZE
+                        data = view[offset:offset + MIFARE_BLOCK_SIZE]
+                        if data != current[i * MIFARE_BLOCK_SIZE:(i + 1) * MIFARE_BLOCK_SIZE]:
+                            self._mifare_write_block(uid, block, data)
+                            blocks_written += 1
+
+            return RRHFOEM04Result(success=True, message="Operation Successful",
+                                   data={'blocks_written': blocks_written, 'sectors': sectors})
+
+        except Exception as e:
+            self._end_mifare_session()
+            self.logger.error("Error in restore_card: %s", e)
+            return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
+
+    def stats(self) -> dict:
+        """
+        Return a snapshot of the per-command metrics (see `CommandMetrics.snapshot`).
+
+        Keys are 4-digit hex command codes (e.g. "1002" for the 16-slot inventory);
+        each entry holds the call count, outcomes, Additional Frame retries, bytes
+        sent and received, seconds spent in pacing, drain and device wait, and a
+        cumulative histogram of the device wait. Empty when metrics are disabled.
+        """
+        return self.metrics.snapshot() if self.metrics is not None else {}
+
     def close(self) -> None:
         """
         Close the connection to the RFID reader device.
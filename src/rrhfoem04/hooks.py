@@ -0,0 +1,60 @@
+"""
+Frame exchange hooks for the RRHFOEM04 reader.
+
+Callbacks registered with `RRHFOEM04.add_hook()` are called around every
+command sent by `_send_command()`, so tracers and profilers can observe the
+reader without patching it:
+
+    def on_receive(exchange):
+        print(exchange.name, exchange.uid, exchange.wait, exchange.status)
+
+    reader.add_hook(HOOK_RECEIVE, on_receive)
+
+All callbacks of one command receive the same `FrameExchange`, filled in as
+the exchange progresses, so a tracer can open a span on HOOK_SEND and close
+it on HOOK_RECEIVE or HOOK_ERROR (exactly one of them follows each send).
+No exchange object is built while no hook is registered.
+"""
+
+from typing import Optional
+
+from .metrics import COMMAND_NAMES
+
+# Hook events
+HOOK_SEND = 'send'        # Frame about to be written; timings and response fields not set yet
+HOOK_RECEIVE = 'receive'  # Complete response frame received (success or error status)
+HOOK_ERROR = 'error'      # No response before the deadline, or the exchange raised
+
+HOOK_EVENTS = (HOOK_SEND, HOOK_RECEIVE, HOOK_ERROR)
+
+
+class FrameExchange:
+    """One command/response exchange as seen by hooks."""
+
+    __slots__ = ('code', 'name', 'uid', 'bytes_out', 'bytes_in', 'pacing', 'drain', 'wait', 'first_report',
+                 'retries', 'status', 'outcome', 'error')
+
+    def __init__(self, code: int, uid: Optional[str], bytes_out: int):
+        """
+        Args:
+            code: 16-bit command code (category << 8 | command)
+            uid: Display-order hex UID of the addressed tag or selected card, None when not addressed
+            bytes_out: Frame bytes sent (length byte to CRC)
+        """
+        self.code = code
+        self.name = COMMAND_NAMES.get(code, 'UNKNOWN')
+        self.uid = uid
+        self.bytes_out = bytes_out
+        self.bytes_in = 0
+        self.pacing = 0.0   # Seconds slept for the command gap
+        self.drain = 0.0    # Seconds spent draining stale reports
+        self.wait = 0.0     # Seconds from write to complete response (or giving up)
+        self.first_report = 0.0  # Seconds from write to the first response report (`wait` if none arrived)
+        self.retries = 0    # Additional Frame requests
+        self.status: Optional[int] = None  # Status word of the response
+        self.outcome: Optional[str] = None  # metrics.OUTCOME_* once finished
+        self.error: Optional[BaseException] = None  # Exception that ended the exchange, if any
+
+    def __repr__(self) -> str:
+        return (f"FrameExchange(code={self.code:04X}, name={self.name}, uid={self.uid}, outcome={self.outcome}, "
+                f"bytes_out={self.bytes_out}, bytes_in={self.bytes_in}, wait={self.wait:.6f})")
@@ -0,0 +1,121 @@
+"""
+Continuous inventory tracking for the RRHFOEM04 reader.
+
+`InventoryTracker` keeps the set of tags present in the field across
+inventory cycles and turns each cycle's UID list into `InventoryEvent`s:
+ARRIVAL when a tag is first seen, PRESENT while it keeps answering, and
+DEPARTURE once it has been missed for `debounce` consecutive cycles.
+`RRHFOEM04.stream_inventory()` drives a tracker from a live inventory loop.
+"""
+
+from typing import Callable, Dict, Hashable, Iterable, List, Optional
+
+from .constants import INVENTORY_DEBOUNCE
+
+# Event kinds
+ARRIVAL = 'arrival'
+DEPARTURE = 'departure'
+PRESENT = 'present'
+
+
+class InventoryEvent:
+    """A change (or confirmation) of a tag's presence, produced by one inventory cycle."""
+
+    __slots__ = ('kind', 'uid', 'timestamp', 'first_seen', 'last_seen', 'cycle', 'latency')
+
+    def __init__(self, kind: str, uid, timestamp: float, first_seen: float, last_seen: float,
+                 cycle: int, latency: float):
+        """
+        Args:
+            kind: ARRIVAL, PRESENT or DEPARTURE
+            uid: Tag UID, formatted like inventory results (hex string, or bytes with `raw_results`)
+            timestamp: `time.monotonic()` at the end of the cycle that produced the event
+            first_seen: Monotonic time of the cycle in which the tag arrived
+            last_seen: Monotonic time of the last cycle in which the tag answered
+            cycle: Inventory cycle number, starting at 1
+            latency: Duration of the producing inventory cycle in seconds
+        """
+        self.kind = kind
+        self.uid = uid
+        self.timestamp = timestamp
+        self.first_seen = first_seen
+        self.last_seen = last_seen
+        self.cycle = cycle
+        self.latency = latency
+
+    def __repr__(self) -> str:
+        return (f"InventoryEvent(kind='{self.kind}', uid={self.uid!r}, timestamp={self.timestamp:.6f}, "
+                f"cycle={self.cycle}, latency={self.latency:.6f})")
+
+
+class _TagState:
+    __slots__ = ('uid', 'first_seen', 'last_seen', 'misses')
+
+    def __init__(self, uid, seen_at: float):
+        self.uid = uid
+        self.first_seen = seen_at
+        self.last_seen = seen_at
+        self.misses = 0
+
+
+class InventoryTracker:
+    """Incremental set of present tags with debounced departures."""
+
+    def __init__(self, debounce: int = INVENTORY_DEBOUNCE, emit_present: bool = True):
+        """
+        Args:
+            debounce: Consecutive missed cycles before a tag is reported as departed
+            emit_present: Emit a PRESENT event for every tag answering in a cycle
+        """
+        if debounce < 1:
+            raise ValueError("debounce must be at least 1")
+        self.debounce = debounce
+        self.emit_present = emit_present
+        self.cycle = 0
+        self._tags: Dict[Hashable, _TagState] = {}
+
+    @property
+    def present(self) -> List:
+        """UIDs currently considered present (including tags within their debounce window)."""
+        return [state.uid for state in self._tags.values()]
+
+    def update(self, uids: Iterable[Hashable], timestamp: float, latency: float = 0.0,
+               format_uid: Optional[Callable[[Hashable], object]] = None) -> List[InventoryEvent]:
+        """
+        Fold one inventory cycle into the tracked set.
+
+        Args:
+            uids: UIDs found in this cycle (any hashable form, e.g. raw bytes)
+            timestamp: Monotonic time at the end of the cycle
+            latency: Duration of the cycle in seconds
+            format_uid: Converts a UID into the form used in events; applied once, when the tag arrives
+
+        Returns:
+            List[InventoryEvent]: Events produced by this cycle
+        """
+        self.cycle += 1
+        events = []
+        seen = set()
+        for key in uids:
+            seen.add(key)
+            state = self._tags.get(key)
+            if state is None:
+                uid = format_uid(key) if format_uid else key
+                self._tags[key] = _TagState(uid, timestamp)
+                events.append(InventoryEvent(ARRIVAL, uid, timestamp, timestamp, timestamp, self.cycle, latency))
+                continue
+            state.last_seen = timestamp
+            state.misses = 0
+            if self.emit_present:
+                events.append(InventoryEvent(PRESENT, state.uid, timestamp, state.first_seen, timestamp,
+                                             self.cycle, latency))
+
+        if len(seen) < len(self._tags):
+            for key in [key for key in self._tags if key not in seen]:
+                state = self._tags[key]
+                state.misses += 1
+                if state.misses >= self.debounce:
+                    del self._tags[key]
+                    events.append(InventoryEvent(DEPARTURE, state.uid, timestamp, state.first_seen,
+                                                 state.last_seen, self.cycle, latency))
+        return events
@@ -0,0 +1,196 @@
+"""
+Multi-reader management for hosts with several RRHFOEM04 units.
+
+`ReaderManager` opens every attached reader by HID path (or a given list of
+transports), identifies each one by the serial number from Get Reader
+Information, and fans operations out to all readers on a worker pool. Each
+reader has its own lock, so a reader only ever runs one operation at a time
+while different readers work in parallel.
+
+Example:
+    with ReaderManager.discover() as manager:
+        result = manager.inventory()
+        for entry in result.data:
+            print(entry['reader'], entry['uid'])
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .constants import VENDOR_ID, PRODUCT_ID
+from .core import RRHFOEM04
+from .metrics import render_prometheus
+from .exceptions import ConnectionError
+from .transport import HidTransport, Transport, enumerate_readers
+from .utils import RRHFOEM04Result
+
+
+class ReaderManager:
+    """Open, identify and drive several readers in parallel."""
+
+    def __init__(self, transports: Sequence[Transport], max_workers: Optional[int] = None, **reader_kwargs):
+        """
+        Args:
+            transports: One transport per reader
+            max_workers: Worker threads; defaults to one per reader
+            **reader_kwargs: Extra `RRHFOEM04` arguments for every reader (e.g. `pacing="adaptive"`)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._transports = list(transports)
+        self._reader_kwargs = reader_kwargs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or max(1, len(self._transports)),
+                                            thread_name_prefix="rrhfoem04-manager")
+        self.readers: Dict[str, RRHFOEM04] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+
+    @classmethod
+    def discover(cls, vendor_id: int = VENDOR_ID, product_id: int = PRODUCT_ID, connect: bool = True,
+                 **kwargs) -> "ReaderManager":
+        """
+        Create a manager for every attached reader found with `hid.enumerate`.
+
+        Args:
+            vendor_id: USB vendor ID to look for
+            product_id: USB product ID to look for
+            connect: Open and identify the readers right away
+            **kwargs: `ReaderManager` arguments
+
+        Returns:
+            ReaderManager: Manager with one `HidTransport` per device path
+
+        Raises:
+            ConnectionError: If `connect` is set and no reader could be opened (the manager is closed)
+        """
+        transports = [HidTransport(vendor_id, product_id, path=info['path'])
+                      for info in enumerate_readers(vendor_id, product_id)]
+        manager = cls(transports, **kwargs)
+        if connect:
+            try:
+                manager.connect()
+            except Exception:
+                manager.close()
+                raise
+        return manager
+
+    def connect(self) -> Dict[str, RRHFOEM04]:
+        """
+        Open every reader in parallel and identify it by serial number.
+
+        The serial comes from the readiness probe run on connect, or from Get Reader
+        Information if the probe went unanswered. A reader whose serial cannot be read
+        is identified by its position (`reader-<n>`). Readers that fail to open are
+        logged and skipped.
+
+        Returns:
+            Dict[str, RRHFOEM04]: Connected readers by identity
+
+        Raises:
+            ConnectionError: If no reader could be opened
+        """
+        def open_reader(transport: Transport) -> Tuple[RRHFOEM04, RRHFOEM04Result]:
+            reader = RRHFOEM04(transport=transport, **self._reader_kwargs)
+            if reader.reader_info is not None:
+                return reader, RRHFOEM04Result(success=True, message="Operation Successful", data=reader.reader_info)
+            return reader, reader.getReaderInfo()
+
+        futures = [self._executor.submit(open_reader, transport) for transport in self._transports]
+        for index, future in enumerate(futures):
+            try:
+                reader, info = future.result()
+            except Exception as e:
+                self.logger.error("Failed to open reader %s: %s", index, e)
+                continue
+            identity = info.data['serial'] if info.success else f"reader-{index}"
+            if identity in self.readers:
+                identity = f"{identity}-{index}"
+            self.readers[identity] = reader
+            self._locks[identity] = threading.Lock()
+
+        if not self.readers:
+            raise ConnectionError("No reader could be opened")
+        self.logger.info("Connected %s reader(s): %s", len(self.readers), ', '.join(self.readers))
+        return self.readers
+
+    def run(self, operation: Callable[[RRHFOEM04], RRHFOEM04Result]) -> Dict[str, RRHFOEM04Result]:
+        """
+        Run an operation on every reader in parallel.
+
+        Args:
+            operation: Callable receiving a reader and returning its result
+
+        Returns:
+            Dict[str, RRHFOEM04Result]: Result per reader identity. An exception
+            raised by the operation becomes a failed result for that reader.
+        """
+        def run_one(identity: str) -> RRHFOEM04Result:
+            with self._locks[identity]:
+                try:
+                    return operation(self.readers[identity])
+                except Exception as e:
+                    self.logger.error("Error on reader %s: %s", identity, e)
+                    return RRHFOEM04Result(success=False, message=f"Operation Failed: <{str(e)}>")
+
+        futures = {identity: self._executor.submit(run_one, identity) for identity in self.readers}
+        return {identity: future.result() for identity, future in futures.items()}
+
+    def call(self, method: str, *args, **kwargs) -> Dict[str, RRHFOEM04Result]:
+        """
+        Call a reader method by name on every reader in parallel.
+
+        Example:
+            manager.call('ISO15693_readSingleBlock', 0, uid="E004010012345678")
+        """
+        return self.run(lambda reader: getattr(reader, method)(*args, **kwargs))
+
+    def inventory(self, method: str = "ISO15693_16SlotInventory", **kwargs) -> RRHFOEM04Result:
+        """
+        Run an inventory on every reader in parallel and merge the results.
+
+        Args:
+            method: Inventory method to call on each reader
+            **kwargs: Arguments of the inventory method (e.g. `afi=0x07`)
+
+        Returns:
+            RRHFOEM04Result: Successful if at least one reader answered. `data` lists
+            `{'reader': identity, 'uid': uid}` entries in reader order; a tag seen by
+            several readers appears once per reader.
+        """
+        results = self.call(method, **kwargs)
+        entries: List[Dict[str, str]] = []
+        for identity, result in results.items():
+            if not result.success:
+                continue
+            uids = result.data if isinstance(result.data, list) else [result.data]
+            entries.extend({'reader': identity, 'uid': uid} for uid in uids)
+
+        if not any(result.success for result in results.values()):
+            return RRHFOEM04Result(success=False, message="Operation Failed", data=entries)
+        return RRHFOEM04Result(success=True, message="Operation Successful", data=entries)
+
+    def prometheus(self, prefix: str = "rrhfoem04") -> str:
+        """
+        Render the command metrics of every reader as one Prometheus text exposition.
+
+        Samples carry a `reader` label with the reader identity; readers created with
+        `metrics=False` are left out.
+        """
+        return render_prometheus([({'reader': identity}, reader.metrics) for identity, reader in self.readers.items()
+                                  if reader.metrics is not None], prefix)
+
+    def close(self) -> None:
+        """Close every reader and stop the worker pool."""
+        for reader in self.readers.values():
+            try:
+                reader.close()
+            except Exception as e:
+                self.logger.error("Error closing reader: %s", e)
+        self.readers.clear()
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
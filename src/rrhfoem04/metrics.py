@@ -0,0 +1,230 @@
+"""
+Per-command latency and outcome metrics for the RRHFOEM04 reader.
+
+`CommandMetrics` accumulates, per 16-bit command code, the number of calls,
+their outcome (ok, error status, timeout, communication failure), Additional
+Frame retries, bytes sent and received, the time spent in each phase of
+`RRHFOEM04._send_command()` (pacing sleep, stale-data drain, device wait) and
+cumulative histograms of the device wait and of its first part, the wait for
+the first response report. The difference between the two is the transfer
+time of multi-report responses, so reader processing latency can be told
+apart from it. Recording is a handful of integer
+and float additions, so the reader keeps metrics on by default.
+
+`snapshot()` returns plain dictionaries; `prometheus()` renders the same data
+in the Prometheus text exposition format.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .codec import COMMAND_TABLE
+from .constants import METRICS_LATENCY_BUCKETS
+
+# Outcomes of one command exchange
+OUTCOME_OK = 'ok'
+OUTCOME_ERROR = 'error'          # Reader answered with an error status
+OUTCOME_TIMEOUT = 'timeout'      # No response before the deadline
+OUTCOME_FAILURE = 'failure'      # Incomplete frame, CRC mismatch or transport error
+
+
+def _command_names() -> Dict[int, str]:
+    """Map command codes to the shortest `COMMAND_TABLE` name using them (the base variant)."""
+    names: Dict[int, str] = {}
+    for name, (header, _) in COMMAND_TABLE.items():
+        code = (header[1] << 8) | header[2]
+        if code not in names or len(name) < len(names[code]):
+            names[code] = name
+    return names
+
+
+COMMAND_NAMES = _command_names()
+
+
+class _CommandStats:
+    __slots__ = ('calls', 'ok', 'errors', 'timeouts', 'failures', 'retries', 'bytes_out', 'bytes_in',
+                 'pacing_seconds', 'drain_seconds', 'wait_seconds', 'first_report_seconds', 'buckets',
+                 'first_report_buckets')
+
+    def __init__(self, bucket_count: int):
+        self.calls = self.ok = self.errors = self.timeouts = self.failures = self.retries = 0
+        self.bytes_out = self.bytes_in = 0
+        self.pacing_seconds = self.drain_seconds = self.wait_seconds = self.first_report_seconds = 0.0
+        self.buckets = [0] * (bucket_count + 1)  # Last slot counts waits above the largest bound
+        self.first_report_buckets = [0] * (bucket_count + 1)
+
+
+class CommandMetrics:
+    """Thread-safe per-command counters and wait-time histograms."""
+
+    _HISTOGRAM_FIELDS = (('buckets', 'wait_histogram'), ('first_report_buckets', 'first_report_histogram'))
+
+    def __init__(self, buckets: Sequence[float] = METRICS_LATENCY_BUCKETS):
+        """
+        Args:
+            buckets: Ascending upper bounds in seconds of the device wait histogram
+        """
+        if list(buckets) != sorted(buckets) or not buckets:
+            raise ValueError("buckets must be a non-empty ascending sequence")
+        self.buckets: Tuple[float, ...] = tuple(buckets)
+        self._lock = threading.Lock()
+        self._commands: Dict[int, _CommandStats] = {}
+
+    def record(self, code: int, outcome: str, pacing: float, drain: float, wait: float,
+               bytes_out: int, bytes_in: int, retries: int = 0, first_report: Optional[float] = None) -> None:
+        """
+        Account one command exchange.
+
+        Args:
+            code: 16-bit command code (category << 8 | command)
+            outcome: OUTCOME_OK, OUTCOME_ERROR, OUTCOME_TIMEOUT or OUTCOME_FAILURE
+            pacing: Seconds slept to respect the command gap
+            drain: Seconds spent draining stale reports before writing
+            wait: Seconds from write to complete response (or giving up)
+            bytes_out: Frame bytes sent (length byte to CRC)
+            bytes_in: Frame bytes received
+            retries: Additional Frame requests sent to complete the response
+            first_report: Seconds from write to the first response report; defaults to `wait`
+                (single-report responses, or no response at all)
+        """
+        if first_report is None:
+            first_report = wait
+        with self._lock:
+            stats = self._commands.get(code)
+            if stats is None:
+                stats = self._commands[code] = _CommandStats(len(self.buckets))
+            stats.calls += 1
+            if outcome == OUTCOME_OK:
+                stats.ok += 1
+            elif outcome == OUTCOME_ERROR:
+                stats.errors += 1
+            elif outcome == OUTCOME_TIMEOUT:
+                stats.timeouts += 1
+            else:
+                stats.failures += 1
+            stats.retries += retries
+            stats.bytes_out += bytes_out
+            stats.bytes_in += bytes_in
+            stats.pacing_seconds += pacing
+            stats.drain_seconds += drain
+            stats.wait_seconds += wait
+            stats.first_report_seconds += first_report
+            stats.buckets[bisect_left(self.buckets, wait)] += 1
+            stats.first_report_buckets[bisect_left(self.buckets, first_report)] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """
+        Return the metrics of every command seen, keyed by 4-digit hex command code.
+
+        Each entry holds 'name', the counters ('calls', 'ok', 'errors', 'timeouts',
+        'failures', 'retries', 'bytes_out', 'bytes_in'), the phase totals in seconds
+        ('pacing_seconds', 'drain_seconds', 'wait_seconds', 'first_report_seconds') and
+        'wait_histogram' / 'first_report_histogram', lists of (upper bound, cumulative
+        count) pairs ending with (inf, calls).
+        """
+        with self._lock:
+            commands = [(code, self._copy(stats)) for code, stats in sorted(self._commands.items())]
+        result = {}
+        for code, stats in commands:
+            entry = {name: getattr(stats, name) for name in _CommandStats.__slots__ if not name.endswith('buckets')}
+            entry['name'] = COMMAND_NAMES.get(code, 'UNKNOWN')
+            for field, key in self._HISTOGRAM_FIELDS:
+                cumulative = 0
+                histogram = []
+                for bound, count in zip(self.buckets + (float('inf'),), getattr(stats, field)):
+                    cumulative += count
+                    histogram.append((bound, cumulative))
+                entry[key] = histogram
+            result[f"{code:04X}"] = entry
+        return result
+
+    @staticmethod
+    def _copy(stats: _CommandStats) -> _CommandStats:
+        copy = _CommandStats(len(stats.buckets) - 1)
+        for name in _CommandStats.__slots__:
+            value = getattr(stats, name)
+            setattr(copy, name, list(value) if name.endswith('buckets') else value)
+        return copy
+
+    def reset(self) -> None:
+        """Drop every recorded value."""
+        with self._lock:
+            self._commands.clear()
+
+    def prometheus(self, prefix: str = "rrhfoem04", labels: Optional[Dict[str, str]] = None) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+            labels: Extra labels added to every sample (e.g. `{'reader': serial}`)
+
+        Returns:
+            str: Exposition text, one `# TYPE` block per metric family
+        """
+        return render_prometheus([(labels or {}, self)], prefix)
+
+
+# Counter families: (metric name, snapshot field, help text)
+_COUNTERS = (
+    ("commands_total", 'calls', "Commands sent."),
+    ("command_retries_total", 'retries', "Additional Frame requests."),
+    ("command_bytes_out_total", 'bytes_out', "Frame bytes sent."),
+    ("command_bytes_in_total", 'bytes_in', "Frame bytes received."),
+    ("command_pacing_seconds_total", 'pacing_seconds', "Time slept for command pacing."),
+    ("command_drain_seconds_total", 'drain_seconds', "Time spent draining stale reports."),
+)
+_OUTCOMES = (("ok", 'ok'), ("error", 'errors'), ("timeout", 'timeouts'), ("failure", 'failures'))
+# Histogram families: (metric name, snapshot histogram, snapshot sum field, help text)
+_HISTOGRAMS = (
+    ("command_wait_seconds", 'wait_histogram', 'wait_seconds', "Time from write to complete response."),
+    ("command_first_report_seconds", 'first_report_histogram', 'first_report_seconds',
+     "Time from write to the first response report."),
+)
+
+
+def render_prometheus(sources: Iterable[Tuple[Dict[str, str], CommandMetrics]], prefix: str = "rrhfoem04") -> str:
+    """
+    Render several `CommandMetrics` as one Prometheus text exposition.
+
+    Args:
+        sources: (labels, metrics) pairs; the labels (e.g. `{'reader': serial}`) tell the sources apart
+        prefix: Metric name prefix
+
+    Returns:
+        str: Exposition text with each metric family declared once
+    """
+    series = []
+    for labels, metrics in sources:
+        extra = "".join(f',{key}="{_escape(value)}"' for key, value in labels.items())
+        for code, entry in metrics.snapshot().items():
+            series.append((f'command="{code}",name="{entry["name"]}"{extra}', entry))
+
+    lines: List[str] = []
+
+    def family(name: str, kind: str, help_text: str) -> None:
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+    for name, field, help_text in _COUNTERS:
+        family(name, "counter", help_text)
+        lines.extend(f"{prefix}_{name}{{{base}}} {entry[field]}" for base, entry in series)
+    family("command_outcomes_total", "counter", "Commands by outcome.")
+    for base, entry in series:
+        lines.extend(f'{prefix}_command_outcomes_total{{{base},outcome="{outcome}"}} {entry[field]}'
+                     for outcome, field in _OUTCOMES)
+
+    for name, histogram, total, help_text in _HISTOGRAMS:
+        family(name, "histogram", help_text)
+        for base, entry in series:
+            for bound, count in entry[histogram]:
+                le = "+Inf" if bound == float('inf') else repr(bound)
+                lines.append(f'{prefix}_{name}_bucket{{{base},le="{le}"}} {count}')
+            lines.append(f"{prefix}_{name}_sum{{{base}}} {entry[total]}")
+            lines.append(f"{prefix}_{name}_count{{{base}}} {entry['calls']}")
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
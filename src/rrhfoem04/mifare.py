@@ -0,0 +1,200 @@
+"""
+Mifare Classic memory layout helpers.
+
+Mifare Classic 1K cards have 16 sectors of 4 blocks. 4K cards have 32 sectors
+of 4 blocks (blocks 0-127) followed by 8 sectors of 16 blocks (blocks
+128-255). The last block of every sector is its trailer, holding key A, the
+access bits and key B. Authentication covers a whole sector.
+
+`MifareKeyDictionary` holds the candidate keys tried when authenticating a
+sector and remembers which key opened which sector of which card and of which
+card type, optionally in a JSON file so later sessions authenticate on the
+first try.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Blocks per card type
+MIFARE_CARD_BLOCKS: Dict[str, int] = {'1K': 64, '4K': 256}
+
+# First block of the 16-block sectors on 4K cards
+MIFARE_LARGE_SECTOR_START = 128
+
+
+def sector_of(block: int) -> int:
+    """Return the sector containing `block`."""
+    if block < MIFARE_LARGE_SECTOR_START:
+        return block // 4
+    return 32 + (block - MIFARE_LARGE_SECTOR_START) // 16
+
+
+def sector_first_block(sector: int) -> int:
+    """Return the first block of `sector`."""
+    return sector * 4 if sector < 32 else MIFARE_LARGE_SECTOR_START + (sector - 32) * 16
+
+
+def sector_block_count(sector: int) -> int:
+    """Return the number of blocks in `sector` (trailer included)."""
+    return 4 if sector < 32 else 16
+
+
+def trailer_of(block: int) -> int:
+    """Return the trailer block of the sector containing `block`."""
+    return block | 0x03 if block < MIFARE_LARGE_SECTOR_START else block | 0x0F
+
+
+def is_trailer(block: int) -> bool:
+    """Return True if `block` is a sector trailer."""
+    return trailer_of(block) == block
+
+
+def sector_count(card_type: str) -> int:
+    """Return the number of sectors of a "1K" or "4K" card."""
+    return sector_of(MIFARE_CARD_BLOCKS[card_type] - 1) + 1
+
+
+# Widely used transport/default keys, tried when no key list is given
+MIFARE_WELL_KNOWN_KEYS = ("FFFFFFFFFFFF", "A0A1A2A3A4A5", "D3F7D3F7D3F7", "000000000000")
+
+
+class MifareKeyDictionary:
+    """
+    Candidate Mifare keys with a per-sector memory of past successes.
+
+    Candidates are tried as key A and key B. For a given card and sector the
+    key that opened it before is tried first, then the key that last opened
+    that sector on a card of the same type (any label the caller uses to group
+    cards, e.g. "1K"/"4K" or an issuer), then the remaining candidates ordered
+    by how often they opened that sector on any card.
+
+    Learned keys are saved to `path` by `flush()`, so a whole card dump writes
+    the file once rather than once per sector.
+    """
+
+    def __init__(self, keys: Optional[Iterable[str]] = None, key_types: str = "AB", path: Optional[str] = None):
+        """
+        Args:
+            keys: Candidate keys as 12-character hex strings (defaults to `MIFARE_WELL_KNOWN_KEYS`)
+            key_types: Key slots to try for every candidate, in order ("A", "B" or "AB")
+            path: JSON file the learned keys are loaded from and saved to; None keeps them in memory only
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.keys: List[str] = [key.upper() for key in (MIFARE_WELL_KNOWN_KEYS if keys is None else keys)]
+        for key in self.keys:
+            if len(key) != 12:
+                raise ValueError(f"Key must be 6 bytes (12 hex characters): {key}")
+            bytes.fromhex(key)
+        if not key_types or set(key_types) - {'A', 'B'}:
+            raise ValueError("key_types must be made of 'A' and 'B'")
+        self.key_types = key_types
+        self.path = path
+        self._lock = threading.Lock()
+        # UID -> sector -> (key type, key) that authenticated it
+        self._cards: Dict[str, Dict[int, Tuple[str, str]]] = {}
+        # Card type -> sector -> (key type, key) that last authenticated it on a card of that type
+        self._types: Dict[str, Dict[int, Tuple[str, str]]] = {}
+        self._dirty = False  # Learned keys not yet written to `path`
+        # Sector -> "<type>:<key>" -> number of successful authentications
+        self._hits: Dict[int, Dict[str, int]] = {}
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def candidates(self, uid: str, sector: int, card_type: Optional[str] = None) -> List[Tuple[str, str]]:
+        """
+        Return the (key type, key) pairs to try for `sector` of card `uid`, most promising first.
+
+        Args:
+            uid: Card's UID in hex
+            sector: Sector to authenticate
+            card_type: Type of the card, whose known keys are tried when the card itself has none
+        """
+        with self._lock:
+            hits = self._hits.get(sector, {})
+            pairs = [(key_type, key) for key in self.keys for key_type in self.key_types]
+            pairs.sort(key=lambda pair: -hits.get(f"{pair[0]}:{pair[1]}", 0))
+            known = [self._cards.get(uid.upper(), {}).get(sector)]
+            if card_type is not None:
+                known.append(self._types.get(card_type, {}).get(sector))
+        first = []
+        for pair in known:
+            if pair is not None and pair not in first:
+                first.append(pair)
+        return first + [pair for pair in pairs if pair not in first]
+
+    def known_key(self, uid: str, sector: int) -> Optional[Tuple[str, str]]:
+        """Return the (key type, key) that last opened `sector` of card `uid`, if any."""
+        with self._lock:
+            return self._cards.get(uid.upper(), {}).get(sector)
+
+    def record_success(self, uid: str, sector: int, key_type: str, key: str, card_type: Optional[str] = None) -> None:
+        """
+        Remember that `key` opened `sector` of card `uid` (and of cards of `card_type`, if given).
+
+        A changed mapping marks the store for the next `flush()`.
+        """
+        entry = (key_type, key.upper())
+        with self._lock:
+            sector_hits = self._hits.setdefault(sector, {})
+            name = f"{entry[0]}:{entry[1]}"
+            sector_hits[name] = sector_hits.get(name, 0) + 1
+            stores = [self._cards.setdefault(uid.upper(), {})]
+            if card_type is not None:
+                stores.append(self._types.setdefault(card_type, {}))
+            for store in stores:
+                if store.get(sector) != entry:
+                    store[sector] = entry
+                    self._dirty = True
+
+    def flush(self) -> None:
+        """Save the store to `path` if keys were learned since the last save."""
+        if self._dirty and self.path is not None:
+            self.save()
+
+    def forget(self, uid: Optional[str] = None) -> None:
+        """Drop the learned keys of card `uid`, or of every card if None."""
+        with self._lock:
+            if uid is None:
+                self._cards.clear()
+            else:
+                self._cards.pop(uid.upper(), None)
+        if self.path is not None:
+            self.save()
+
+    def load(self) -> None:
+        """Load learned keys from `path`; an unreadable file is logged and ignored."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            cards = {uid: {int(sector): (entry[0], entry[1]) for sector, entry in sectors.items()}
+                     for uid, sectors in stored.get('cards', {}).items()}
+            types = {card_type: {int(sector): (entry[0], entry[1]) for sector, entry in sectors.items()}
+                     for card_type, sectors in stored.get('types', {}).items()}
+            hits = {int(sector): dict(counts) for sector, counts in stored.get('hits', {}).items()}
+        except (OSError, ValueError, TypeError, KeyError, IndexError) as e:
+            self.logger.warning("Ignoring unreadable key store %s: %s", self.path, e)
+            return
+        with self._lock:
+            self._cards = cards
+            self._types = types
+            self._hits = hits
+            self._dirty = False
+
+    def save(self) -> None:
+        """Write learned keys to `path` (atomically, through a temporary file)."""
+        with self._lock:
+            stored = {
+                'cards': {uid: {str(sector): list(entry) for sector, entry in sectors.items()}
+                          for uid, sectors in self._cards.items()},
+                'types': {card_type: {str(sector): list(entry) for sector, entry in sectors.items()}
+                          for card_type, sectors in self._types.items()},
+                'hits': {str(sector): counts for sector, counts in self._hits.items()},
+            }
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(stored, f, indent=1, sort_keys=True)
+            os.replace(temp_path, self.path)
+            self._dirty = False
@@ -0,0 +1,115 @@
+"""
+Command pacing strategies for the RRHFOEM04 reader.
+
+The reader needs a minimum gap between consecutive frames. `FixedPacer` keeps
+the conservative `COMMAND_INTERVAL` for every command, while `AdaptivePacer`
+learns a separate gap per command category: it tightens the gap while responses
+come back clean and backs off as soon as a command times out or returns an
+error status.
+"""
+
+from typing import Dict, Hashable
+
+from .constants import (
+    COMMAND_INTERVAL,
+    ADAPTIVE_MIN_INTERVAL,
+    ADAPTIVE_TIGHTEN_FACTOR,
+    ADAPTIVE_BACKOFF_FACTOR,
+    ADAPTIVE_CLEAN_STREAK,
+)
+
+# Command category byte -> pacing group. Categories sharing a protocol engine share a gap.
+PACING_GROUPS = {
+    0xF0: 'system',
+    0x10: 'iso15693',
+    0x1F: 'iso15693',
+    0x2F: 'iso14443a',
+    0x21: 'iso14443a',
+}
+
+
+def pacing_group(category: int) -> Hashable:
+    """Return the pacing group for a command category byte (unknown categories get their own group)."""
+    return PACING_GROUPS.get(category, category)
+
+
+class FixedPacer:
+    """Conservative pacing: the same fixed gap before every command."""
+
+    def __init__(self, interval: float = COMMAND_INTERVAL):
+        """
+        Args:
+            interval: Gap in seconds enforced between commands
+        """
+        self._interval = interval
+
+    def interval(self, category: int) -> float:
+        """Return the gap in seconds required before a command of `category`."""
+        return self._interval
+
+    def record(self, category: int, ok: bool) -> None:
+        """Report the outcome of a command. Fixed pacing ignores outcomes."""
+        pass
+
+
+class AdaptivePacer:
+    """
+    Adaptive pacing that learns the shortest safe gap per command category.
+
+    Every group starts at `initial`. After `clean_streak` consecutive clean
+    responses the gap is multiplied by `tighten_factor` (never below `minimum`);
+    a timeout or error status multiplies it by `backoff_factor` (never above
+    `maximum`) and restarts the streak.
+    """
+
+    def __init__(self, initial: float = COMMAND_INTERVAL, minimum: float = ADAPTIVE_MIN_INTERVAL,
+                 maximum: float = COMMAND_INTERVAL, tighten_factor: float = ADAPTIVE_TIGHTEN_FACTOR,
+                 backoff_factor: float = ADAPTIVE_BACKOFF_FACTOR, clean_streak: int = ADAPTIVE_CLEAN_STREAK):
+        """
+        Args:
+            initial: Starting gap in seconds for every group
+            minimum: Smallest gap the pacer will tighten to
+            maximum: Largest gap the pacer will back off to
+            tighten_factor: Multiplier (< 1) applied after a clean streak
+            backoff_factor: Multiplier (> 1) applied after a failure
+            clean_streak: Consecutive clean responses required before tightening
+        """
+        if not 0 < tighten_factor < 1 or backoff_factor <= 1:
+            raise ValueError("tighten_factor must be in (0, 1) and backoff_factor greater than 1")
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.tighten_factor = tighten_factor
+        self.backoff_factor = backoff_factor
+        self.clean_streak = clean_streak
+        self._intervals: Dict[Hashable, float] = {}
+        self._streaks: Dict[Hashable, int] = {}
+
+    def interval(self, category: int) -> float:
+        """Return the current gap in seconds for the group of `category`."""
+        return self._intervals.get(pacing_group(category), self.initial)
+
+    def record(self, category: int, ok: bool) -> None:
+        """
+        Report the outcome of a command.
+
+        Args:
+            category: Command category byte
+            ok: True for a response with success status, False for a timeout or error status
+        """
+        group = pacing_group(category)
+        current = self._intervals.get(group, self.initial)
+        if not ok:
+            self._intervals[group] = min(self.maximum, max(current, self.minimum) * self.backoff_factor)
+            self._streaks[group] = 0
+            return
+
+        streak = self._streaks.get(group, 0) + 1
+        if streak >= self.clean_streak:
+            self._intervals[group] = max(self.minimum, current * self.tighten_factor)
+            streak = 0
+        self._streaks[group] = streak
+
+    def intervals(self) -> Dict[Hashable, float]:
+        """Return a snapshot of the learned gap per group."""
+        return dict(self._intervals)
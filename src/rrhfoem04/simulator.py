@@ -0,0 +1,526 @@
+"""
+In-process simulated RRHFOEM04 reader.
+
+`SimulatedReader` implements the `Transport` interface and answers frames the
+same way the physical reader does: requests and responses carry the length byte,
+the two-byte command code, the CRC-16 and are exchanged as 64-byte HID reports.
+Tags are modelled in memory (`SimulatedISO15693Tag`, `SimulatedMifareCard`) so
+read/write/authenticate sequences behave like they would on the bench.
+
+Each command has a configurable turnaround latency (plus optional random jitter)
+before its response becomes readable, which makes the simulator suitable for
+benchmarking and soak-testing the timing logic of `RRHFOEM04` in CI.
+
+Example:
+    reader = RRHFOEM04(transport=SimulatedReader(
+        iso15693_tags=[SimulatedISO15693Tag("E004010012345678")],
+        latency=0.005, jitter=0.002))
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .constants import *
+from .mifare import MIFARE_CARD_BLOCKS, is_trailer, sector_of, trailer_of
+from .transport import Transport
+from .utils import calc_crc
+
+# Error codes returned in the response frame
+SIM_STATUS_SUCCESS = 0x0000
+SIM_STATUS_ERROR = 0xFFFF
+
+# Largest response frame the one-byte length field can describe
+SIM_MAX_FRAME_LENGTH = 0xFF
+
+# Default Mifare Classic transport key and access bits
+DEFAULT_MIFARE_KEY = bytes.fromhex("FFFFFFFFFFFF")
+DEFAULT_MIFARE_ACCESS_BITS = bytes.fromhex("FF078069")
+
+
+def _command_code(cmd: List[int]) -> int:
+    """Return the 16-bit command code (category << 8 | command) of a `CMD_*` frame."""
+    return (cmd[1] << 8) | cmd[2]
+
+
+class SimulatedISO15693Tag:
+    """
+    In-memory ISO15693 (vicinity) tag.
+
+    Memory is stored in tag order: block `n` occupies bytes
+    `n * block_size` to `(n + 1) * block_size` of `memory`.
+    """
+
+    def __init__(self, uid: str, block_count: int = 28, block_size: int = DEFAULT_BLOCK_SIZE,
+                 afi: int = 0, dsfid: int = 0, ic_reference: int = 0x01, data: Optional[bytes] = None):
+        """
+        Args:
+            uid: 8-byte UID as a hex string, most significant byte first (as returned by inventory)
+            block_count: Number of memory blocks
+            block_size: Size of each block in bytes
+            afi: Application Family Identifier
+            dsfid: Data Storage Format Identifier
+            ic_reference: IC reference byte reported by the tag
+            data: Optional initial memory contents (padded with zeros)
+        """
+        self.uid = uid.upper()
+        self.uid_bytes = bytes.fromhex(uid)
+        self.block_count = block_count
+        self.block_size = block_size
+        self.afi = afi
+        self.dsfid = dsfid
+        self.ic_reference = ic_reference
+        size = block_count * block_size
+        self.memory = bytearray((data or b"")[:size].ljust(size, b"\x00"))
+        self.blocks_written = 0  # Total blocks written, to observe tag wear
+        self.quiet = False  # Quiet tags ignore inventories and non-addressed commands
+
+    def matches_afi(self, afi: int) -> bool:
+        """Return True if the tag answers an inventory filtered by `afi` (a zero nibble matches any value)."""
+        high, low = afi >> 4, afi & 0x0F
+        return (high == 0 or high == self.afi >> 4) and (low == 0 or low == self.afi & 0x0F)
+
+    def read_blocks(self, start: int, count: int) -> Optional[bytes]:
+        """Return `count` blocks starting at `start`, or None if out of range."""
+        if start < 0 or count < 1 or start + count > self.block_count:
+            return None
+        return bytes(self.memory[start * self.block_size:(start + count) * self.block_size])
+
+    def write_blocks(self, start: int, data: bytes) -> bool:
+        """Write whole blocks starting at `start`. Returns False if out of range or misaligned."""
+        if not data or len(data) % self.block_size:
+            return False
+        count = len(data) // self.block_size
+        if start < 0 or start + count > self.block_count:
+            return False
+        self.memory[start * self.block_size:start * self.block_size + len(data)] = data
+        self.blocks_written += count
+        return True
+
+
+class SimulatedMifareCard:
+    """
+    In-memory Mifare Classic 1K/4K card.
+
+    Sector trailers hold the keys and access bits exactly as on a real card, so
+    changing a trailer through a write changes the keys needed to authenticate.
+    Key A always reads back as zeros.
+    """
+
+    def __init__(self, uid: str = "A1B2C3D4", card_type: str = "1K",
+                 key_a: bytes = DEFAULT_MIFARE_KEY, key_b: bytes = DEFAULT_MIFARE_KEY):
+        """
+        Args:
+            uid: 4-byte UID as a hex string
+            card_type: "1K" (16 sectors) or "4K" (40 sectors)
+            key_a: Initial key A for every sector
+            key_b: Initial key B for every sector
+        """
+        if card_type not in ("1K", "4K"):
+            raise ValueError("card_type must be '1K' or '4K'")
+        self.uid = uid.upper()
+        self.uid_bytes = bytes.fromhex(uid)
+        self.card_type = card_type
+        self.block_count = MIFARE_CARD_BLOCKS[card_type]
+        self.memory = bytearray(self.block_count * MIFARE_BLOCK_SIZE)
+
+        # Manufacturer block: UID, BCC and filler
+        bcc = 0
+        for b in self.uid_bytes:
+            bcc ^= b
+        self.memory[0:MIFARE_BLOCK_SIZE] = (self.uid_bytes + bytes([bcc])).ljust(MIFARE_BLOCK_SIZE, b"\x00")
+
+        trailer = key_a + DEFAULT_MIFARE_ACCESS_BITS + key_b
+        for block in range(self.block_count):
+            if self.is_trailer(block):
+                self.set_block(block, trailer)
+
+    @staticmethod
+    def sector_of(block: int) -> int:
+        """Return the sector containing `block` (4-block sectors below block 128, 16-block above)."""
+        return sector_of(block)
+
+    @staticmethod
+    def is_trailer(block: int) -> bool:
+        """Return True if `block` is a sector trailer."""
+        return is_trailer(block)
+
+    def trailer_of(self, block: int) -> int:
+        """Return the trailer block number of the sector containing `block`."""
+        return trailer_of(block)
+
+    def get_block(self, block: int) -> bytes:
+        return bytes(self.memory[block * MIFARE_BLOCK_SIZE:(block + 1) * MIFARE_BLOCK_SIZE])
+
+    def set_block(self, block: int, data: bytes) -> None:
+        self.memory[block * MIFARE_BLOCK_SIZE:(block + 1) * MIFARE_BLOCK_SIZE] = data
+
+    def key(self, block: int, key_type: int) -> bytes:
+        """Return the key guarding `block` (`key_type` 0x60 for key A, 0x61 for key B)."""
+        trailer = self.get_block(self.trailer_of(block))
+        return trailer[0:6] if key_type == 0x60 else trailer[10:16]
+
+
+class SimulatedReader(Transport):
+    """
+    Simulated RRHFOEM04 reader implementing the `Transport` interface.
+
+    Responses are queued with a ready time of `write time + latency + jitter` and
+    become visible to `read()` only once that time has passed, mimicking the
+    reader's command turnaround. Long responses are split into consecutive
+    64-byte reports; with `auto_continue=False` only the first report is sent
+    and each following one waits for an Additional Frame (F002) request.
+    """
+
+    def __init__(self, iso15693_tags: Optional[List[SimulatedISO15693Tag]] = None,
+                 mifare_cards: Optional[List[SimulatedMifareCard]] = None,
+                 latency: float = 0.002, jitter: float = 0.0,
+                 command_latency: Optional[Dict[int, float]] = None,
+                 model: str = "RRHFOEM04", serial: str = "000001",
+                 slot_collisions: bool = True, min_command_gap: float = 0.0, auto_continue: bool = True,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            iso15693_tags: ISO15693 tags in the field (list may be changed while running)
+            mifare_cards: Mifare cards in the field; the first one answers (list may be changed while running)
+            latency: Default turnaround time in seconds for every command
+            jitter: Maximum random extra turnaround in seconds (uniformly distributed)
+            command_latency: Per-command turnaround overrides keyed by 16-bit command code (e.g. 0x1009)
+            model: Model string reported by Get Reader Information
+            serial: 3-byte serial number as a hex string
+            slot_collisions: Whether tags answering in the same inventory slot collide and are missed
+            min_command_gap: Time in seconds after a response before the reader accepts a new frame;
+                frames arriving earlier are answered with an error status
+            auto_continue: Whether continuation reports of long responses are sent without being requested
+            seed: Seed for the jitter and slot selection random generator
+        """
+        self.iso15693_tags = iso15693_tags if iso15693_tags is not None else []
+        self.mifare_cards = mifare_cards if mifare_cards is not None else []
+        self.latency = latency
+        self.jitter = jitter
+        self.command_latency = dict(command_latency or {})
+        self.model = model
+        self.serial = serial
+        self.slot_collisions = slot_collisions
+        self.min_command_gap = min_command_gap
+        self.auto_continue = auto_continue
+
+        self.is_open = False
+        self.frames_received = 0
+        self.command_counts: Dict[int, int] = {}  # Frames received per 16-bit command code
+        self.crc_errors = 0
+        self.busy_rejections = 0
+        self.additional_frame_requests = 0
+        self.beeps = 0
+        self.buzzer_active = False
+
+        self._random = random.Random(seed)
+        self._pending: deque = deque()
+        self._held: deque = deque()  # Continuation reports waiting for an Additional Frame request
+        self._cond = threading.Condition()
+        self._selected_iso15693: Optional[SimulatedISO15693Tag] = None
+        self._selected_card: Optional[SimulatedMifareCard] = None
+        self._auth_sector: Optional[int] = None
+        self._busy_until = 0.0
+
+        self._handlers: Dict[int, Callable[[bytes], Tuple[int, bytes]]] = {
+            _command_code(CMD_GET_READER_INFO): self._get_reader_info,
+            _command_code(CMD_BUZZER_BEEP): self._buzzer_beep,
+            _command_code(CMD_BUZZER_ON): self._buzzer_on,
+            _command_code(CMD_BUZZER_OFF): self._buzzer_off,
+            _command_code(CMD_ISO15693_SINGLE_SLOT_INVENTORY): self._iso15693_single_slot_inventory,
+            _command_code(CMD_ISO15693_16_SLOT_INVENTORY): self._iso15693_16_slot_inventory,
+            _command_code(CMD_ISO15693_SELECT): self._iso15693_select,
+            _command_code(CMD_ISO15693_STAY_QUIET): self._iso15693_stay_quiet,
+            _command_code(CMD_ISO15693_RESET_TO_READY): self._iso15693_reset_to_ready,
+            _command_code(CMD_ISO15693_READ_SINGLE_BLOCK): self._iso15693_read_single_block,
+            _command_code(CMD_ISO15693_WRITE_SINGLE_BLOCK): self._iso15693_write_single_block,
+            _command_code(CMD_ISO15693_READ_MULTIPLE_BLOCKS): self._iso15693_read_multiple_blocks,
+            _command_code(CMD_ISO15693_WRITE_MULTIPLE_BLOCK): self._iso15693_write_multiple_blocks,
+            _command_code(CMD_ISO15693_WRITE_AFI): self._iso15693_write_afi,
+            _command_code(CMD_ISO15693_GET_SYSTEM_INFO): self._iso15693_get_system_info,
+            _command_code(CMD_ISO14443A_INVENTORY): self._iso14443a_inventory,
+            _command_code(CMD_ISO14443A_SELECT_CARD): self._iso14443a_select_card,
+            _command_code(CMD_ISO14443A_MIFARE_AUTHENTICATE): self._mifare_authenticate,
+            _command_code(CMD_ISO14443A_MIFARE_READ): self._mifare_read,
+            _command_code(CMD_ISO14443A_MIFARE_WRITE): self._mifare_write,
+        }
+
+    # === Transport interface ===
+
+    def open(self) -> None:
+        self.is_open = True
+
+    def write(self, data: bytes) -> int:
+        if not self.is_open:
+            raise OSError("Simulated reader is not open")
+
+        frame = bytes(data[1:])  # Strip the HID report ID
+        length = frame[0] if frame else 0
+        code = (frame[1] << 8) | frame[2] if length >= 3 else 0
+        self.frames_received += 1
+        self.command_counts[code] = self.command_counts.get(code, 0) + 1
+
+        received_crc = (frame[length] << 8) | frame[length + 1] if 3 <= length <= len(frame) - 2 else None
+        if received_crc is None or received_crc != calc_crc(frame[:length]) & 0xFFFF:
+            self.crc_errors += 1
+            status, payload = SIM_STATUS_ERROR, b""
+        elif code == _command_code(CMD_ADDITIONAL_FRAME):
+            self._release_held_report()
+            return len(data)
+        elif time.monotonic() < self._busy_until:
+            self.busy_rejections += 1  # Frame arrived before the reader was ready again
+            status, payload = SIM_STATUS_ERROR, b""
+        else:
+            handler = self._handlers.get(code)
+            status, payload = handler(frame[3:length]) if handler else (SIM_STATUS_ERROR, b"")
+
+        self._queue_response(code, status, payload)
+        return len(data)
+
+    def read(self, size: int, timeout_ms: int = 0) -> bytes:
+        with self._cond:
+            deadline = time.monotonic() + timeout_ms / 1000 if timeout_ms > 0 else None
+            while True:
+                now = time.monotonic()
+                if self._pending and self._pending[0][0] <= now:
+                    return self._pending.popleft()[1][:size]
+                if deadline is None or now >= deadline:
+                    return b""
+                wake_at = min(self._pending[0][0], deadline) if self._pending else deadline
+                self._cond.wait(wake_at - now)
+
+    def close(self) -> None:
+        self.is_open = False
+        with self._cond:
+            self._pending.clear()
+            self._held.clear()
+
+    # === Frame handling ===
+
+    def _queue_response(self, code: int, status: int, payload: bytes) -> None:
+        """Build the response frame, split it into reports and queue it behind the turnaround delay."""
+        if status != SIM_STATUS_SUCCESS or 5 + len(payload) > SIM_MAX_FRAME_LENGTH:
+            status, payload = SIM_STATUS_ERROR, b""
+
+        body = bytes([5 + len(payload), code >> 8, code & 0xFF, status >> 8, status & 0xFF]) + payload
+        crc = calc_crc(body)
+        frame = body + bytes([(crc >> 8) & 0xFF, crc & 0xFF])
+
+        delay = self.command_latency.get(code, self.latency)
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        ready_at = time.monotonic() + delay
+        self._busy_until = ready_at + self.min_command_gap
+
+        reports = [frame[offset:offset + BUFFER_SIZE].ljust(BUFFER_SIZE, b"\x00")
+                   for offset in range(0, len(frame), BUFFER_SIZE)]
+        with self._cond:
+            self._held.clear()
+            if self.auto_continue:
+                self._pending.extend((ready_at, report) for report in reports)
+            else:
+                self._pending.append((ready_at, reports[0]))
+                self._held.extend(reports[1:])
+            self._cond.notify_all()
+
+    def _release_held_report(self) -> None:
+        """Answer an Additional Frame request with the next continuation report, if any."""
+        self.additional_frame_requests += 1
+        with self._cond:
+            if self._held:
+                self._pending.append((time.monotonic() + self.latency, self._held.popleft()))
+                self._cond.notify_all()
+
+    # === System commands ===
+
+    def _get_reader_info(self, params: bytes) -> Tuple[int, bytes]:
+        info = (self.model.encode() + b"-")[:13].ljust(13, b"\x00") + bytes.fromhex(self.serial)[-3:]
+        return SIM_STATUS_SUCCESS, info
+
+    def _buzzer_beep(self, params: bytes) -> Tuple[int, bytes]:
+        self.beeps += 1
+        return SIM_STATUS_SUCCESS, b""
+
+    def _buzzer_on(self, params: bytes) -> Tuple[int, bytes]:
+        self.buzzer_active = True
+        return SIM_STATUS_SUCCESS, b""
+
+    def _buzzer_off(self, params: bytes) -> Tuple[int, bytes]:
+        self.buzzer_active = False
+        return SIM_STATUS_SUCCESS, b""
+
+    # === ISO15693 ===
+
+    def _iso15693_target(self, params: bytes) -> Tuple[Optional[SimulatedISO15693Tag], bytes]:
+        """Resolve the addressed tag from the request flags; returns the tag and the remaining parameters."""
+        flags, rest = params[0], params[1:]
+        if flags & 0x20:  # Address flag: UID follows, little-endian
+            uid = rest[:8][::-1]
+            return next((t for t in self.iso15693_tags if t.uid_bytes == uid), None), rest[8:]
+        if flags & 0x10:  # Select flag
+            tag = self._selected_iso15693
+            return (tag if tag in self.iso15693_tags else None), rest
+        return next((t for t in self.iso15693_tags if not t.quiet), None), rest
+
+    def _iso15693_inventory_response(self, tags: List[SimulatedISO15693Tag]) -> Tuple[int, bytes]:
+        capacity = (SIM_MAX_FRAME_LENGTH - 6) // 8
+        tags = tags[:capacity]
+        return SIM_STATUS_SUCCESS, bytes([len(tags)]) + b"".join(t.uid_bytes[::-1] for t in tags)
+
+    def _iso15693_inventory_candidates(self, params: bytes) -> List[SimulatedISO15693Tag]:
+        """Tags that answer an inventory: not quiet, and matching the AFI if the AFI flag (0x10) is set."""
+        if params and params[0] & 0x10:
+            if len(params) < 2:
+                return []
+            return [t for t in self.iso15693_tags if not t.quiet and t.matches_afi(params[1])]
+        return [t for t in self.iso15693_tags if not t.quiet]
+
+    def _iso15693_single_slot_inventory(self, params: bytes) -> Tuple[int, bytes]:
+        tags = self._iso15693_inventory_candidates(params)
+        if self.slot_collisions and len(tags) > 1:
+            tags = []  # Every tag answers in the only slot
+        return self._iso15693_inventory_response(tags)
+
+    def _iso15693_16_slot_inventory(self, params: bytes) -> Tuple[int, bytes]:
+        slots: Dict[int, List[SimulatedISO15693Tag]] = {}
+        for tag in self._iso15693_inventory_candidates(params):
+            slot = self._random.randrange(16) if self.slot_collisions else len(slots)
+            slots.setdefault(slot, []).append(tag)
+        found = [members[0] for _, members in sorted(slots.items()) if len(members) == 1]
+        return self._iso15693_inventory_response(found)
+
+    def _iso15693_select(self, params: bytes) -> Tuple[int, bytes]:
+        tag, rest = self._iso15693_target(params)
+        if not tag or not params[0] & 0x20 or rest:
+            return SIM_STATUS_ERROR, b""
+        tag.quiet = False
+        self._selected_iso15693 = tag
+        return SIM_STATUS_SUCCESS, b"\x00"
+
+    def _iso15693_stay_quiet(self, params: bytes) -> Tuple[int, bytes]:
+        tag, rest = self._iso15693_target(params)
+        if not tag or not params[0] & 0x20 or rest:
+            return SIM_STATUS_ERROR, b""
+        tag.quiet = True
+        if self._selected_iso15693 is tag:
+            self._selected_iso15693 = None
+        return SIM_STATUS_SUCCESS, b""
+
+    def _iso15693_reset_to_ready(self, params: bytes) -> Tuple[int, bytes]:
+        tag, rest = self._iso15693_target(params)
+        if not tag or rest:
+            return SIM_STATUS_ERROR, b""
+        tag.quiet = False
+        if self._selected_iso15693 is tag:
+            self._selected_iso15693 = None
+        return SIM_STATUS_SUCCESS, b"\x00"
+
+    def _iso15693_read_single_block(self, params: bytes) -> Tuple[int, bytes]:
+        tag, rest = self._iso15693_target(params)
+        if not tag or len(rest) < 2 or rest[0] != tag.block_size:
+            return SIM_STATUS_ERROR, b""
+        data = tag.read_blocks(rest[1], 1)
+        return (SIM_STATUS_SUCCESS, b"\x00" + data) if data is not None else (SIM_STATUS_ERROR, b"")
+
+    def _iso15693_write_single_block(self, params: bytes) -> Tuple[int, bytes]:
+        tag, rest = self._iso15693_target(params)
+        if not tag or len(rest) != 2 + tag.block_size or rest[0] != tag.block_size:
+            return SIM_STATUS_ERROR, b""
+        return (SIM_STATUS_SUCCESS if tag.write_blocks(rest[1], rest[2:]) else SIM_STATUS_ERROR), b""
+
+    def _iso15693_read_multiple_blocks(self, params: bytes) -> Tuple[int, bytes]:
+        tag, rest = self._iso15693_target(params)
+        if not tag or len(rest) < 3 or rest[0] != tag.block_size:
+            return SIM_STATUS_ERROR, b""
+        # ISO15693 encodes the block count minus one
+        data = tag.read_blocks(rest[1], rest[2] + 1)
+        return (SIM_STATUS_SUCCESS, b"\x00" + data) if data is not None else (SIM_STATUS_ERROR, b"")
+
+    def _iso15693_write_multiple_blocks(self, params: bytes) -> Tuple[int, bytes]:
+        tag, rest = self._iso15693_target(params)
+        if not tag or len(rest) < 3 or rest[0] != tag.block_size:
+            return SIM_STATUS_ERROR, b""
+        data = rest[3:]
+        if len(data) != rest[2] * tag.block_size:
+            return SIM_STATUS_ERROR, b""
+        return (SIM_STATUS_SUCCESS if tag.write_blocks(rest[1], data) else SIM_STATUS_ERROR), b""
+
+    def _iso15693_write_afi(self, params: bytes) -> Tuple[int, bytes]:
+        tag, rest = self._iso15693_target(params)
+        if not tag or len(rest) != 1:
+            return SIM_STATUS_ERROR, b""
+        tag.afi = rest[0]
+        return SIM_STATUS_SUCCESS, b""
+
+    def _iso15693_get_system_info(self, params: bytes) -> Tuple[int, bytes]:
+        tag, rest = self._iso15693_target(params)
+        if not tag or rest:
+            return SIM_STATUS_ERROR, b""
+        # Info flags 0x0F: DSFID, AFI, memory size and IC reference all present
+        return SIM_STATUS_SUCCESS, (b"\x00\x0F" + tag.uid_bytes[::-1] + bytes([
+            tag.dsfid, tag.afi, tag.block_count - 1, tag.block_size - 1, tag.ic_reference]))
+
+    # === ISO14443A / Mifare Classic ===
+
+    def _card_in_field(self) -> Optional[SimulatedMifareCard]:
+        return self.mifare_cards[0] if self.mifare_cards else None
+
+    def _iso14443a_inventory(self, params: bytes) -> Tuple[int, bytes]:
+        card = self._card_in_field()
+        self._auth_sector = None
+        if not card:
+            self._selected_card = None
+            return SIM_STATUS_ERROR, b""
+        self._selected_card = card  # The reader auto-selects the detected card
+        return SIM_STATUS_SUCCESS, bytes([len(card.uid_bytes)]) + card.uid_bytes
+
+    def _iso14443a_select_card(self, params: bytes) -> Tuple[int, bytes]:
+        card = self._card_in_field()
+        self._auth_sector = None
+        if not card or len(params) < 1 or params[1:1 + len(card.uid_bytes)] != card.uid_bytes:
+            self._selected_card = None
+            return SIM_STATUS_ERROR, b""
+        self._selected_card = card
+        return SIM_STATUS_SUCCESS, b""
+
+    def _selected_card_in_field(self) -> Optional[SimulatedMifareCard]:
+        card = self._selected_card
+        return card if card is not None and card is self._card_in_field() else None
+
+    def _mifare_authenticate(self, params: bytes) -> Tuple[int, bytes]:
+        card = self._selected_card_in_field()
+        self._auth_sector = None
+        if not card or len(params) != 12 or params[0:4] != card.uid_bytes[:4]:
+            return SIM_STATUS_ERROR, b""
+        block, key_type, key = params[4], params[5], params[6:12]
+        if block >= card.block_count or key_type not in (0x60, 0x61) or card.key(block, key_type) != key:
+            self._selected_card = None  # A rejected key halts the card until it is selected again
+            return SIM_STATUS_ERROR, b""
+        self._auth_sector = card.sector_of(block)
+        return SIM_STATUS_SUCCESS, b""
+
+    def _mifare_block_accessible(self, card: Optional[SimulatedMifareCard], block: int) -> bool:
+        return (card is not None and block < card.block_count
+                and self._auth_sector is not None and card.sector_of(block) == self._auth_sector)
+
+    def _mifare_read(self, params: bytes) -> Tuple[int, bytes]:
+        card = self._selected_card_in_field()
+        if len(params) != 1 or not self._mifare_block_accessible(card, params[0]):
+            self._auth_sector = None
+            return SIM_STATUS_ERROR, b""
+        data = card.get_block(params[0])
+        if card.is_trailer(params[0]):
+            data = bytes(6) + data[6:]  # Key A is never readable
+        return SIM_STATUS_SUCCESS, data
+
+    def _mifare_write(self, params: bytes) -> Tuple[int, bytes]:
+        card = self._selected_card_in_field()
+        if (len(params) != 1 + MIFARE_BLOCK_SIZE or params[0] == 0
+                or not self._mifare_block_accessible(card, params[0])):
+            self._auth_sector = None
+            return SIM_STATUS_ERROR, b""
+        card.set_block(params[0], params[1:])
+        return SIM_STATUS_SUCCESS, b""
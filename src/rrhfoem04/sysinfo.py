@@ -0,0 +1,166 @@
+"""
+ISO15693 Get System Information parsing and tag geometry registry.
+
+`parse_system_info()` decodes a Get System Information response into a
+`TagInfo` (UID, DSFID, AFI, block size, block count, IC reference). Each field
+except the UID is optional and present only when the tag sets the matching bit
+of its info flags.
+
+`TagInfoRegistry` remembers the `TagInfo` of every tag queried, keyed by UID,
+and the memory geometry of every (manufacturer, IC reference) pair seen, so a
+tag that does not report its memory size can borrow it from another tag of the
+same IC. The reader keeps one registry and sizes chunked reads and writes from
+it without querying the tag again.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
+
+from .constants import TAG_INFO_MAX_ENTRIES
+
+# Info flags of the Get System Information response
+INFO_FLAG_DSFID = 0x01
+INFO_FLAG_AFI = 0x02
+INFO_FLAG_MEMORY_SIZE = 0x04
+INFO_FLAG_IC_REFERENCE = 0x08
+
+
+class TagInfo:
+    """System information of one ISO15693 tag. Fields the tag does not report are None."""
+
+    __slots__ = ('uid', 'dsfid', 'afi', 'block_size', 'block_count', 'ic_reference')
+
+    def __init__(self, uid: str, dsfid: Optional[int] = None, afi: Optional[int] = None,
+                 block_size: Optional[int] = None, block_count: Optional[int] = None,
+                 ic_reference: Optional[int] = None):
+        """
+        Args:
+            uid: UID as an uppercase hex string, most significant byte first (as returned by inventory)
+            dsfid: Data Storage Format Identifier
+            afi: Application Family Identifier
+            block_size: Size of each memory block in bytes
+            block_count: Number of memory blocks
+            ic_reference: IC reference byte
+        """
+        self.uid = uid
+        self.dsfid = dsfid
+        self.afi = afi
+        self.block_size = block_size
+        self.block_count = block_count
+        self.ic_reference = ic_reference
+
+    @property
+    def manufacturer(self) -> int:
+        """IC manufacturer code (second UID byte, after the E0 prefix)."""
+        return int(self.uid[2:4], 16)
+
+    @property
+    def memory_size(self) -> Optional[int]:
+        """User memory in bytes, if the tag reports its geometry."""
+        if self.block_size is None or self.block_count is None:
+            return None
+        return self.block_size * self.block_count
+
+    def __repr__(self) -> str:
+        return (f"TagInfo(uid='{self.uid}', dsfid={self.dsfid}, afi={self.afi}, block_size={self.block_size}, "
+                f"block_count={self.block_count}, ic_reference={self.ic_reference})")
+
+
+def parse_system_info(payload: Union[bytes, memoryview]) -> TagInfo:
+    """
+    Decode the payload of a Get System Information response.
+
+    Layout: response flags, info flags, 8-byte little-endian UID, then DSFID,
+    AFI, memory size (block count - 1, block size - 1) and IC reference, each
+    present only if its info flag is set.
+
+    Raises:
+        ValueError: If the payload is shorter than its info flags announce
+    """
+    if len(payload) < 10:
+        raise ValueError(f"System information of {len(payload)} bytes is too short")
+    info_flags = payload[1]
+    info = TagInfo(bytes(payload[2:10][::-1]).hex().upper())
+
+    pos = 10
+    needed = pos + sum(1 for flag in (INFO_FLAG_DSFID, INFO_FLAG_AFI, INFO_FLAG_IC_REFERENCE) if info_flags & flag)
+    needed += 2 if info_flags & INFO_FLAG_MEMORY_SIZE else 0
+    if len(payload) < needed:
+        raise ValueError(f"System information of {len(payload)} bytes is too short for info flags {info_flags:02X}")
+
+    if info_flags & INFO_FLAG_DSFID:
+        info.dsfid = payload[pos]
+        pos += 1
+    if info_flags & INFO_FLAG_AFI:
+        info.afi = payload[pos]
+        pos += 1
+    if info_flags & INFO_FLAG_MEMORY_SIZE:
+        info.block_count = payload[pos] + 1
+        info.block_size = (payload[pos + 1] & 0x1F) + 1
+        pos += 2
+    if info_flags & INFO_FLAG_IC_REFERENCE:
+        info.ic_reference = payload[pos]
+    return info
+
+
+class TagInfoRegistry:
+    """Bounded LRU registry of `TagInfo` by UID, with memory geometry by (manufacturer, IC reference)."""
+
+    def __init__(self, max_entries: int = TAG_INFO_MAX_ENTRIES):
+        """
+        Args:
+            max_entries: Maximum number of tags remembered before the least recently used one is evicted
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._tags: "OrderedDict[str, TagInfo]" = OrderedDict()
+        # (manufacturer, IC reference) -> (block size, block count)
+        self._ics: Dict[Tuple[int, int], Tuple[int, int]] = {}
+
+    def get(self, uid: str) -> Optional[TagInfo]:
+        """Return the registered information of tag `uid`, or None."""
+        with self._lock:
+            info = self._tags.get(uid.upper())
+            if info is not None:
+                self._tags.move_to_end(info.uid)
+            return info
+
+    def put(self, info: TagInfo) -> TagInfo:
+        """
+        Register a tag's information and return it.
+
+        A tag that reports its IC reference but not its memory size gets the
+        geometry last seen on a tag of the same IC; one that reports both
+        teaches it to the registry.
+        """
+        with self._lock:
+            if info.ic_reference is not None:
+                ic = (info.manufacturer, info.ic_reference)
+                if info.block_size is not None and info.block_count is not None:
+                    self._ics[ic] = (info.block_size, info.block_count)
+                elif ic in self._ics:
+                    info.block_size, info.block_count = self._ics[ic]
+            self._tags[info.uid] = info
+            self._tags.move_to_end(info.uid)
+            while len(self._tags) > self.max_entries:
+                self._tags.popitem(last=False)
+        return info
+
+    def ic_geometry(self, manufacturer: int, ic_reference: int) -> Optional[Tuple[int, int]]:
+        """Return the (block size, block count) seen on tags of this IC, if any."""
+        with self._lock:
+            return self._ics.get((manufacturer, ic_reference))
+
+    def invalidate(self, uid: Optional[str] = None) -> None:
+        """Forget tag `uid`, or every tag if None (IC geometry is kept)."""
+        with self._lock:
+            if uid is None:
+                self._tags.clear()
+            else:
+                self._tags.pop(uid.upper(), None)
+
+    def __len__(self) -> int:
+        return len(self._tags)
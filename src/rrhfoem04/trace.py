@@ -0,0 +1,75 @@
+"""
+Frame trace ring buffer for the RRHFOEM04 reader.
+
+`FrameTrace` keeps the last `capacity` frames exchanged with the reader as raw
+bytes (length byte to CRC, without the HID report ID and padding), each with
+its direction and a `time.monotonic()` timestamp. Recording does no
+formatting; hex is only produced when the trace is dumped, e.g. after a
+field issue:
+
+    trace = FrameTrace()
+    reader = RRHFOEM04(frame_trace=trace)
+    ...
+    print(trace.dump())
+"""
+
+import threading
+import time
+from collections import deque
+from typing import List, Optional, TextIO, Tuple, Union
+
+from .constants import FRAME_TRACE_CAPACITY
+
+# Frame directions
+TX = 'TX'
+RX = 'RX'
+
+
+class FrameTrace:
+    """Fixed-size ring buffer of (timestamp, direction, frame) entries; the oldest entry is overwritten."""
+
+    def __init__(self, capacity: int = FRAME_TRACE_CAPACITY):
+        """
+        Args:
+            capacity: Number of frames kept
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._frames: "deque[Tuple[float, str, bytes]]" = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def record(self, direction: str, frame: Union[bytes, bytearray, memoryview]) -> None:
+        """Append a frame (copied if mutable) sent (TX) or received (RX) now."""
+        entry = (time.monotonic(), direction, bytes(frame))
+        with self._lock:
+            self._frames.append(entry)
+
+    def entries(self) -> List[Tuple[float, str, bytes]]:
+        """Return the recorded (timestamp, direction, frame) entries, oldest first."""
+        with self._lock:
+            return list(self._frames)
+
+    def dump(self, stream: Optional[TextIO] = None) -> str:
+        """
+        Format the trace, one frame per line: monotonic timestamp, direction, frame in hex.
+
+        Args:
+            stream: Optional text stream (e.g. `sys.stderr` or an open file) the dump is also written to
+
+        Returns:
+            str: The formatted trace
+        """
+        text = "".join(f"{timestamp:.6f} {direction} {frame.hex().upper()}\n"
+                       for timestamp, direction, frame in self.entries())
+        if stream is not None:
+            stream.write(text)
+        return text
+
+    def clear(self) -> None:
+        """Drop every recorded frame."""
+        with self._lock:
+            self._frames.clear()
+
+    def __len__(self) -> int:
+        return len(self._frames)
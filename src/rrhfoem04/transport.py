@@ -0,0 +1,126 @@
+"""
+Transport layer for the RRHFOEM04 RFID/NFC reader library.
+
+The reader class never talks to USB directly; it exchanges raw 64-byte HID
+reports through a transport object. This module defines the minimal transport
+interface (open/write/read/close) and the default implementation backed by the
+`hidapi` package. Alternative transports, such as the bundled simulated reader
+in `simulator.py`, only need to implement the same four methods.
+
+The `hid` module is imported on first use, so importing the library (or
+running it on the simulator) does not load the HID backend.
+"""
+
+from typing import Dict, List, Optional
+
+from .constants import VENDOR_ID, PRODUCT_ID
+
+
+def _hid():
+    """Import and return the `hid` module (Hardware Interface Device library for USB communication)."""
+    import hid
+    return hid
+
+
+class Transport:
+    """
+    Base interface for moving HID reports between the host and a reader.
+
+    Transports deal in raw reports only: framing, CRC and response parsing
+    stay in `RRHFOEM04`. Subclasses must implement all four methods.
+    """
+
+    def open(self) -> None:
+        """
+        Open the underlying device.
+
+        Raises:
+            Exception: Any error raised here is wrapped into `ConnectionError` by the reader
+        """
+        raise NotImplementedError
+
+    def write(self, data: bytes) -> int:
+        """
+        Write one output report.
+
+        Args:
+            data: Report bytes, including the leading 0x00 report ID
+
+        Returns:
+            int: Number of bytes written
+        """
+        raise NotImplementedError
+
+    def read(self, size: int, timeout_ms: int = 0) -> bytes:
+        """
+        Read one input report.
+
+        Args:
+            size: Maximum number of bytes to read
+            timeout_ms: 0 for a non-blocking read, otherwise the maximum time to wait
+
+        Returns:
+            bytes: Report contents, or empty bytes if nothing is available
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Close the underlying device and release its resources."""
+        raise NotImplementedError
+
+
+def enumerate_readers(vendor_id: int = VENDOR_ID, product_id: int = PRODUCT_ID) -> List[Dict]:
+    """
+    List the attached readers matching the vendor and product IDs.
+
+    Returns:
+        List[Dict]: One `hid.enumerate` entry per device path ('path', 'serial_number', ...)
+    """
+    readers = {}
+    for info in _hid().enumerate(vendor_id, product_id):
+        readers.setdefault(info['path'], info)
+    return list(readers.values())
+
+
+class HidTransport(Transport):
+    """
+    Transport backed by a physical reader attached over USB HID.
+
+    By default the first device matching the RRHFOEM04 vendor and product IDs
+    is opened; pass `path` (from `enumerate_readers()`) to open a specific one.
+    The device is put in non-blocking mode so that reads without a timeout
+    return immediately.
+    """
+
+    def __init__(self, vendor_id: int = VENDOR_ID, product_id: int = PRODUCT_ID, path: Optional[bytes] = None):
+        """
+        Args:
+            vendor_id: USB vendor ID to open. Defaults to the RRHFOEM04 vendor ID.
+            product_id: USB product ID to open. Defaults to the RRHFOEM04 product ID.
+            path: HID device path to open instead of the first vendor/product match.
+        """
+        self.vendor_id = vendor_id
+        self.product_id = product_id
+        self.path = path
+        self._device = None  # hid.device once open
+
+    def open(self) -> None:
+        self._device = _hid().device()
+        if self.path is not None:
+            self._device.open_path(self.path)
+        else:
+            self._device.open(self.vendor_id, self.product_id)
+        self._device.set_nonblocking(1)  # Enable non-blocking mode for better timing control
+
+    def write(self, data: bytes) -> int:
+        return self._device.write(data)
+
+    def read(self, size: int, timeout_ms: int = 0) -> bytes:
+        return bytes(self._device.read(size, timeout_ms))
+
+    def close(self) -> None:
+        if self._device:
+            try:
+                self._device.close()
+            finally:
+                self._device = None
@@ -1,11 +1,117 @@
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Iterable, List, Sequence
 
 
 class RRHFOEM04Result:
-    def __init__(self, success: bool, message: str, data: Optional[Any] = None):
-        self.success = success
-        self.message = message
-        self.data = data
-    
+    """
+    Immutable result of a reader operation.
+
+    `data` may be given directly or produced on first access by `decode`, a
+    zero-argument callable (e.g. formatting UIDs from the response payload), so
+    results that are only checked for `success` never build their hex strings.
+    Operations answered by a single command also carry the response frame
+    (`raw`, as read from the device), its 16-bit `status` and `elapsed`, the
+    seconds from writing the command to the complete response; these are None
+    otherwise (cached reads, multi-command operations, no response).
+    """
+
+    __slots__ = ('success', 'message', '_data', '_decode', 'raw', 'status', 'elapsed')
+
+    def __init__(self, success: bool, message: str, data: Optional[Any] = None, raw: Optional[bytes] = None,
+                 status: Optional[int] = None, elapsed: Optional[float] = None,
+                 decode: Optional[Callable[[], Any]] = None):
+        init = object.__setattr__
+        init(self, 'success', success)
+        init(self, 'message', message)
+        init(self, '_data', data)
+        init(self, '_decode', decode)
+        init(self, 'raw', raw)
+        init(self, 'status', status)
+        init(self, 'elapsed', elapsed)
+
+    @property
+    def data(self) -> Optional[Any]:
+        decode = self._decode
+        if decode is not None:
+            # Store the value before dropping the decoder so concurrent readers never see neither
+            object.__setattr__(self, '_data', decode())
+            object.__setattr__(self, '_decode', None)
+        return self._data
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self):
+        # Pickle (and copy) the decoded data, not the decoder
+        return (self.__class__, (self.success, self.message, self.data, self.raw, self.status, self.elapsed))
+
     def __str__(self) -> str:
-        return f"RRHFOEM04Result(success={self.success}, message='{self.message}', data={self.data})"
\ No newline at end of file
+        return f"RRHFOEM04Result(success={self.success}, message='{self.message}', data={self.data})"
+
+
+def _build_crc_table() -> List[int]:
+    """
+    Precompute the contribution of every possible high byte to the RRHFOEM04 CRC.
+
+    The reader's CRC XORs each data byte into the *low* byte of the register and
+    then shifts left eight times. Bits of the low byte are shifted out of the
+    16-bit window only after the loop, so only the high byte drives the
+    polynomial feedback: eight shifts of `crc` equal
+    `((crc << 8) & 0xFFFF) ^ table[crc >> 8]`.
+    """
+    table = []
+    for high in range(256):
+        crc = high << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
+        table.append(crc & 0xFFFF)
+    return table
+
+
+_CRC_TABLE = _build_crc_table()
+
+
+def calc_crc(data: Iterable[int]) -> int:
+    """
+    Calculate the CRC-16 used by RRHFOEM04 frames (CCITT polynomial 0x1021,
+    initial value 0xFFFF, inverted output).
+
+    Shared by the reader (outgoing frames) and the simulated device (responses).
+    Uses a 256-entry lookup table; the result is byte-identical to the
+    bit-by-bit routine in the protocol reference.
+
+    Args:
+        data: Frame bytes, starting at the length byte and excluding the CRC
+
+    Returns:
+        int: Inverted 16-bit CRC value
+    """
+    table = _CRC_TABLE
+    crc = 0xFFFF  # Initial CRC value
+    for byte in data:
+        crc ^= byte  # XOR byte into the low byte of the register
+        crc = ((crc << 8) & 0xFFFF) ^ table[crc >> 8]
+    return ~crc & 0xFFFF  # Return inverted CRC
+
+
+def verify_crc(frame: Sequence[int]) -> bool:
+    """
+    Check the CRC of a complete response frame.
+
+    The frame starts with its length byte; the two CRC bytes (most significant
+    first) follow the `length` bytes it covers.
+
+    Args:
+        frame: Response bytes as read from the device (trailing padding is ignored)
+
+    Returns:
+        bool: True if the frame is long enough and its CRC matches
+    """
+    if not frame:
+        return False
+    length = frame[0]
+    if length < 3 or len(frame) < length + 2:
+        return False
+    return calc_crc(frame[:length]) == (frame[length] << 8) | frame[length + 1]
@@ -0,0 +1,89 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import asyncio
+import unittest
+from rrhfoem04 import ARRIVAL, PRESENT, AsyncRRHFOEM04, SimulatedReader, SimulatedISO15693Tag, SimulatedMifareCard
+
+
+class TestAsyncRRHFOEM04(unittest.TestCase):
+
+    def setUp(self):
+        self.tag = SimulatedISO15693Tag("E004010012345678", data=bytes(range(16)))
+
+    def test_operations(self):
+        async def scenario():
+            async with AsyncRRHFOEM04(transport=SimulatedReader(iso15693_tags=[self.tag], latency=0.001)) as reader:
+                self.assertEqual((await reader.getReaderInfo()).data['model'], "RRHFOEM04")
+                self.assertEqual((await reader.ISO15693_16SlotInventory()).data, [self.tag.uid])
+                self.assertTrue((await reader.ISO15693_writeSingleBlock(2, "ACC", uid=self.tag.uid)).success)
+                self.assertEqual((await reader.ISO15693_readSingleBlock(2, uid=self.tag.uid)).data, "00434341")
+                chunks = [bytes(data) async for _, data in reader.iter_memory(self.tag.uid, 0, 28, chunk_blocks=10)]
+                self.assertEqual(b"".join(chunks), bytes(self.tag.memory))
+
+        asyncio.run(scenario())
+
+    def test_iter_card(self):
+        async def scenario():
+            card = SimulatedMifareCard("A1B2C3D4")
+            async with AsyncRRHFOEM04(transport=SimulatedReader(mifare_cards=[card], latency=0.0005),
+                                      pacing="adaptive") as reader:
+                sectors = [sector async for sector in reader.iter_card(card.uid)]
+                self.assertEqual([block for block, _ in sectors], list(range(0, 64, 4)))
+                image = b"".join(data for _, data in sectors)
+                self.assertEqual(image, bytes((await reader.dump_card(card.uid)).data))
+
+        asyncio.run(scenario())
+
+    def test_watch_inventory(self):
+        async def scenario():
+            events = []
+
+            async def on_event(event):
+                events.append((event.kind, event.uid))
+                return len(events) < 2
+
+            async with AsyncRRHFOEM04(transport=SimulatedReader(iso15693_tags=[self.tag], latency=0.0005),
+                                      pacing="adaptive") as reader:
+                await reader.watch_inventory(on_event, max_cycles=5)
+                # The stream was closed, so the reader is free for the next call
+                self.assertTrue((await reader.getReaderInfo()).success)
+            return events
+
+        self.assertEqual(asyncio.run(scenario()), [(ARRIVAL, self.tag.uid), (PRESENT, self.tag.uid)])
+
+    def test_event_loop_not_blocked(self):
+        async def scenario():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            async with AsyncRRHFOEM04(transport=SimulatedReader(latency=0.001)) as reader:
+                task = asyncio.create_task(ticker())
+                # Two fixed 100 ms pacing gaps plus the buzzer delays
+                await reader.buzzer_beep()
+                await reader.getReaderInfo()
+                task.cancel()
+            return ticks
+
+        self.assertGreater(asyncio.run(scenario()), 10)
+
+    def test_timeout_and_recovery(self):
+        async def scenario():
+            device = SimulatedReader(iso15693_tags=[self.tag], latency=0.001, command_latency={0x1002: 0.3})
+            async with AsyncRRHFOEM04(transport=device) as reader:
+                with self.assertRaises(TimeoutError):
+                    async with asyncio.timeout(0.15):
+                        await reader.ISO15693_16SlotInventory()
+                # The reader stays usable after a cancelled call
+                self.assertTrue((await reader.getReaderInfo()).success)
+
+        asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
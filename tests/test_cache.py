@@ -0,0 +1,99 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import time
+import unittest
+from rrhfoem04 import RRHFOEM04, BlockCache, SimulatedReader, SimulatedISO15693Tag, SimulatedMifareCard
+
+
+class TestBlockCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = BlockCache(max_entries=2, ttl=None)
+        cache.put("E004", 0, b"AAAA")
+        cache.put("E004", 1, b"BBBB")
+        self.assertEqual(cache.get("e004", 0), b"AAAA")  # Block 0 is now the most recently used
+        cache.put("E004", 2, b"CCCC")
+        self.assertIsNone(cache.get("E004", 1))
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1, 'evictions': 1, 'expirations': 0, 'entries': 2})
+
+    def test_ttl_and_size(self):
+        cache = BlockCache(ttl=0.01)
+        cache.put("E004", 0, b"AAAA")
+        self.assertIsNone(cache.get("E004", 0, size=16))
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("E004", 0))
+        self.assertEqual(cache.expirations, 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate(self):
+        cache = BlockCache()
+        cache.put_blocks("E004", 0, bytes(16), 4)
+        cache.put("A1B2", 4, bytes(16))
+        cache.invalidate("E004", 1, count=2)
+        self.assertEqual(len(cache), 3)
+        cache.invalidate("E004")
+        self.assertEqual(len(cache), 1)
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
+
+
+class TestReaderBlockCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tag = SimulatedISO15693Tag("E004010012345678", data=bytes(range(16)))
+        self.card = SimulatedMifareCard("A1B2C3D4")
+        self.device = SimulatedReader(iso15693_tags=[self.tag], mifare_cards=[self.card], latency=0.001)
+        self.cache = BlockCache()
+        self.reader = RRHFOEM04(transport=self.device, pacing="adaptive", block_cache=self.cache)
+
+    def tearDown(self):
+        self.reader.close()
+
+    def test_iso15693_read_through(self):
+        uid = self.tag.uid
+        self.assertEqual(self.reader.ISO15693_readMultipleBlocks(0, total_blocks=3, uid=uid).data,
+                         "03020100070605040B0A09080F0E0D0C")
+        frames = self.device.frames_received
+        self.assertEqual(self.reader.ISO15693_readSingleBlock(1, uid=uid).data, "07060504")
+        self.assertEqual(self.reader.ISO15693_readMultipleBlocks(1, total_blocks=1, uid=uid).data, "070605040B0A0908")
+        self.assertEqual(self.device.frames_received, frames)
+        self.assertEqual(self.cache.hits, 3)
+
+        # Non-addressed reads always go to the device
+        self.reader.ISO15693_readSingleBlock(1)
+        self.assertEqual(self.device.frames_received, frames + 1)
+
+    def test_iso15693_write_through(self):
+        uid = self.tag.uid
+        self.reader.ISO15693_readSingleBlock(2, uid=uid)
+        self.assertTrue(self.reader.ISO15693_writeSingleBlock(2, "ACC", uid=uid).success)
+        self.assertEqual(self.cache.get(uid, 2), b"ACC\x00")
+        self.assertTrue(self.reader.ISO15693_writeMultipleBlocks(2, "12345678", uid=uid).success)
+        self.assertEqual(self.cache.get(uid, 3), b"5678")
+
+        # A failed write leaves nothing stale behind
+        self.assertFalse(self.reader.ISO15693_writeSingleBlock(200, "ACC", uid=uid).success)
+        self.assertIsNone(self.cache.get(uid, 200))
+
+        # More than one block of data is rejected before anything is sent or cached
+        frames = self.device.frames_received
+        self.assertFalse(self.reader.ISO15693_writeSingleBlock(2, "ABCDEFGH", uid=uid).success)
+        self.assertEqual(self.device.frames_received, frames)
+        self.assertEqual(self.cache.get(uid, 2), b"1234")
+        self.assertIsNone(self.cache.get(uid, 4))
+
+        # Non-addressed writes could reach any tag
+        self.reader.ISO15693_writeSingleBlock(2, "X")
+        self.assertEqual(len(self.cache), 0)
+
+    def test_mifare_read_through(self):
+        self.assertTrue(self.reader.ISO14443A_mifareWrite("KJ000F00#", uid=self.card.uid, block_number=4).success)
+        frames = self.device.frames_received
+        result = self.reader.ISO14443A_mifareRead(self.card.uid, block_number=4)
+        self.assertEqual(bytes.fromhex(result.data), b"KJ000F00#".ljust(16, b"\x00"))
+        self.assertEqual(self.device.frames_received, frames)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import unittest
+from rrhfoem04 import ValidationError
+from rrhfoem04.constants import *
+from rrhfoem04.codec import CommandCodec, RawResponse, encode_frame, status_text, uid_to_le
+
+
+class TestCommandCodec(unittest.TestCase):
+
+    def setUp(self):
+        self.codec = CommandCodec()
+
+    def test_fixed_frames(self):
+        self.assertEqual(self.codec.frame('GET_READER_INFO'), encode_frame(CMD_GET_READER_INFO))
+        self.assertEqual(len(self.codec.frame('ISO15693_16_SLOT_INVENTORY')), 65)
+
+    def test_build_matches_hand_built_frames(self):
+        uid = "E004010012345678"
+        cmd = CMD_ISO15693_READ_SINGLE_BLOCK_WITH_ADDRESS_FLAG + [*uid_to_le(uid), 4, 7]
+        self.assertEqual(self.codec.build('ISO15693_READ_SINGLE_BLOCK_WITH_ADDRESS_FLAG', uid_to_le(uid), 4, 7),
+                         encode_frame(cmd))
+
+        cmd = CMD_ISO15693_WRITE_SINGLE_BLOCK.copy()
+        cmd[0] += 4
+        cmd.extend([4, 2, *b"ACC\x00"])
+        self.assertEqual(self.codec.build('ISO15693_WRITE_SINGLE_BLOCK', 4, 2, b"ACC\x00"), encode_frame(cmd))
+
+    def test_buffer_reuse_clears_longer_frame(self):
+        self.codec.build('ISO15693_WRITE_MULTIPLE_BLOCK', 4, 0, 2, bytes(range(1, 9)))
+        frame = self.codec.build('ISO15693_WRITE_MULTIPLE_BLOCK', 4, 0, 1, b"\x01\x02\x03\x04")
+        self.assertEqual(frame, encode_frame([0x0B, 0x1F, 0x02, 0x02, 4, 0, 1, 1, 2, 3, 4]))
+
+    def test_oversized_frame(self):
+        with self.assertRaises(ValidationError):
+            self.codec.build('ISO15693_WRITE_MULTIPLE_BLOCK', 4, 0, 16, bytes(64))
+
+
+class TestRawResponse(unittest.TestCase):
+
+    def test_accessors(self):
+        response = RawResponse(bytes([0x08, 0x10, 0x01, 0x00, 0x00, 0x0A, 0xAB, 0xCD, 0x12, 0x34]).ljust(64, b"\x00"))
+        self.assertTrue(response.ok)
+        self.assertEqual(response.command, 0x1001)
+        self.assertEqual(bytes(response.payload), bytes([0x0A, 0xAB, 0xCD]))
+        # The count byte is binary, not a decimal hex token
+        self.assertEqual(response.payload[0], 10)
+
+        error = RawResponse(bytes([0x05, 0xFF, 0xFF, 0x00, 0x1F, 0x00, 0x00]))
+        self.assertFalse(error.ok)
+        self.assertEqual(len(error.payload), 0)
+        self.assertEqual(status_text(error), "001F")
+        self.assertEqual(status_text(None), "no response")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import random
+import unittest
+from rrhfoem04 import RRHFOEM04, SimulatedReader, CommunicationError
+from rrhfoem04.utils import calc_crc, verify_crc
+
+
+def reference_crc(data):
+    """Bit-by-bit routine from the protocol reference"""
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
+    return ~crc
+
+
+class TestCRC(unittest.TestCase):
+
+    def test_matches_reference(self):
+        rng = random.Random(0)
+        frames = [[0x03, 0xF0, 0x00], [0x04, 0x10, 0x02, 0x06], []]
+        frames += [[rng.randrange(256) for _ in range(rng.randrange(1, 62))] for _ in range(200)]
+        for frame in frames:
+            self.assertEqual(calc_crc(frame), reference_crc(frame) & 0xFFFF)
+
+    def test_verify_crc(self):
+        body = bytes([0x05, 0xF0, 0x01, 0x00, 0x00])
+        crc = calc_crc(body)
+        frame = body + bytes([crc >> 8, crc & 0xFF]) + bytes(57)
+        self.assertTrue(verify_crc(frame))
+        self.assertFalse(verify_crc(frame[:6]))
+        self.assertFalse(verify_crc(body + bytes([crc >> 8, (crc + 1) & 0xFF])))
+
+    def test_reader_rejects_corrupt_response(self):
+        class CorruptingReader(SimulatedReader):
+            def read(self, size, timeout_ms=0):
+                report = bytearray(super().read(size, timeout_ms))
+                if report:
+                    report[5] ^= 0xFF
+                return bytes(report)
+
+        with RRHFOEM04(transport=CorruptingReader(), validate_crc=True) as reader:
+            with self.assertRaises(CommunicationError):
+                reader._send_command([0x03, 0xF0, 0x00])
+            self.assertFalse(reader.getReaderInfo().success)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import unittest
+from rrhfoem04 import (RRHFOEM04, HOOK_ERROR, HOOK_RECEIVE, HOOK_SEND, SimulatedReader, SimulatedISO15693Tag,
+                       SimulatedMifareCard)
+from rrhfoem04.metrics import OUTCOME_ERROR, OUTCOME_OK, OUTCOME_TIMEOUT
+
+
+class TestFrameHooks(unittest.TestCase):
+
+    def setUp(self):
+        self.tag = SimulatedISO15693Tag("E004010012345678")
+        self.events = []
+
+    def hooks(self, reader):
+        for event in (HOOK_SEND, HOOK_RECEIVE, HOOK_ERROR):
+            reader.add_hook(event, lambda exchange, event=event: self.events.append((event, exchange)))
+
+    def test_send_and_receive(self):
+        device = SimulatedReader(iso15693_tags=[self.tag], latency=0.0005)
+        with RRHFOEM04(transport=device, pacing="adaptive") as reader:
+            self.hooks(reader)
+            reader.ISO15693_16SlotInventory()
+            reader.ISO15693_readSingleBlock(0, uid=self.tag.uid)
+            reader.ISO15693_readSingleBlock(0, uid="E004010099999999")
+
+        self.assertEqual([event for event, _ in self.events], [HOOK_SEND, HOOK_RECEIVE] * 3)
+        inventory, read, missing = (exchange for event, exchange in self.events[1::2])
+        self.assertIs(self.events[0][1], inventory)  # One object per exchange
+        self.assertEqual((inventory.name, inventory.uid, inventory.outcome), ('ISO15693_16_SLOT_INVENTORY', None,
+                                                                             OUTCOME_OK))
+        self.assertEqual((read.code, read.uid, read.bytes_out, read.status), (0x1006, self.tag.uid, 16, 0))
+        self.assertGreater(read.wait, 0)
+        self.assertGreater(read.bytes_in, 0)
+        self.assertEqual((missing.uid, missing.outcome), ("E004010099999999", OUTCOME_ERROR))
+        self.assertNotEqual(missing.status, 0)
+
+    def test_timeout_and_mifare_uid(self):
+        device = SimulatedReader(mifare_cards=[SimulatedMifareCard("A1B2C3D4")], latency=0.0005,
+                                 command_latency={0x2102: 2.0})
+        with RRHFOEM04(transport=device, pacing="adaptive") as reader:
+            self.hooks(reader)
+            self.assertFalse(reader.ISO14443A_mifareRead("A1B2C3D4", 4).success)
+        events = [(event, exchange.name, exchange.uid) for event, exchange in self.events if event != HOOK_SEND]
+        self.assertEqual(events[0], (HOOK_RECEIVE, 'ISO14443A_SELECT_CARD', "A1B2C3D4"))
+        self.assertEqual(events[-1], (HOOK_ERROR, 'ISO14443A_MIFARE_READ', "A1B2C3D4"))
+        self.assertEqual(self.events[-1][1].outcome, OUTCOME_TIMEOUT)
+
+    def test_failing_hook_and_remove(self):
+        def broken(exchange):
+            raise RuntimeError("tracer down")
+
+        device = SimulatedReader(iso15693_tags=[self.tag], latency=0.0005)
+        with RRHFOEM04(transport=device, pacing="adaptive") as reader:
+            reader.add_hook(HOOK_SEND, broken)
+            with self.assertLogs('RRHFOEM04', level='WARNING'):
+                self.assertTrue(reader.ISO15693_16SlotInventory().success)
+            reader.remove_hook(HOOK_SEND, broken)
+            self.assertEqual(reader._hooks, {})
+            with self.assertRaises(ValueError):
+                reader.add_hook('done', broken)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import unittest
+from rrhfoem04 import (RRHFOEM04, InventoryTracker, SimulatedReader, SimulatedISO15693Tag,
+                       ARRIVAL, DEPARTURE, PRESENT)
+
+
+class TestInventoryTracker(unittest.TestCase):
+
+    def test_debounced_departure(self):
+        tracker = InventoryTracker(debounce=2)
+        kinds = lambda events: [(e.kind, e.uid) for e in events]
+        self.assertEqual(kinds(tracker.update([b"A"], 1.0)), [(ARRIVAL, b"A")])
+        self.assertEqual(kinds(tracker.update([b"A", b"B"], 2.0)), [(PRESENT, b"A"), (ARRIVAL, b"B")])
+        self.assertEqual(kinds(tracker.update([b"B"], 3.0)), [(PRESENT, b"B")])  # A missed once
+        self.assertEqual(kinds(tracker.update([b"A", b"B"], 4.0)), [(PRESENT, b"A"), (PRESENT, b"B")])
+        tracker.update([], 5.0)
+        events = tracker.update([], 6.0)
+        self.assertEqual(sorted(kinds(events)), [(DEPARTURE, b"A"), (DEPARTURE, b"B")])
+        self.assertEqual((events[0].first_seen, events[0].last_seen, events[0].cycle), (1.0, 4.0, 6))
+        self.assertEqual(tracker.present, [])
+
+    def test_format_once_and_no_present(self):
+        formatted = []
+        tracker = InventoryTracker(debounce=1, emit_present=False)
+        fmt = lambda uid: formatted.append(uid) or uid.hex()
+        tracker.update([b"\x01"], 1.0, format_uid=fmt)
+        self.assertEqual(tracker.update([b"\x01"], 2.0, format_uid=fmt), [])
+        self.assertEqual(formatted, [b"\x01"])
+        self.assertEqual(tracker.update([], 3.0)[0].uid, "01")
+
+
+class TestStreamInventory(unittest.TestCase):
+
+    def test_arrival_and_departure(self):
+        tag = SimulatedISO15693Tag("E004010012345678")
+
+        class ConveyorReader(SimulatedReader):
+            """Tag is in the field during cycles 3 and 4 only"""
+            cycles = 0
+
+            def _iso15693_16_slot_inventory(self, params):
+                self.cycles += 1
+                self.iso15693_tags = [tag] if self.cycles in (3, 4) else []
+                return super()._iso15693_16_slot_inventory(params)
+
+        with RRHFOEM04(transport=ConveyorReader(latency=0.001), pacing="adaptive") as reader:
+            events = list(reader.stream_inventory(debounce=2, max_cycles=8))
+        self.assertEqual([(e.kind, e.cycle) for e in events], [(ARRIVAL, 3), (PRESENT, 4), (DEPARTURE, 6)])
+        self.assertEqual(events[0].uid, "E004010012345678")
+        self.assertTrue(all(e.latency > 0 for e in events))
+        self.assertLess(events[0].timestamp, events[-1].timestamp)
+
+    def test_callback_stops_stream(self):
+        device = SimulatedReader(iso15693_tags=[SimulatedISO15693Tag("E004010012345678")], latency=0.001)
+        events = []
+        with RRHFOEM04(transport=device, pacing="adaptive") as reader:
+            reader.watch_inventory(lambda event: events.append(event) or len(events) < 3, max_cycles=10)
+        self.assertEqual([e.kind for e in events], [ARRIVAL, PRESENT, PRESENT])
+
+
+class TestExhaustiveInventory(unittest.TestCase):
+
+    def tags(self, count):
+        return [SimulatedISO15693Tag(f"E00401000000{i:04X}") for i in range(count)]
+
+    def test_more_tags_than_one_response_holds(self):
+        tags = self.tags(40)
+        device = SimulatedReader(iso15693_tags=tags, latency=0.0005, slot_collisions=False)
+        with RRHFOEM04(transport=device, pacing="adaptive") as reader:
+            self.assertEqual(len(reader.ISO15693_16SlotInventory().data), 31)
+            result = reader.ISO15693_exhaustiveInventory()
+        self.assertEqual(result.data['uids'], [tag.uid for tag in tags])
+        self.assertEqual(result.data['cycles'], 3)  # 31 tags, then 9, then none
+        self.assertEqual(result.data['commands'], 3 + 40 + 40)
+        self.assertFalse(any(tag.quiet for tag in tags))
+
+    def test_collisions(self):
+        tags = self.tags(30)
+        device = SimulatedReader(iso15693_tags=tags, latency=0.0005, slot_collisions=True, seed=7)
+        with RRHFOEM04(transport=device, pacing="adaptive") as reader:
+            result = reader.ISO15693_exhaustiveInventory(reset=False, empty_cycles=2)
+        self.assertEqual(sorted(result.data['uids']), [tag.uid for tag in tags])
+        self.assertGreater(result.data['cycles'], 2)
+        self.assertTrue(all(tag.quiet for tag in tags))
+
+    def test_quiet_tag_answers_addressed_commands(self):
+        tag, other = self.tags(2)
+        device = SimulatedReader(iso15693_tags=[tag, other], latency=0.0005, slot_collisions=False)
+        with RRHFOEM04(transport=device, pacing="adaptive") as reader:
+            self.assertTrue(reader.ISO15693_stayQuiet(tag.uid).success)
+            self.assertEqual(reader.ISO15693_16SlotInventory().data, [other.uid])
+            self.assertTrue(reader.ISO15693_readSingleBlock(0, uid=tag.uid).success)
+            self.assertTrue(reader.ISO15693_resetToReady(uid=tag.uid).success)
+            self.assertEqual(len(reader.ISO15693_16SlotInventory().data), 2)
+            self.assertTrue(reader.ISO15693_select(other.uid).success)
+            self.assertTrue(reader.ISO15693_readSingleBlock(0, with_select_flag=True).success)
+
+
+class TestAFIInventory(unittest.TestCase):
+
+    def setUp(self):
+        self.tags = [SimulatedISO15693Tag(f"E004010000000{i:03X}", afi=afi)
+                     for i, afi in enumerate([0x27, 0x27, 0x12, 0x00, 0x17])]
+        self.device = SimulatedReader(iso15693_tags=self.tags, latency=0.0005, slot_collisions=False)
+        self.reader = RRHFOEM04(transport=self.device, pacing="adaptive")
+
+    def tearDown(self):
+        self.reader.close()
+
+    def uids(self, *indexes):
+        return [self.tags[i].uid for i in indexes]
+
+    def test_16_slot(self):
+        self.assertEqual(self.reader.ISO15693_16SlotInventory(afi=0x27).data, self.uids(0, 1))
+        self.assertEqual(self.reader.ISO15693_16SlotInventory(afi=0x10).data, self.uids(2, 4))  # Any sub-family
+        self.assertEqual(len(self.reader.ISO15693_16SlotInventory(afi=0x00).data), 5)
+
+    def test_single_slot(self):
+        self.assertEqual(self.reader.ISO15693_singleSlotInventory(afi=0x12).data, self.uids(2))
+
+    def test_written_afi(self):
+        self.assertTrue(self.reader.ISO15693_writeAFI(0x27, uid=self.tags[3].uid).success)
+        self.assertEqual(self.reader.ISO15693_16SlotInventory(afi=0x27).data, self.uids(0, 1, 3))
+
+    def test_stream_and_exhaustive(self):
+        events = list(self.reader.stream_inventory(afi=0x17, max_cycles=1))
+        self.assertEqual([e.uid for e in events], self.uids(4))
+        self.assertEqual(self.reader.ISO15693_exhaustiveInventory(afi=0x27).data['uids'], self.uids(0, 1))
+
+    def test_invalid_afi(self):
+        self.assertFalse(self.reader.ISO15693_16SlotInventory(afi=256).success)
+
+
+if __name__ == "__main__":
+    unittest.main()
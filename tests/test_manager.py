@@ -0,0 +1,62 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import time
+import unittest
+from unittest import mock
+from rrhfoem04 import ReaderManager, SimulatedReader, SimulatedISO15693Tag
+from rrhfoem04.exceptions import ConnectionError
+
+
+class TestReaderManager(unittest.TestCase):
+
+    def setUp(self):
+        self.devices = [
+            SimulatedReader(iso15693_tags=[SimulatedISO15693Tag(f"E0040100000000{i:02X}")],
+                            latency=0.05, serial=f"00000{i}")
+            for i in range(1, 4)
+        ]
+        self.manager = ReaderManager(self.devices)
+        self.manager.connect()
+
+    def tearDown(self):
+        self.manager.close()
+
+    def test_identity_from_serial(self):
+        self.assertEqual(list(self.manager.readers), ["000001", "000002", "000003"])
+
+    def test_parallel_inventory(self):
+        start = time.perf_counter()
+        result = self.manager.inventory()
+        elapsed = time.perf_counter() - start
+        self.assertTrue(result.success)
+        self.assertEqual(result.data, [{'reader': f"00000{i}", 'uid': f"E0040100000000{i:02X}"} for i in range(1, 4)])
+        # Three readers with 100 ms pacing and 50 ms turnaround each would take 450 ms serialized
+        self.assertLess(elapsed, 0.3)
+
+    def test_call_tags_results(self):
+        results = self.manager.call('ISO15693_readSingleBlock', 0, uid="E004010000000002")
+        self.assertTrue(results["000002"].success)
+        self.assertFalse(results["000001"].success)
+
+    def test_unopenable_reader_skipped(self):
+        class BrokenTransport(SimulatedReader):
+            def open(self):
+                raise OSError("unplugged")
+
+        with ReaderManager([BrokenTransport(), SimulatedReader(serial="000009")]) as manager:
+            self.assertEqual(list(manager.connect()), ["000009"])
+
+    def test_discover_closes_on_failed_connect(self):
+        with mock.patch('rrhfoem04.manager.enumerate_readers', return_value=[{'path': b'1'}]), \
+                mock.patch.object(ReaderManager, 'close', autospec=True, side_effect=ReaderManager.close) as close, \
+                mock.patch('rrhfoem04.manager.HidTransport.open', side_effect=OSError("unplugged")):
+            with self.assertRaises(ConnectionError):
+                ReaderManager.discover()
+        self.assertEqual(close.call_count, 1)
+        manager = close.call_args[0][0]
+        self.assertTrue(manager._executor._shutdown)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import unittest
+from rrhfoem04 import RRHFOEM04, CommandMetrics, ReaderManager, SimulatedReader, SimulatedISO15693Tag
+from rrhfoem04.metrics import OUTCOME_ERROR, OUTCOME_OK
+
+
+class TestCommandMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.tag = SimulatedISO15693Tag("E004010012345678")
+
+    def test_histogram_and_snapshot(self):
+        metrics = CommandMetrics(buckets=(0.01, 0.1))
+        metrics.record(0x1002, OUTCOME_OK, 0.0, 0.0, 0.005, 6, 20)
+        metrics.record(0x1002, OUTCOME_ERROR, 0.1, 0.001, 0.05, 6, 4, retries=1)
+        metrics.record(0x1002, OUTCOME_OK, 0.0, 0.0, 0.5, 6, 20, first_report=0.005)
+        entry = metrics.snapshot()['1002']
+        self.assertEqual(entry['name'], 'ISO15693_16_SLOT_INVENTORY')
+        self.assertEqual((entry['calls'], entry['ok'], entry['errors'], entry['retries']), (3, 2, 1, 1))
+        self.assertEqual((entry['bytes_out'], entry['bytes_in']), (18, 44))
+        self.assertEqual(entry['wait_histogram'], [(0.01, 1), (0.1, 2), (float('inf'), 3)])
+        self.assertEqual(entry['first_report_histogram'], [(0.01, 2), (0.1, 3), (float('inf'), 3)])
+        self.assertAlmostEqual(entry['first_report_seconds'], 0.06)
+        metrics.reset()
+        self.assertEqual(metrics.snapshot(), {})
+
+    def test_reader_records_commands(self):
+        device = SimulatedReader(iso15693_tags=[self.tag], latency=0.0005, auto_continue=False)
+        with RRHFOEM04(transport=device, pacing="adaptive") as reader:
+            reader.ISO15693_16SlotInventory()
+            self.assertTrue(reader.ISO15693_readMultipleBlocks(0, total_blocks=27, uid=self.tag.uid).success)
+            reader.ISO15693_readSingleBlock(0, uid="E004010099999999")
+            stats = reader.stats()
+
+        inventory = stats['1002']
+        self.assertEqual((inventory['calls'], inventory['ok']), (1, 1))
+        self.assertEqual(inventory['bytes_out'], 6)  # Length byte to CRC, no report ID or padding
+        self.assertGreater(inventory['wait_seconds'], 0)
+        # The 27-block answer spans two reports; the second one was requested
+        self.assertEqual(stats['1009']['retries'], device.additional_frame_requests)
+        self.assertGreater(device.additional_frame_requests, 0)
+        self.assertGreater(stats['1009']['bytes_in'], 64)
+        # Waiting for the requested second report is transfer time, not reader latency
+        self.assertLess(stats['1009']['first_report_seconds'], stats['1009']['wait_seconds'])
+        self.assertAlmostEqual(inventory['first_report_seconds'], inventory['wait_seconds'], places=3)
+        self.assertEqual(stats['1006']['errors'], 1)
+
+    def test_timeout(self):
+        device = SimulatedReader(iso15693_tags=[self.tag], latency=0.0005, command_latency={0x1006: 2.0})
+        with RRHFOEM04(transport=device, pacing="adaptive") as reader:
+            reader.ISO15693_readSingleBlock(0)
+            entry = reader.stats()['1006']
+        self.assertEqual((entry['timeouts'], entry['bytes_in']), (1, 0))
+
+    def test_disabled(self):
+        device = SimulatedReader(iso15693_tags=[self.tag], latency=0.0005)
+        with RRHFOEM04(transport=device, pacing="adaptive", metrics=False) as reader:
+            reader.ISO15693_16SlotInventory()
+            self.assertIsNone(reader.metrics)
+            self.assertEqual(reader.stats(), {})
+
+    def test_prometheus(self):
+        device = SimulatedReader(iso15693_tags=[self.tag], latency=0.0005)
+        with RRHFOEM04(transport=device, pacing="adaptive") as reader:
+            reader.ISO15693_16SlotInventory()
+            text = reader.metrics.prometheus(labels={'reader': 'door-1'})
+        lines = text.splitlines()
+        self.assertIn('# TYPE rrhfoem04_command_wait_seconds histogram', lines)
+        self.assertIn('rrhfoem04_commands_total{command="1002",name="ISO15693_16_SLOT_INVENTORY",reader="door-1"} 1',
+                      lines)
+        self.assertIn('rrhfoem04_command_outcomes_total{command="1002",name="ISO15693_16_SLOT_INVENTORY",'
+                      'reader="door-1",outcome="ok"} 1', lines)
+        self.assertIn('rrhfoem04_command_wait_seconds_bucket{command="1002",name="ISO15693_16_SLOT_INVENTORY",'
+                      'reader="door-1",le="+Inf"} 1', lines)
+        self.assertIn('# TYPE rrhfoem04_command_first_report_seconds histogram', lines)
+        self.assertIn('rrhfoem04_command_first_report_seconds_count{command="1002",name="ISO15693_16_SLOT_INVENTORY",'
+                      'reader="door-1"} 1', lines)
+
+    def test_manager_prometheus(self):
+        devices = [SimulatedReader(iso15693_tags=[self.tag], latency=0.0005, serial=serial)
+                   for serial in ("000001", "000002")]
+        with ReaderManager(devices, pacing="adaptive") as manager:
+            manager.connect()
+            manager.inventory()
+            text = manager.prometheus()
+        self.assertEqual(text.count('# TYPE rrhfoem04_commands_total counter'), 1)
+        self.assertIn('command="1002",name="ISO15693_16_SLOT_INVENTORY",reader="000001"', text)
+        self.assertIn('command="1002",name="ISO15693_16_SLOT_INVENTORY",reader="000002"', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
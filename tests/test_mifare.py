@@ -0,0 +1,232 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+from rrhfoem04 import RRHFOEM04, MifareKeyDictionary, SimulatedReader, SimulatedMifareCard
+from rrhfoem04.exceptions import AuthenticationError
+from rrhfoem04.constants import CMD_ISO14443A_MIFARE_AUTHENTICATE
+from rrhfoem04.mifare import is_trailer, sector_block_count, sector_count, sector_first_block, sector_of, trailer_of
+
+AUTHENTICATE = (CMD_ISO14443A_MIFARE_AUTHENTICATE[1] << 8) | CMD_ISO14443A_MIFARE_AUTHENTICATE[2]
+
+
+class TestMifareLayout(unittest.TestCase):
+    """Sector geometry of 1K and 4K cards"""
+
+    def test_small_sectors(self):
+        self.assertEqual(sector_of(0), 0)
+        self.assertEqual(sector_of(127), 31)
+        self.assertEqual(sector_first_block(31), 124)
+        self.assertEqual(sector_block_count(31), 4)
+        self.assertEqual(trailer_of(5), 7)
+        self.assertTrue(is_trailer(63))
+
+    def test_large_sectors(self):
+        self.assertEqual(sector_of(128), 32)
+        self.assertEqual(sector_of(255), 39)
+        self.assertEqual(sector_first_block(33), 144)
+        self.assertEqual(sector_block_count(33), 16)
+        self.assertEqual(trailer_of(130), 143)
+        self.assertFalse(is_trailer(131))
+
+    def test_sector_count(self):
+        self.assertEqual(sector_count("1K"), 16)
+        self.assertEqual(sector_count("4K"), 40)
+
+
+class TestMifareSessions(unittest.TestCase):
+    """Reuse of an authenticated sector across block reads and writes"""
+
+    def setUp(self):
+        self.card = SimulatedMifareCard("A1B2C3D4")
+        self.device = SimulatedReader(mifare_cards=[self.card], latency=0.0005)
+        self.reader = RRHFOEM04(transport=self.device)
+        self.uid = self.reader.ISO14443A_Inventory().data
+
+    def tearDown(self):
+        self.reader.close()
+
+    def auths(self) -> int:
+        return self.device.command_counts.get(AUTHENTICATE, 0)
+
+    def test_dump_authenticates_once_per_sector(self):
+        for block in range(64):
+            self.assertTrue(self.reader.ISO14443A_mifareRead(self.uid, block).success)
+        self.assertEqual(self.auths(), 16)
+
+    def test_write_reuses_session(self):
+        self.assertTrue(self.reader.ISO14443A_mifareWrite("one", self.uid, block_number=4).success)
+        self.assertTrue(self.reader.ISO14443A_mifareWrite("two", self.uid, block_number=5).success)
+        self.assertEqual(self.reader.ISO14443A_mifareRead(self.uid, 5).data, b"two".ljust(16, b"\x00").hex().upper())
+        self.assertEqual(self.auths(), 1)
+
+    def test_select_ends_session(self):
+        self.reader.ISO14443A_mifareRead(self.uid, 4)
+        self.assertTrue(self.reader.ISO14443A_selectCard(self.uid).success)
+        self.reader.ISO14443A_mifareRead(self.uid, 5)
+        self.assertEqual(self.auths(), 2)
+
+    def test_error_ends_session(self):
+        self.reader.ISO14443A_mifareRead(self.uid, 4)
+        self.assertFalse(self.reader.ISO14443A_mifareWrite("x", self.uid, block_number=0).success)  # Read-only block
+        self.assertIsNone(self.reader._mifare_auth_sector)
+        self.assertTrue(self.reader.ISO14443A_mifareRead(self.uid, 5).success)
+        self.assertEqual(self.auths(), 3)
+
+    def test_card_loss(self):
+        self.reader.ISO14443A_mifareRead(self.uid, 4)
+        self.device.mifare_cards.clear()
+        self.assertFalse(self.reader.ISO14443A_mifareRead(self.uid, 5).success)
+        self.assertIsNone(self.reader._mifare_auth_sector)
+
+    def test_stale_session_is_renewed(self):
+        self.reader.ISO14443A_mifareRead(self.uid, 4)
+        self.device._auth_sector = None  # Card dropped its session without the host noticing
+        self.assertTrue(self.reader.ISO14443A_mifareRead(self.uid, 5).success)
+        self.assertEqual(self.auths(), 2)
+
+
+class TestMifareKeyDictionary(unittest.TestCase):
+    """Authentication with a key list and a persistent key store"""
+
+    SITE_KEY = "A0B1C2D3E4F5"
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "keys.json")
+        self.card = SimulatedMifareCard("A1B2C3D4", key_a=bytes(6), key_b=bytes.fromhex(self.SITE_KEY))
+        self.device = SimulatedReader(mifare_cards=[self.card], latency=0.0005)
+        self.reader = RRHFOEM04(transport=self.device)
+        self.uid = self.reader.ISO14443A_Inventory().data
+
+    def tearDown(self):
+        self.reader.close()
+        self.tmp.cleanup()
+
+    def auths(self) -> int:
+        return self.device.command_counts.get(AUTHENTICATE, 0)
+
+    def test_finds_key_b(self):
+        keys = MifareKeyDictionary(["FFFFFFFFFFFF", self.SITE_KEY], key_types="B")
+        result = self.reader.ISO14443A_mifareAuthenticateWithKeys(self.uid, 4, keys)
+        self.assertEqual(result.data, {'key_type': 'B', 'key': self.SITE_KEY})
+        self.assertEqual(keys.known_key(self.uid, 1), ('B', self.SITE_KEY))
+        self.assertEqual(self.auths(), 2)
+
+    def test_no_key_matches(self):
+        keys = MifareKeyDictionary(["FFFFFFFFFFFF"])
+        with self.assertRaises(AuthenticationError):
+            self.reader.ISO14443A_mifareAuthenticateWithKeys(self.uid, 4, keys)
+
+    def test_learned_key_persists(self):
+        keys = MifareKeyDictionary(["FFFFFFFFFFFF", self.SITE_KEY], key_types="B", path=self.path)
+        self.reader.ISO14443A_mifareAuthenticateWithKeys(self.uid, 4, keys)
+
+        restored = MifareKeyDictionary(["FFFFFFFFFFFF", self.SITE_KEY], key_types="B", path=self.path)
+        before = self.auths()
+        self.reader.ISO14443A_mifareAuthenticateWithKeys(self.uid, 4, restored)
+        self.assertEqual(self.auths() - before, 1)
+
+    def test_past_successes_order_other_cards(self):
+        keys = MifareKeyDictionary(["FFFFFFFFFFFF", self.SITE_KEY], key_types="AB")
+        keys.record_success("11223344", 1, 'B', self.SITE_KEY)
+        self.assertEqual(keys.candidates("55667788", 1)[0], ('B', self.SITE_KEY))
+        self.assertEqual(keys.candidates("55667788", 2)[0], ('A', "FFFFFFFFFFFF"))
+
+    def test_card_type_fallback(self):
+        keys = MifareKeyDictionary(["FFFFFFFFFFFF", self.SITE_KEY], key_types="B")
+        keys.record_success("11223344", 1, 'B', self.SITE_KEY, card_type="site")
+        for uid in ("99887766", "88776655"):
+            keys.record_success(uid, 1, 'B', "FFFFFFFFFFFF", card_type="other")
+        # A new card of a known type starts with its type's key, despite the global hit counts
+        self.assertEqual(keys.candidates("55667788", 1, "site")[0], ('B', self.SITE_KEY))
+        self.assertEqual(keys.candidates("55667788", 1)[0], ('B', "FFFFFFFFFFFF"))
+
+    def test_dump_saves_store_once(self):
+        keys = MifareKeyDictionary(["FFFFFFFFFFFF", self.SITE_KEY], key_types="B", path=self.path)
+        self.reader.mifare_keys = keys
+        with mock.patch.object(keys, 'save', wraps=keys.save) as save:
+            self.assertTrue(self.reader.dump_card(self.uid).success)
+        self.assertEqual(save.call_count, 1)
+
+        # Another card of the same type opens every sector with the learned key on the first try
+        restored = MifareKeyDictionary(["FFFFFFFFFFFF", self.SITE_KEY], key_types="B", path=self.path)
+        self.assertEqual(restored.candidates("55667788", 15, "1K")[0], ('B', self.SITE_KEY))
+
+    def test_read_with_configured_keys(self):
+        self.reader.mifare_keys = MifareKeyDictionary([self.SITE_KEY, "000000000000"])
+        self.assertTrue(self.reader.ISO14443A_mifareRead(self.uid, 5).success)
+
+    def test_unreadable_store_is_ignored(self):
+        with open(self.path, "w") as f:
+            f.write("not json")
+        keys = MifareKeyDictionary(path=self.path)
+        self.assertIsNone(keys.known_key(self.uid, 0))
+
+
+class TestMifareDumpRestore(unittest.TestCase):
+    """Whole-card images with one authentication per sector"""
+
+    def setUp(self):
+        self.source = SimulatedMifareCard("A1B2C3D4")
+        self.target = SimulatedMifareCard("0A0B0C0D")
+        self.device = SimulatedReader(mifare_cards=[self.source], latency=0.0005)
+        self.reader = RRHFOEM04(transport=self.device, pacing="adaptive")
+
+    def swap_cards(self):
+        self.device.mifare_cards[:] = [self.target]
+
+    def tearDown(self):
+        self.reader.close()
+
+    def auths(self) -> int:
+        return self.device.command_counts.get(AUTHENTICATE, 0)
+
+    def test_dump(self):
+        self.source.set_block(5, b"0123456789ABCDEF")
+        result = self.reader.dump_card("A1B2C3D4")
+        self.assertTrue(result.success)
+        self.assertIsInstance(result.data, bytearray)
+        self.assertEqual(bytes(result.data), bytes(self.source.memory))  # Key A restored into the trailers
+        self.assertEqual(self.auths(), 16)
+
+    def test_dump_4k(self):
+        card = SimulatedMifareCard("01020304", card_type="4K")
+        self.device.mifare_cards[:] = [card]
+        result = self.reader.dump_card("01020304", card_type="4K")
+        self.assertEqual(len(result.data), 4096)
+        self.assertEqual(bytes(result.data), bytes(card.memory))
+        self.assertEqual(self.auths(), 40)
+
+    def test_restore_skips_unchanged_blocks(self):
+        self.source.set_block(5, b"0123456789ABCDEF")
+        self.source.set_block(6, b"FEDCBA9876543210")
+        image = self.reader.dump_card("A1B2C3D4").data
+
+        self.swap_cards()
+        result = self.reader.restore_card(image, "0A0B0C0D")
+        self.assertEqual(result.data, {'blocks_written': 2, 'sectors': 16})
+        self.assertEqual(self.target.get_block(5), b"0123456789ABCDEF")
+        self.assertEqual(self.target.get_block(0)[:4], bytes.fromhex("0A0B0C0D"))  # Manufacturer block kept
+
+        self.assertEqual(self.reader.restore_card(image, "0A0B0C0D").data['blocks_written'], 0)
+
+    def test_restore_trailers(self):
+        image = bytearray(self.reader.dump_card("A1B2C3D4").data)
+        image[7 * 16 + 10:7 * 16 + 16] = bytes.fromhex("A0B1C2D3E4F5")  # New key B for sector 1
+
+        self.swap_cards()
+        self.assertEqual(self.reader.restore_card(image, "0A0B0C0D").data['blocks_written'], 0)
+        result = self.reader.restore_card(image, "0A0B0C0D", write_trailers=True)
+        self.assertEqual(result.data['blocks_written'], 1)
+        self.assertEqual(self.target.key(4, 0x61), bytes.fromhex("A0B1C2D3E4F5"))
+
+    def test_restore_rejects_bad_image(self):
+        self.assertFalse(self.reader.restore_card(bytes(100), "0A0B0C0D").success)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import unittest
+from rrhfoem04 import RRHFOEM04, SimulatedReader, SimulatedISO15693Tag
+from rrhfoem04.pacing import AdaptivePacer, FixedPacer
+
+
+class TestAdaptivePacer(unittest.TestCase):
+
+    def test_tightens_after_clean_streak(self):
+        pacer = AdaptivePacer(initial=0.1, minimum=0.01, tighten_factor=0.5, clean_streak=2)
+        pacer.record(0x10, True)
+        self.assertEqual(pacer.interval(0x10), 0.1)
+        pacer.record(0x10, True)
+        self.assertEqual(pacer.interval(0x10), 0.05)
+        # 0x1F shares the ISO15693 group, 0xF0 is independent
+        self.assertEqual(pacer.interval(0x1F), 0.05)
+        self.assertEqual(pacer.interval(0xF0), 0.1)
+
+    def test_backs_off_on_failure(self):
+        pacer = AdaptivePacer(initial=0.02, minimum=0.01, maximum=0.1, backoff_factor=2.0)
+        pacer.record(0x21, False)
+        self.assertEqual(pacer.interval(0x2F), 0.04)
+        for _ in range(5):
+            pacer.record(0x21, False)
+        self.assertEqual(pacer.interval(0x21), 0.1)
+
+    def test_fixed_pacer_ignores_outcomes(self):
+        pacer = FixedPacer(0.1)
+        pacer.record(0x10, False)
+        self.assertEqual(pacer.interval(0x10), 0.1)
+
+    def test_adaptive_reader_learns_device_gap(self):
+        device = SimulatedReader(iso15693_tags=[SimulatedISO15693Tag("E004010012345678")],
+                                 latency=0.001, min_command_gap=0.01)
+        pacer = AdaptivePacer(minimum=0.001)
+        with RRHFOEM04(transport=device, pacing=pacer) as reader:
+            results = [reader.ISO15693_readSingleBlock(0).success for _ in range(40)]
+        # Pacing converged well below the fixed interval and most commands still succeeded
+        self.assertLess(pacer.interval(0x10), 0.1)
+        self.assertGreater(results.count(True), 30)
+        self.assertTrue(all(results[:5]))
+
+    def test_invalid_pacing(self):
+        with self.assertRaises(ValueError):
+            RRHFOEM04(auto_connect=False, pacing="fast")
+
+
+if __name__ == "__main__":
+    unittest.main()
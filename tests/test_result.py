@@ -0,0 +1,68 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import pickle
+import unittest
+from rrhfoem04 import RRHFOEM04, SimulatedReader, SimulatedISO15693Tag
+from rrhfoem04.utils import RRHFOEM04Result
+
+
+class TestRRHFOEM04Result(unittest.TestCase):
+
+    def test_lazy_and_immutable(self):
+        calls = []
+
+        def decode():
+            calls.append(1)
+            return ["E004010012345678"]
+
+        result = RRHFOEM04Result(True, "Operation Successful", decode=decode)
+        self.assertEqual(calls, [])
+        self.assertEqual(result.data, ["E004010012345678"])
+        self.assertEqual(result.data, ["E004010012345678"])
+        self.assertEqual(calls, [1])  # Decoded once
+        with self.assertRaises(AttributeError):
+            result.success = False
+        with self.assertRaises(AttributeError):
+            result.extra = 1
+        self.assertFalse(hasattr(result, '__dict__'))
+
+        copy = pickle.loads(pickle.dumps(RRHFOEM04Result(True, "ok", decode=lambda: b"\x01", status=0)))
+        self.assertEqual((copy.success, copy.data, copy.status), (True, b"\x01", 0))
+
+    def test_reader_results(self):
+        tag = SimulatedISO15693Tag("E004010012345678", data=bytes(range(112)))
+        device = SimulatedReader(iso15693_tags=[tag], latency=0.0005)
+        with RRHFOEM04(transport=device, pacing="adaptive") as reader:
+            inventory = reader.ISO15693_16SlotInventory()
+            self.assertEqual((inventory.status, inventory.raw[1:3]), (0, b"\x10\x02"))
+            self.assertGreater(inventory.elapsed, 0)
+            self.assertEqual(inventory.data, [tag.uid])
+
+            self.assertEqual(reader.ISO15693_readSingleBlock(1, uid=tag.uid).data, "07060504")
+            self.assertEqual(reader.ISO15693_readMultipleBlocks(0, total_blocks=1, uid=tag.uid).data,
+                             "0302010007060504")
+
+            missing = reader.ISO15693_readSingleBlock(0, uid="E004010099999999")
+            self.assertFalse(missing.success)
+            self.assertNotEqual(missing.status, 0)
+            self.assertIsNone(reader.read_memory(tag.uid, 0, 2).status)  # Several commands
+
+            # Single-command state and information operations carry their response too
+            for result, code in ((reader.ISO15693_getSystemInfo(uid=tag.uid, refresh=True), b"\x10\x0E"),
+                                 (reader.ISO15693_select(tag.uid), b"\x10\x03"),
+                                 (reader.ISO15693_stayQuiet(tag.uid), b"\x10\x04"),
+                                 (reader.ISO15693_resetToReady(uid=tag.uid), b"\x10\x05")):
+                self.assertTrue(result.success, result)
+                self.assertEqual((result.status, result.raw[1:3]), (0, code))
+                self.assertIsNotNone(result.elapsed)
+            quiet = reader.ISO15693_stayQuiet("E004010099999999")
+            self.assertFalse(quiet.success)
+            self.assertNotEqual(quiet.status, 0)
+
+        with RRHFOEM04(transport=device, pacing="adaptive", raw_results=True) as reader:
+            self.assertEqual(reader.ISO15693_16SlotInventory().data, [bytes.fromhex(tag.uid)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import unittest
+from rrhfoem04 import RRHFOEM04, SimulatedReader, SimulatedISO15693Tag, SimulatedMifareCard
+
+
+class TestSimulatedReader(unittest.TestCase):
+    """Exercise the public reader API against the in-process simulated device"""
+
+    def setUp(self):
+        self.tag = SimulatedISO15693Tag("E004010012345678", data=bytes(range(16)))
+        self.card = SimulatedMifareCard("A1B2C3D4")
+        self.device = SimulatedReader(iso15693_tags=[self.tag], mifare_cards=[self.card],
+                                      latency=0.001, serial="0A1B2C")
+        self.reader = RRHFOEM04(transport=self.device)
+
+    def tearDown(self):
+        self.reader.close()
+
+    def test_getReaderInfo(self):
+        result = self.reader.getReaderInfo()
+        self.assertTrue(result.success)
+        self.assertEqual(result.data, {'model': 'RRHFOEM04', 'serial': '0A1B2C'})
+
+    def test_buzzer(self):
+        self.assertTrue(self.reader.buzzer_on().success)
+        self.assertTrue(self.device.buzzer_active)
+        self.assertTrue(self.reader.buzzer_off().success)
+        self.assertFalse(self.device.buzzer_active)
+
+    def test_ISO15693_inventory(self):
+        self.assertEqual(self.reader.ISO15693_singleSlotInventory().data, ["E004010012345678"])
+        self.assertEqual(self.reader.ISO15693_16SlotInventory().data, ["E004010012345678"])
+
+    def test_ISO15693_read_write(self):
+        result = self.reader.ISO15693_readSingleBlock(1)
+        self.assertEqual(result.data, "07060504")
+
+        self.assertTrue(self.reader.ISO15693_writeSingleBlock(2, "ACC", uid=self.tag.uid).success)
+        self.assertEqual(bytes(self.tag.memory[8:12]), b"ACC\x00")
+
+        self.assertTrue(self.reader.ISO15693_writeMultipleBlocks(0, "ACC12345").success)
+        result = self.reader.ISO15693_readMultipleBlocks(0, total_blocks=1)
+        self.assertEqual(result.data, "3143434135343332")
+
+    def test_ISO15693_writeAFI(self):
+        self.assertTrue(self.reader.ISO15693_writeAFI(7).success)
+        self.assertEqual(self.tag.afi, 7)
+
+    def test_mifare_read_write(self):
+        self.assertEqual(self.reader.ISO14443A_Inventory().data, "A1B2C3D4")
+        self.assertTrue(self.reader.ISO14443A_mifareWrite("KJ000F00#", block_number=4).success)
+        result = self.reader.ISO14443A_mifareRead(block_number=4)
+        self.assertEqual(bytes.fromhex(result.data), b"KJ000F00#".ljust(16, b"\x00"))
+
+    def test_mifare_wrong_key(self):
+        uid = self.reader.ISO14443A_Inventory().data
+        with self.assertRaises(Exception):
+            self.reader.ISO14443A_mifareAuthenticate(uid, block_number=4, key="000000000000")
+
+    def test_raw_results(self):
+        with RRHFOEM04(transport=self.device, raw_results=True) as reader:
+            self.assertEqual(reader.ISO15693_16SlotInventory().data, [bytes.fromhex("E004010012345678")])
+            self.assertEqual(reader.ISO15693_readSingleBlock(1).data, bytes([7, 6, 5, 4]))
+            self.assertEqual(reader.ISO15693_readMultipleBlocks(0, total_blocks=1).data,
+                             bytes([3, 2, 1, 0, 7, 6, 5, 4]))
+            self.assertEqual(reader.ISO14443A_Inventory().data, bytes.fromhex("A1B2C3D4"))
+            self.assertEqual(len(reader.ISO14443A_mifareRead(block_number=4).data), 16)
+
+    def test_multi_report_read(self):
+        tag = SimulatedISO15693Tag("E004010012345679", block_count=64, data=bytes(range(256)))
+        for auto_continue in (True, False):
+            device = SimulatedReader(iso15693_tags=[tag], latency=0.001, auto_continue=auto_continue)
+            with RRHFOEM04(transport=device, raw_results=True) as reader:
+                # 40 blocks: 166-byte frame spread over three reports
+                result = reader.ISO15693_readMultipleBlocks(0, total_blocks=39)
+            self.assertTrue(result.success)
+            self.assertEqual(result.data, b"".join(bytes(range(i, i + 4))[::-1] for i in range(0, 160, 4)))
+            self.assertEqual(device.additional_frame_requests, 0 if auto_continue else 2)
+
+    def test_inventory_with_many_tags(self):
+        tags = [SimulatedISO15693Tag(f"E0040100000000{i:02X}") for i in range(12)]
+        device = SimulatedReader(iso15693_tags=tags, latency=0.001, slot_collisions=False)
+        with RRHFOEM04(transport=device) as reader:
+            self.assertEqual(reader.ISO15693_16SlotInventory().data, [tag.uid for tag in tags])
+
+    def test_truncated_multi_report_response(self):
+        class DroppingReader(SimulatedReader):
+            def _release_held_report(self):
+                self.additional_frame_requests += 1
+
+        device = DroppingReader(iso15693_tags=[self.tag], latency=0.001, auto_continue=False)
+        with RRHFOEM04(transport=device) as reader:
+            self.assertFalse(reader.ISO15693_readMultipleBlocks(0, total_blocks=20).success)
+
+    def test_read_memory(self):
+        tag = SimulatedISO15693Tag("E004010012345679", block_count=150, data=bytes(i & 0xFF for i in range(600)))
+        device = SimulatedReader(iso15693_tags=[tag], latency=0.001)
+        with RRHFOEM04(transport=device) as reader:
+            chunks = list(reader.iter_memory(tag.uid, 0, 150))
+            # 62 four-byte blocks fit in one frame
+            self.assertEqual([block for block, _ in chunks], [0, 62, 124])
+            self.assertEqual(b"".join(data for _, data in chunks), bytes(tag.memory))
+
+            buffer = bytearray(40)
+            result = reader.read_memory(tag.uid, 10, 20, out=buffer, chunk_blocks=4)
+            self.assertTrue(result.success)
+            self.assertIs(result.data, buffer)
+            self.assertEqual(buffer, tag.memory[40:80])
+
+            self.assertFalse(reader.read_memory(tag.uid, 0, 10, out=bytearray(8)).success)
+            self.assertFalse(reader.read_memory(tag.uid, 140, 160).success)
+
+    def test_write_memory_diff(self):
+        tag = SimulatedISO15693Tag("E004010012345679", block_count=64, data=bytes(256))
+        device = SimulatedReader(iso15693_tags=[tag], latency=0.001)
+        new = bytearray(256)
+        new[8:12] = b"ABCD"                # block 2
+        new[40:100] = bytes(range(1, 61))  # blocks 10-24, longer than one write frame
+        new[252:255] = b"END"              # block 63, zero-padded
+        with RRHFOEM04(transport=device) as reader:
+            result = reader.write_memory_diff(tag.uid, 0, new[:255])
+            self.assertTrue(result.success)
+            self.assertEqual(result.data, {'blocks_written': 17, 'frames': 4})
+            self.assertEqual(tag.memory, new)
+            self.assertEqual(tag.blocks_written, 17)
+
+            # Nothing changed: no writes, no verification read
+            frames = device.frames_received
+            self.assertEqual(reader.write_memory_diff(tag.uid, 0, new).data, {'blocks_written': 0, 'frames': 0})
+            self.assertEqual(device.frames_received, frames + 2)
+
+    def test_blocking_wait_picks_up_response_early(self):
+        device = SimulatedReader(latency=0.005)
+        with RRHFOEM04(transport=device) as reader:
+            reader.getReaderInfo()
+            # A 20 ms poll sleep would have been paid at least once in "poll" mode
+            self.assertLess(reader._timing['device_wait'], 0.015)
+
+    def test_bad_crc_is_rejected(self):
+        self.device.write(bytes([0x00, 0x03, 0xF0, 0x00, 0x12, 0x34]).ljust(65, b"\x00"))
+        self.assertEqual(self.device.crc_errors, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import subprocess
+import time
+import unittest
+from rrhfoem04 import RRHFOEM04, ConnectionError, SimulatedReader, SimulatedISO15693Tag
+from rrhfoem04.constants import CONNECT_PROBE_TIMEOUT, CONNECT_READY_TIMEOUT
+from rrhfoem04.pacing import FixedPacer
+from rrhfoem04.utils import calc_crc
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_import_is_lazy(self):
+        script = ("import sys; sys.path.insert(0, 'src/'); import rrhfoem04; "
+                  "print(sorted({'hid', 'asyncio', 'rrhfoem04.simulator'} & set(sys.modules)))")
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "[]")
+
+    def test_connect_probes_reader(self):
+        device = SimulatedReader(iso15693_tags=[SimulatedISO15693Tag("E004010012345678")], latency=0.0005,
+                                 serial="00002A")
+        start = time.perf_counter()
+        with RRHFOEM04(transport=device, pacing="adaptive") as reader:
+            self.assertLess(time.perf_counter() - start, 0.05)  # No fixed stabilization delay
+            self.assertEqual(reader.reader_info, {'model': 'RRHFOEM04', 'serial': '00002A'})
+            self.assertTrue(reader.ISO15693_16SlotInventory().success)
+
+    def test_slow_reader(self):
+        # A reader that is ready but slow to answer is accepted by the first probe
+        tag = SimulatedISO15693Tag("E004010012345678")
+        for pacing in ("fixed", "adaptive"):
+            device = SimulatedReader(iso15693_tags=[tag], latency=0.0005, command_latency={0xF000: 0.15})
+            start = time.perf_counter()
+            with RRHFOEM04(transport=device, pacing=pacing) as reader:
+                self.assertEqual(reader.reader_info, {'model': 'RRHFOEM04', 'serial': '000001'})
+                self.assertLess(time.perf_counter() - start, CONNECT_READY_TIMEOUT)
+                # Late answers to the earlier probes must not be taken for the inventory's response
+                result = reader.ISO15693_16SlotInventory()
+                self.assertTrue(result.success, result)
+                self.assertEqual(result.data, [tag.uid])
+
+    def test_stale_report_dropped(self):
+        tag = SimulatedISO15693Tag("E004010012345678")
+        device = SimulatedReader(iso15693_tags=[tag], latency=0.005)
+        # No pacing gap, so the stale reply is not drained before the command is written
+        with RRHFOEM04(transport=device, pacing=FixedPacer(0.0)) as reader:
+            # A late Get Reader Information reply, arriving after the next command was written
+            body = bytes([0x05, 0xF0, 0x00, 0x00, 0x00])
+            crc = calc_crc(body)
+            stale = (body + bytes([crc >> 8, crc & 0xFF])).ljust(64, b"\x00")
+            device._pending.append((time.monotonic() + 0.002, stale))
+            result = reader.ISO15693_16SlotInventory()
+            self.assertTrue(result.success, result)
+            self.assertEqual(result.data, [tag.uid])
+
+    def test_malformed_reader_info(self):
+        device = SimulatedReader(latency=0.0005, model="NODELIMITERMODEL")
+        with self.assertRaises(ConnectionError):
+            RRHFOEM04(transport=device, pacing="adaptive")
+        self.assertFalse(device.is_open)
+
+    def test_unresponsive_reader(self):
+        device = SimulatedReader(latency=0.0005, command_latency={0xF000: 5.0})
+        start = time.perf_counter()
+        with RRHFOEM04(transport=device, pacing="adaptive") as reader:
+            elapsed = time.perf_counter() - start
+            self.assertIsNone(reader.reader_info)
+        self.assertGreaterEqual(elapsed, CONNECT_READY_TIMEOUT)
+        # A probe started just before the limit still gets its full response wait
+        self.assertLess(elapsed, CONNECT_READY_TIMEOUT + CONNECT_PROBE_TIMEOUT + 0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
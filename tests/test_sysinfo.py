@@ -0,0 +1,100 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import unittest
+from rrhfoem04 import RRHFOEM04, SimulatedReader, SimulatedISO15693Tag, TagInfo, TagInfoRegistry
+from rrhfoem04.constants import CMD_ISO15693_GET_SYSTEM_INFO
+from rrhfoem04.sysinfo import parse_system_info
+
+GET_SYSTEM_INFO = (CMD_ISO15693_GET_SYSTEM_INFO[1] << 8) | CMD_ISO15693_GET_SYSTEM_INFO[2]
+
+
+class TestSystemInfoParsing(unittest.TestCase):
+
+    def test_all_fields(self):
+        uid = bytes.fromhex("E004010012345678")
+        info = parse_system_info(b"\x00\x0F" + uid[::-1] + bytes([0x11, 0x22, 63, 7, 0x01]))
+        self.assertEqual(info.uid, "E004010012345678")
+        self.assertEqual((info.dsfid, info.afi, info.block_count, info.block_size, info.ic_reference),
+                         (0x11, 0x22, 64, 8, 0x01))
+        self.assertEqual(info.manufacturer, 0x04)
+        self.assertEqual(info.memory_size, 512)
+
+    def test_optional_fields(self):
+        info = parse_system_info(b"\x00\x02" + bytes(8) + b"\x07")
+        self.assertEqual(info.afi, 7)
+        self.assertIsNone(info.dsfid)
+        self.assertIsNone(info.memory_size)
+
+    def test_truncated(self):
+        with self.assertRaises(ValueError):
+            parse_system_info(b"\x00\x0F" + bytes(8) + b"\x00")
+
+
+class TestTagInfoRegistry(unittest.TestCase):
+
+    def test_ic_geometry_is_shared(self):
+        registry = TagInfoRegistry()
+        registry.put(TagInfo("E004010000000001", block_size=4, block_count=28, ic_reference=1))
+        info = registry.put(TagInfo("E004010000000002", ic_reference=1))
+        self.assertEqual((info.block_size, info.block_count), (4, 28))
+        self.assertEqual(registry.ic_geometry(0x04, 1), (4, 28))
+        self.assertIsNone(registry.put(TagInfo("E007010000000003", ic_reference=1)).block_size)
+
+    def test_lru_eviction(self):
+        registry = TagInfoRegistry(max_entries=2)
+        registry.put(TagInfo("E004010000000001"))
+        registry.put(TagInfo("E004010000000002"))
+        registry.get("e004010000000001")
+        registry.put(TagInfo("E004010000000003"))
+        self.assertIsNone(registry.get("E004010000000002"))
+        self.assertEqual(len(registry), 2)
+
+
+class TestGetSystemInfo(unittest.TestCase):
+
+    def setUp(self):
+        self.tag = SimulatedISO15693Tag("E004010012345678", block_count=64, block_size=8, afi=3, dsfid=5)
+        self.device = SimulatedReader(iso15693_tags=[self.tag], latency=0.0005)
+        self.reader = RRHFOEM04(transport=self.device, pacing="adaptive")
+
+    def tearDown(self):
+        self.reader.close()
+
+    def queries(self) -> int:
+        return self.device.command_counts.get(GET_SYSTEM_INFO, 0)
+
+    def test_get_system_info(self):
+        result = self.reader.ISO15693_getSystemInfo()
+        self.assertTrue(result.success)
+        self.assertEqual((result.data.uid, result.data.afi, result.data.dsfid), (self.tag.uid, 3, 5))
+        self.assertEqual((result.data.block_size, result.data.block_count), (8, 64))
+
+        self.assertIs(self.reader.ISO15693_getSystemInfo(uid=self.tag.uid).data, result.data)
+        self.assertEqual(self.queries(), 1)
+        self.reader.ISO15693_getSystemInfo(uid=self.tag.uid, refresh=True)
+        self.assertEqual(self.queries(), 2)
+
+    def test_unknown_tag(self):
+        self.assertFalse(self.reader.ISO15693_getSystemInfo(uid="E004010000000000").success)
+
+    def test_write_afi_updates_registry(self):
+        self.reader.ISO15693_getSystemInfo(uid=self.tag.uid)
+        self.assertTrue(self.reader.ISO15693_writeAFI(9, uid=self.tag.uid).success)
+        self.assertEqual(self.reader.ISO15693_getSystemInfo(uid=self.tag.uid).data.afi, 9)
+
+    def test_memory_operations_use_geometry(self):
+        self.tag.memory[:] = bytes(range(256)) * 2
+        result = self.reader.read_memory(self.tag.uid)
+        self.assertEqual(bytes(result.data), bytes(self.tag.memory))
+
+        self.assertTrue(self.reader.write_memory_diff(self.tag.uid, 2, b"12345678").success)
+        self.assertEqual(self.tag.read_blocks(2, 1), b"12345678")
+        self.assertEqual(self.queries(), 1)
+
+    def test_end_required_without_uid(self):
+        self.assertFalse(self.reader.read_memory(None).success)
+
+
+if __name__ == "__main__":
+    unittest.main()
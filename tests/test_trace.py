@@ -0,0 +1,56 @@
+import sys
+sys.path.insert(0, 'src/')
+
+import io
+import os
+import subprocess
+import unittest
+from rrhfoem04 import RRHFOEM04, FrameTrace, SimulatedReader, SimulatedISO15693Tag
+from rrhfoem04.trace import RX, TX
+
+
+class TestFrameTrace(unittest.TestCase):
+
+    def test_ring_buffer(self):
+        trace = FrameTrace(capacity=2)
+        frame = bytearray(b"\x03\xF0\x00\x00\x00")
+        trace.record(TX, frame)
+        frame[0] = 0xFF  # Recorded frames are copies
+        trace.record(RX, b"\x05")
+        trace.record(TX, b"\x06")
+        entries = trace.entries()
+        self.assertEqual([(direction, frame) for _, direction, frame in entries], [(RX, b"\x05"), (TX, b"\x06")])
+        self.assertLessEqual(entries[0][0], entries[1][0])
+        trace.clear()
+        self.assertEqual(len(trace), 0)
+
+    def test_reader_records_frames(self):
+        trace = FrameTrace()
+        device = SimulatedReader(iso15693_tags=[SimulatedISO15693Tag("E004010012345678")], latency=0.0005)
+        with RRHFOEM04(transport=device, pacing="adaptive", frame_trace=trace) as reader:
+            trace.clear()  # Drop the readiness probe sent on connect
+            reader.ISO15693_16SlotInventory()
+        (_, tx_dir, tx), (_, rx_dir, rx) = trace.entries()
+        self.assertEqual((tx_dir, rx_dir), (TX, RX))
+        self.assertEqual(tx[:4], bytes([0x04, 0x10, 0x02, 0x06]))
+        self.assertEqual(len(tx), 6)  # Length byte to CRC, no report ID or padding
+        self.assertEqual(rx[0] + 2, len(rx))
+
+        out = io.StringIO()
+        text = trace.dump(out)
+        self.assertEqual(out.getvalue(), text)
+        self.assertEqual(text.splitlines()[0].split()[1:], ["TX", tx.hex().upper()])
+
+
+class TestLogging(unittest.TestCase):
+
+    def test_import_leaves_root_logger_alone(self):
+        code = ("import logging, rrhfoem04; root = logging.getLogger(); "
+                "print(len(root.handlers), logging.getLevelName(root.level))")
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                env={**os.environ, "PYTHONPATH": "src/"}, check=True).stdout
+        self.assertEqual(output.split(), ["0", "WARNING"])
+
+
+if __name__ == "__main__":
+    unittest.main()